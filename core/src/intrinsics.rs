@@ -124,12 +124,18 @@ impl IntrinsicRegistry {
             "intrinsic_crypto_ed25519_verify"
             | "sys.crypto.ed25519_verify"
             | "sys.crypto.ed25519.verify" => Some(intrinsic_crypto_ed25519_verify),
+            "intrinsic_crypto_ed25519_verify_batch" | "sys.crypto.ed25519.verify_batch" => {
+                Some(intrinsic_crypto_ed25519_verify_batch)
+            }
             "intrinsic_merkle_root" | "sys.crypto.merkle_root" => Some(intrinsic_merkle_root),
             "sys.crypto.pbkdf2_hmac_sha512" => Some(intrinsic_crypto_pbkdf2),
             "intrinsic_buffer_alloc" | "sys.mem.alloc" => Some(intrinsic_buffer_alloc),
             "intrinsic_buffer_inspect" | "sys.mem.inspect" => Some(intrinsic_buffer_inspect),
             "intrinsic_buffer_read" | "sys.mem.read" => Some(intrinsic_buffer_read),
             "intrinsic_buffer_write" | "sys.mem.write" => Some(intrinsic_buffer_write),
+            "intrinsic_buffer_write_bulk" | "sys.mem.write_bulk" => {
+                Some(intrinsic_buffer_write_bulk)
+            }
             "intrinsic_list_get" | "sys.list.get" | "sys.str.get" => Some(intrinsic_list_get),
             "intrinsic_list_append" | "sys.list.append" => Some(intrinsic_list_append),
             "intrinsic_list_pop" | "sys.list.pop" => Some(intrinsic_list_pop),
@@ -170,7 +176,9 @@ impl IntrinsicRegistry {
             "sys.time.sleep" | "intrinsic_time_sleep" => Some(intrinsic_time_sleep),
             "sys.io.read_bytes" | "intrinsic_io_read_bytes" => Some(intrinsic_io_read_bytes),
             "sys.io.read_line" | "intrinsic_io_read_line" => Some(intrinsic_io_read_line),
+            "sys.io.read_headers" | "intrinsic_io_read_headers" => Some(intrinsic_io_read_headers),
             "sys.io.write" | "intrinsic_io_write" => Some(intrinsic_io_write),
+            "sys.io.flush" | "intrinsic_io_flush" => Some(intrinsic_io_flush),
             "sys.io.read_file_async" | "intrinsic_io_read_file_async" => {
                 Some(intrinsic_io_read_file_async)
             }
@@ -189,6 +197,9 @@ impl IntrinsicRegistry {
             "net.socket.accept" | "intrinsic_socket_accept" | "sys.net.socket.accept" => {
                 Some(intrinsic_socket_accept)
             }
+            "net.socket.accept_batch"
+            | "intrinsic_socket_accept_batch"
+            | "sys.net.socket.accept_batch" => Some(intrinsic_socket_accept_batch),
             "net.socket.connect" | "intrinsic_socket_connect" | "sys.net.socket.connect" => {
                 Some(intrinsic_socket_connect)
             }
@@ -645,10 +656,18 @@ impl IntrinsicRegistry {
             "sys.io.read_line".to_string(),
             Value::NativeFunction(intrinsic_io_read_line),
         );
+        scope.set(
+            "sys.io.read_headers".to_string(),
+            Value::NativeFunction(intrinsic_io_read_headers),
+        );
         scope.set(
             "sys.io.write".to_string(),
             Value::NativeFunction(intrinsic_io_write),
         );
+        scope.set(
+            "sys.io.flush".to_string(),
+            Value::NativeFunction(intrinsic_io_flush),
+        );
         scope.set(
             "sys.io.read_file_async".to_string(),
             Value::NativeFunction(intrinsic_io_read_file_async),
@@ -1676,6 +1695,11 @@ pub fn intrinsic_crypto_pbkdf2(args: Vec<Value>) -> Result<Value, RuntimeError>
             "Iterations must be > 0".into(),
         ));
     }
+    if output_len == 0 || output_len > 1024 {
+        return Err(RuntimeError::InvalidOperation(
+            "Output length must be between 1 and 1024".into(),
+        ));
+    }
 
     let mut result = vec![0u8; output_len];
     pbkdf2::<Hmac<Sha512>>(password, &salt, iterations, &mut result)
@@ -1885,6 +1909,37 @@ pub fn intrinsic_crypto_ed25519_verify(args: Vec<Value>) -> Result<Value, Runtim
     }
 }
 
+/// Verifies parallel lists of messages, signatures and public keys.
+/// Returns true only if every signature is valid.
+pub fn intrinsic_crypto_ed25519_verify_batch(args: Vec<Value>) -> Result<Value, RuntimeError> {
+    if args.len() != 3 {
+        return Err(RuntimeError::NotExecutable);
+    }
+
+    let mut lists = Vec::with_capacity(3);
+    for arg in &args {
+        match arg {
+            Value::List(items) => lists.push(items),
+            _ => {
+                return Err(RuntimeError::TypeMismatch("List".to_string(), arg.clone()));
+            }
+        }
+    }
+    let (msgs, sigs, pubs) = (lists[0], lists[1], lists[2]);
+    if msgs.len() != sigs.len() || msgs.len() != pubs.len() {
+        return Err(RuntimeError::NotExecutable);
+    }
+
+    for ((msg, sig), pub_key) in msgs.iter().zip(sigs.iter()).zip(pubs.iter()) {
+        let valid =
+            intrinsic_crypto_ed25519_verify(vec![msg.clone(), sig.clone(), pub_key.clone()])?;
+        if valid != Value::Boolean(true) {
+            return Ok(Value::Boolean(false));
+        }
+    }
+    Ok(Value::Boolean(true))
+}
+
 pub fn intrinsic_merkle_root(args: Vec<Value>) -> Result<Value, RuntimeError> {
     if args.len() != 1 {
         return Err(RuntimeError::NotExecutable);
@@ -2030,6 +2085,46 @@ pub fn intrinsic_buffer_write(args: Vec<Value>) -> Result<Value, RuntimeError> {
     }
 }
 
+pub fn intrinsic_buffer_write_bulk(args: Vec<Value>) -> Result<Value, RuntimeError> {
+    // Linear Semantics: buf := sys.mem.write_bulk(buf, offset, src)
+    // Copies all of src into buf at offset and returns the modified buffer.
+    if args.len() != 3 {
+        return Err(RuntimeError::NotExecutable);
+    }
+
+    let mut args = args;
+    let src_val = args
+        .pop()
+        .ok_or_else(|| RuntimeError::TypeMismatch("missing argument".into(), Value::Unit))?;
+    let offset_val = args
+        .pop()
+        .ok_or_else(|| RuntimeError::TypeMismatch("missing argument".into(), Value::Unit))?;
+    let buf_val = args
+        .pop()
+        .ok_or_else(|| RuntimeError::TypeMismatch("missing argument".into(), Value::Unit))?;
+
+    let offset = match offset_val {
+        Value::Integer(n) if n >= 0 => n as usize,
+        _ => return Err(RuntimeError::TypeMismatch("Integer".to_string(), offset_val)),
+    };
+    let src = match src_val {
+        Value::Buffer(s) => s,
+        _ => return Err(RuntimeError::TypeMismatch("Buffer".to_string(), src_val)),
+    };
+
+    match buf_val {
+        Value::Buffer(mut b) => {
+            let end = match offset.checked_add(src.len()) {
+                Some(end) if end <= b.len() => end,
+                _ => return Err(RuntimeError::NotExecutable),
+            };
+            b[offset..end].copy_from_slice(&src);
+            Ok(Value::Buffer(b))
+        }
+        _ => Err(RuntimeError::TypeMismatch("Buffer".to_string(), buf_val)),
+    }
+}
+
 pub fn intrinsic_list_get(args: Vec<Value>) -> Result<Value, RuntimeError> {
     if args.len() != 2 {
         return Err(RuntimeError::NotExecutable);
@@ -2772,6 +2867,9 @@ pub fn intrinsic_io_read_line(args: Vec<Value>) -> Result<Value, RuntimeError> {
     }
     #[cfg(not(target_arch = "wasm32"))]
     {
+        io::stdout()
+            .flush()
+            .map_err(|_| RuntimeError::NotExecutable)?;
         let mut input = String::new();
         io::stdin()
             .read_line(&mut input)
@@ -2787,6 +2885,46 @@ pub fn intrinsic_io_read_line(args: Vec<Value>) -> Result<Value, RuntimeError> {
     }
 }
 
+/// Reads a block of `Name: value` lines from stdin up to the blank line that
+/// ends it. Returns a Struct keyed by lower-cased name, or false at EOF.
+pub fn intrinsic_io_read_headers(args: Vec<Value>) -> Result<Value, RuntimeError> {
+    if !args.is_empty() {
+        return Err(RuntimeError::NotExecutable);
+    }
+    #[cfg(target_arch = "wasm32")]
+    {
+        Ok(Value::Boolean(false))
+    }
+    #[cfg(not(target_arch = "wasm32"))]
+    {
+        io::stdout()
+            .flush()
+            .map_err(|_| RuntimeError::NotExecutable)?;
+        let stdin = io::stdin();
+        let mut fields = HashMap::new();
+        let mut line = String::new();
+        loop {
+            line.clear();
+            let n = stdin
+                .read_line(&mut line)
+                .map_err(|_| RuntimeError::NotExecutable)?;
+            if n == 0 {
+                return Ok(Value::Boolean(false));
+            }
+            match line.split_once(':') {
+                Some((name, value)) => {
+                    fields.insert(
+                        name.trim().to_ascii_lowercase(),
+                        Value::String(value.trim().to_string()),
+                    );
+                }
+                None if line.trim().is_empty() => return Ok(Value::Struct(fields)),
+                None => {}
+            }
+        }
+    }
+}
+
 pub fn intrinsic_io_write(args: Vec<Value>) -> Result<Value, RuntimeError> {
     if args.len() != 1 {
         return Err(RuntimeError::NotExecutable);
@@ -2801,7 +2939,15 @@ pub fn intrinsic_io_write(args: Vec<Value>) -> Result<Value, RuntimeError> {
         }
     };
 
+    // Left to stdout's line buffer; sys.io.flush and the stdin reads flush it.
     print!("{}", s);
+    Ok(Value::Unit)
+}
+
+pub fn intrinsic_io_flush(args: Vec<Value>) -> Result<Value, RuntimeError> {
+    if !args.is_empty() {
+        return Err(RuntimeError::NotExecutable);
+    }
     #[cfg(not(target_arch = "wasm32"))]
     {
         io::stdout()
@@ -3324,6 +3470,105 @@ pub fn intrinsic_socket_accept(args: Vec<Value>) -> Result<Value, RuntimeError>
     }
 }
 
+/// Reports whether a connection is queued on `listener`, without blocking.
+#[cfg(unix)]
+fn listener_has_pending(listener: &TcpListener) -> bool {
+    use std::os::unix::io::AsRawFd;
+    let mut pfd = libc::pollfd {
+        fd: listener.as_raw_fd(),
+        events: libc::POLLIN,
+        revents: 0,
+    };
+    unsafe { libc::poll(&mut pfd, 1, 0) == 1 && pfd.revents & libc::POLLIN != 0 }
+}
+
+/// Without a portable readiness check, batches hold just the first connection.
+#[cfg(all(not(unix), not(target_arch = "wasm32")))]
+fn listener_has_pending(_listener: &TcpListener) -> bool {
+    false
+}
+
+pub fn intrinsic_socket_accept_batch(args: Vec<Value>) -> Result<Value, RuntimeError> {
+    #[cfg(target_arch = "wasm32")]
+    return Err(RuntimeError::NotExecutable);
+
+    #[cfg(not(target_arch = "wasm32"))]
+    {
+        if args.is_empty() || args.len() > 2 {
+            return Err(RuntimeError::NotExecutable);
+        }
+        let id = match &args[0] {
+            Value::Integer(i) => *i,
+            _ => {
+                return Err(RuntimeError::TypeMismatch(
+                    "Integer".to_string(),
+                    args[0].clone(),
+                ));
+            }
+        };
+        let limit = match args.get(1) {
+            Some(Value::Integer(n)) => (*n).max(0) as usize,
+            Some(other) => {
+                return Err(RuntimeError::TypeMismatch(
+                    "Integer".to_string(),
+                    other.clone(),
+                ));
+            }
+            None => 64,
+        };
+
+        let listener_clone = {
+            let sockets = get_sockets().lock().map_err(|e| {
+                RuntimeError::InvalidOperation(format!("socket mutex poisoned: {}", e))
+            })?;
+            match sockets.get(&id) {
+                Some(SocketResource::Listener(l)) => {
+                    l.try_clone().map_err(|_| RuntimeError::NotExecutable)?
+                }
+                _ => return Err(RuntimeError::InvalidOperation("Not a listener".to_string())),
+            }
+        };
+
+        if limit == 0 {
+            return Ok(Value::List(vec![]));
+        }
+
+        // Block for the first connection, then take whatever is already queued.
+        // Readiness is polled rather than switching the listener to
+        // non-blocking, which would leak into other users of the handle. The
+        // listener must still have a single acceptor: one that takes a queued
+        // connection first leaves the accept below waiting for the next.
+        let mut accepted = vec![
+            listener_clone
+                .accept()
+                .map_err(|_| RuntimeError::NotExecutable)?,
+        ];
+        while accepted.len() < limit && listener_has_pending(&listener_clone) {
+            match listener_clone.accept() {
+                Ok(conn) => accepted.push(conn),
+                Err(_) => break,
+            }
+        }
+
+        let mut sockets = get_sockets()
+            .lock()
+            .map_err(|e| RuntimeError::InvalidOperation(format!("socket mutex poisoned: {}", e)))?;
+        let mut result = Vec::with_capacity(accepted.len());
+        for (stream, addr) in accepted {
+            stream
+                .set_nonblocking(false)
+                .map_err(|_| RuntimeError::NotExecutable)?;
+            let new_id = SOCKET_ID_COUNTER.fetch_add(1, Ordering::SeqCst);
+            sockets.insert(new_id, SocketResource::Stream(stream));
+            result.push(Value::List(vec![
+                Value::Integer(new_id),
+                Value::String(addr.ip().to_string()),
+            ]));
+        }
+        Ok(Value::List(result))
+    }
+}
+
 pub fn intrinsic_socket_connect(args: Vec<Value>) -> Result<Value, RuntimeError> {
     #[cfg(target_arch = "wasm32")]
     return Err(RuntimeError::NotExecutable);
@@ -3383,16 +3628,25 @@ pub fn intrinsic_socket_send(args: Vec<Value>) -> Result<Value, RuntimeError> {
                 ));
             }
         };
-        let data = match &args[1] {
-            Value::String(s) => s.as_bytes().to_vec(),
-            Value::Buffer(b) => b.clone(),
-            _ => {
-                return Err(RuntimeError::TypeMismatch(
-                    "String or Buffer".to_string(),
-                    args[1].clone(),
-                ));
-            }
+        // A List of Strings/Buffers is gathered into one payload so it goes
+        // out in a single write.
+        let mut data = Vec::new();
+        let parts = match &args[1] {
+            Value::List(items) => items.as_slice(),
+            other => std::slice::from_ref(other),
         };
+        for part in parts {
+            match part {
+                Value::String(s) => data.extend_from_slice(s.as_bytes()),
+                Value::Buffer(b) => data.extend_from_slice(b),
+                _ => {
+                    return Err(RuntimeError::TypeMismatch(
+                        "String, Buffer or List".to_string(),
+                        part.clone(),
+                    ));
+                }
+            }
+        }
 
         let mut sockets = get_sockets()
             .lock()
@@ -3446,8 +3700,11 @@ pub fn intrinsic_socket_recv(args: Vec<Value>) -> Result<Value, RuntimeError> {
                 let n = s.read(&mut buf).map_err(|_| RuntimeError::NotExecutable)?;
                 // Truncate to actual size
                 buf.truncate(n);
-                // Convert to string (lossy) or return buffer?
-                // Prompt says "Return String".
+                // recv(sock, size, true) hands back the raw bytes; otherwise
+                // the data is returned as a (lossy) UTF-8 string.
+                if matches!(args.get(2), Some(Value::Boolean(true))) {
+                    return Ok(Value::Buffer(buf));
+                }
                 Ok(Value::String(String::from_utf8_lossy(&buf).to_string()))
             }
             _ => Err(RuntimeError::InvalidOperation(
@@ -4888,6 +5145,17 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_buffer_write_bulk() {
+        let buf = Value::Buffer(vec![0u8; 5]);
+        let args = vec![buf, Value::Integer(1), Value::Buffer(vec![7, 8, 9])];
+        let res = intrinsic_buffer_write_bulk(args).expect("operation failed");
+        assert_eq!(res, Value::Buffer(vec![0, 7, 8, 9, 0]));
+
+        let args = vec![res, Value::Integer(3), Value::Buffer(vec![1, 2, 3])];
+        assert!(intrinsic_buffer_write_bulk(args).is_err());
+    }
+
     #[test]
     fn test_security_fs_write_traversal() {
         // [MODE: KINETIC_EXECUTION]
@@ -50,7 +50,7 @@ if _missing_deps:
 
 try:
     from meta.ark_types import (
-        RopeString, ArkValue, UNIT_VALUE, ReturnException,
+        RopeString, ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ReturnException,
         ArkFunction, ArkClass, ArkInstance, Scope
     )
     from meta.ark_security import (
@@ -66,7 +66,8 @@ try:
     )
     from meta.ark_interpreter import (
         eval_node, call_user_func, instantiate_class, eval_block,
-        is_truthy, eval_binop, ARK_PARSER, NODE_HANDLERS
+        is_truthy, eval_binop, ARK_PARSER, NODE_HANDLERS, get_parser, compile_node,
+        compile_body
     )
 except ModuleNotFoundError as _e:
     # Only fall back to relative imports if the error is about the 'meta' prefix.
@@ -74,7 +75,7 @@ except ModuleNotFoundError as _e:
     if "meta" not in str(_e):
         raise
     from ark_types import (
-        RopeString, ArkValue, UNIT_VALUE, ReturnException,
+        RopeString, ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ReturnException,
         ArkFunction, ArkClass, ArkInstance, Scope
     )
     from ark_security import (
@@ -90,7 +91,8 @@ except ModuleNotFoundError as _e:
     )
     from ark_interpreter import (
         eval_node, call_user_func, instantiate_class, eval_block,
-        is_truthy, eval_binop, ARK_PARSER, NODE_HANDLERS
+        is_truthy, eval_binop, ARK_PARSER, NODE_HANDLERS, get_parser, compile_node,
+        compile_body
     )
 
 
@@ -106,8 +108,14 @@ ARK_AI_MODE = None
 
 
 def detect_ai_mode() -> str:
-    """Detect which AI backend is available: OLLAMA > GEMINI > MOCK."""
+    """Detect which AI backend is available: OLLAMA > GEMINI > MOCK.
+
+    The result, including a fallback to MOCK, is cached in ARK_AI_MODE so the
+    Ollama probe runs at most once.
+    """
     global ARK_AI_MODE
+    if ARK_AI_MODE:
+        return ARK_AI_MODE
     import urllib.request
     import urllib.error
 
@@ -172,12 +180,7 @@ def ask_mock(args):
 
 def ask_ai(args):
     """Dispatch to the appropriate AI backend based on detected mode."""
-    global ARK_AI_MODE
-    mode = ARK_AI_MODE
-    if mode is None:
-        mode = detect_ai_mode()
-        ARK_AI_MODE = mode
-
+    mode = detect_ai_mode()
     if mode == "OLLAMA":
         return ask_ollama(args)
     elif mode == "GEMINI":
@@ -206,7 +209,7 @@ def run_file(path):
     with open(path, "r") as f:
         code = f.read()
     
-    tree = ARK_PARSER.parse(code)
+    tree = get_parser().parse(code)
     scope = Scope()
     scope.set("sys", ArkValue("sys", "Namespace"))
     scope.set("math", ArkValue("math", "Namespace"))
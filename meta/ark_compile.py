@@ -0,0 +1,1221 @@
+"""
+Ark Compile — lowers parse trees to pre-bound Python closures.
+
+Each node is compiled once into a thunk `code(scope) -> ArkValue` and the
+thunk is memoized on the node. Everything a handler used to rediscover on
+every visit (the node kind, child layout, identifier strings, literal
+values) is resolved here, so evaluating a node is a single Python call with
+no dispatch-table lookup and no Lark Tree access.
+
+Node kinds without a compiler run through their NODE_HANDLERS entry, so the
+handler table stays the extension point for rarely executed statements.
+
+Function bodies are compiled against a frame layout (compile_body): every
+parameter and every name the body assigns gets a fixed slot index, and reads
+and writes of those names index the frame's slot list instead of hashing the
+name. Names outside the layout (globals, intrinsics, anything sys.vm.eval
+defines at run time) keep the by-name lookup through Scope.get.
+
+A return statement in a function body stores its value on the frame and
+evaluates to the RETURNED marker; statement sequences and loops stop as soon
+as a statement yields it, and call_user_func reads the value off the frame.
+A returned call to a function stores the pending call on the frame the same
+way, and call_user_func loops into it. Code compiled by name (the top level,
+sys.vm.eval) still raises ReturnException and TailCall, which call_user_func
+also accepts.
+
+The interpreter owns the runtime pieces the thunks call back into
+(call_user_func, the operator table, ...). It imports this module, so it hands them
+over with bind_runtime() once they are defined.
+"""
+import ast
+import operator
+import sys
+
+try:
+    from meta.ark_types import (
+        ArkValue, ArkFunction, ArkClass, ArkInstance, RopeString,
+        UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ReturnException
+    )
+    from meta.ark_intrinsics import INTRINSICS, LINEAR_SPECS, INTRINSICS_WITH_SCOPE
+    from meta.ark_security import SandboxViolation
+    from meta.ark_ir import ir_of
+except ModuleNotFoundError:
+    from ark_types import (
+        ArkValue, ArkFunction, ArkClass, ArkInstance, RopeString,
+        UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ReturnException
+    )
+    from ark_intrinsics import INTRINSICS, LINEAR_SPECS, INTRINSICS_WITH_SCOPE
+    from ark_security import SandboxViolation
+    from ark_ir import ir_of
+
+
+# Bound by the interpreter via bind_runtime().
+ArkRuntimeError = None
+TailCall = None
+call_user_func = None
+instantiate_class = None
+BINOPS = {}
+is_truthy = None
+NODE_HANDLERS = {}
+_PASSTHROUGH = ()
+
+
+def bind_runtime(runtime_error, tail_call, call_func, new_instance, binops, truthy, handlers):
+    global ArkRuntimeError, TailCall, call_user_func, instantiate_class
+    global BINOPS, is_truthy, NODE_HANDLERS, _PASSTHROUGH
+    ArkRuntimeError = runtime_error
+    TailCall = tail_call
+    call_user_func = call_func
+    instantiate_class = new_instance
+    BINOPS = binops
+    is_truthy = truthy
+    NODE_HANDLERS = handlers
+    # Control flow and security exceptions cross statement boundaries
+    # untouched; anything else is reported against the failing statement.
+    _PASSTHROUGH = (ReturnException, TailCall, ArkRuntimeError, SandboxViolation)
+
+
+def _unit(scope):
+    return UNIT_VALUE
+
+
+def compile_node(node, layout=None):
+    """
+    Returns the memoized thunk for node, compiling it on first use.
+    layout maps local names to frame slots when node belongs to a function
+    body; None compiles by-name scope access.
+    """
+    try:
+        return node._ark_code
+    except AttributeError:
+        pass
+    kind = getattr(node, "data", None)
+    compiler = _COMPILERS.get(kind) if kind is not None else None
+    if compiler is not None:
+        code = compiler(node, layout)
+    else:
+        handler = NODE_HANDLERS.get(kind) if kind is not None else None
+        code = _via_handler(handler, node) if handler else _unit
+    try:
+        node._ark_code = code
+    except AttributeError:
+        pass
+    return code
+
+
+def _via_handler(handler, node):
+    def run(scope):
+        return handler(node, scope)
+    return run
+
+
+# ─── Frames ───────────────────────────────────────────────────────────────────
+
+# Fixed slot every frame layout starts with; call_user_func fills it for
+# method calls. Parameters follow from SLOT_ARGS.
+SLOT_THIS = 0
+SLOT_ARGS = 1
+
+
+class _Returned:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "RETURNED"
+
+
+# What a statement in a function body evaluates to once a return statement
+# has run; the returned value itself is on the frame (scope.result).
+RETURNED = _Returned()
+
+
+class FrameCode:
+    """A function body compiled against its frame layout."""
+    __slots__ = ('code', 'layout', 'size', 'param_slots', 'packed_arity', 'args_end', 'pool')
+
+    def __init__(self, code, layout, param_slots):
+        self.code = code
+        self.layout = layout          # name -> slot index
+        self.size = len(layout)
+        self.param_slots = param_slots
+        # Parameters occupy consecutive slots unless a name repeats, which
+        # lets the caller bind a full argument list with one slice store.
+        # packed_arity is the argument count that takes that path (-1 when
+        # the parameters are not packed), so the caller tests one length.
+        self.args_end = SLOT_ARGS + len(param_slots)
+        packed = param_slots == tuple(range(SLOT_ARGS, self.args_end))
+        self.packed_arity = len(param_slots) if packed else -1
+        # Finished, uncaptured frames laid out for this body (call_user_func).
+        self.pool = []
+
+
+def _collect_locals(node, layout):
+    for child in getattr(node, "children", ()):
+        kind = getattr(child, "data", None)
+        if kind is None:
+            continue
+        if kind == "assign_var":
+            layout.setdefault(sys.intern(child.children[0].value), len(layout))
+        elif kind == "assign_destructure":
+            for token in child.children[:-1]:
+                layout.setdefault(sys.intern(token.value), len(layout))
+        _collect_locals(child, layout)
+
+
+def compile_body(func):
+    """Returns the FrameCode for an ArkFunction, memoized on its body node."""
+    body = func.body
+    try:
+        return body._ark_frame
+    except AttributeError:
+        pass
+    layout = {"this": SLOT_THIS}
+    for p in func.params:
+        layout.setdefault(sys.intern(p), len(layout))
+    param_slots = tuple(layout[p] for p in func.params)
+    _collect_locals(body, layout)
+    frame = FrameCode(compile_node(body, layout), layout, param_slots)
+    try:
+        body._ark_frame = frame
+    except AttributeError:
+        pass
+    return frame
+
+
+def _position(node):
+    line = getattr(node, 'line', None)
+    col = getattr(node, 'column', None)
+    meta = getattr(node, 'meta', None)
+    if line is None and meta is not None:
+        line = getattr(meta, 'line', None)
+    if col is None and meta is not None:
+        col = getattr(meta, 'column', None)
+    return line, col
+
+
+# ─── Statements ───────────────────────────────────────────────────────────────
+
+def compile_statements(nodes, layout=None):
+    """Compiles a statement sequence; the thunk returns the last value."""
+    stmts = [(n, compile_node(n, layout)) for n in nodes]
+
+    # Short sequences, e.g. most function bodies, are unrolled so a run
+    # costs no loop iteration or tuple unpacking per statement.
+    if not stmts:
+        return _unit
+    if len(stmts) == 1:
+        (n0, c0), = stmts
+
+        def run_one(scope):
+            try:
+                return c0(scope)
+            except _PASSTHROUGH:
+                raise
+            except Exception as e:
+                raise ArkRuntimeError(str(e), n0) from e
+        return run_one
+    if len(stmts) == 2:
+        (n0, c0), (n1, c1) = stmts
+
+        def run_two(scope):
+            n = n0
+            try:
+                last = c0(scope)
+                if last is RETURNED:
+                    return last
+                n = n1
+                return c1(scope)
+            except _PASSTHROUGH:
+                raise
+            except Exception as e:
+                raise ArkRuntimeError(str(e), n) from e
+        return run_two
+
+    def run(scope):
+        last = UNIT_VALUE
+        n = None
+        try:
+            for n, code in stmts:
+                last = code(scope)
+                if last is RETURNED:
+                    break
+        except _PASSTHROUGH:
+            raise
+        except Exception as e:
+            raise ArkRuntimeError(str(e), n) from e
+        return last
+    return run
+
+
+def _compile_block(node, layout):
+    return compile_statements(node.children, layout)
+
+
+def _compile_flow_stmt(node, layout):
+    return compile_node(node.children[0], layout)
+
+
+def _compile_return_stmt(node, layout):
+    if not node.children:
+        if layout is not None:
+            def run_unit_local(scope):
+                scope.result = UNIT_VALUE
+                return RETURNED
+            return run_unit_local
+
+        def run_unit(scope):
+            raise ReturnException(UNIT_VALUE)
+        return run_unit
+
+    expr = node.children[0]
+    value = compile_node(expr, layout)
+    # Only a call through a plain variable can be a tail call to a Function;
+    # a method or computed callee returns like any other expression, with no
+    # tail-call check on the way out.
+    tail_candidate = (getattr(expr, "data", None) == "call_expr"
+                      and getattr(ir_of(expr).callee, "data", None) == "var")
+    if not tail_candidate:
+        if layout is not None:
+            def run_local(scope):
+                scope.result = value(scope)
+                return RETURNED
+            return run_local
+
+        def run(scope):
+            raise ReturnException(value(scope))
+        return run
+
+    call = ir_of(expr)
+    callee = compile_node(call.callee, layout)
+    args_of = _arg_builder([compile_node(a, layout) for a in call.args])
+
+    if layout is not None:
+        # Tail call inside a function body: any returned call to a plain
+        # Function reuses the call_user_func loop instead of nesting a Python
+        # frame, so tail-recursive and mutually tail-recursive code runs in
+        # constant stack. The callee is a variable, so evaluating it again
+        # on the non-Function path has no side effects.
+        def run_tail(scope):
+            func_val = callee(scope)
+            if func_val.type == "Function":
+                scope.tail = (func_val.val, args_of(scope))
+                return RETURNED
+            scope.result = value(scope)
+            return RETURNED
+        return run_tail
+
+    # TCO Detection: a returned call to the function that is currently
+    # running unwinds to the call_user_func loop instead of nesting. "The
+    # same function" is the same ArkFunction object; dataclass == would
+    # compare the fields (body tree included) instead.
+    def run_call(scope):
+        func_val = callee(scope)
+        if func_val.type == "Function" and func_val.val is _running_func(scope):
+            raise TailCall(func_val.val, args_of(scope))
+        raise ReturnException(value(scope))
+    return run_call
+
+
+def _running_func(scope):
+    # The function whose frame encloses scope, as recorded on the frame by
+    # call_user_func; None outside any function call.
+    while scope is not None:
+        func = getattr(scope, "func", None)
+        if func is not None:
+            return func
+        scope = scope.parent
+    return None
+
+
+def _compile_if_stmt(node, layout):
+    stmt = ir_of(node)
+    branches = []
+    else_ = compile_node(stmt.else_, layout) if stmt.else_ else _unit
+    for c, b in stmt.branches:
+        cond = compile_node(c, layout)
+        block = compile_node(b, layout)
+        const = _constant_of(cond)
+        if const is None:
+            branches.append((cond, block))
+        elif const.val if const.type == "Boolean" else is_truthy(const):
+            # Always taken: later arms and the else are unreachable.
+            else_ = block
+            break
+        # A constant false arm is dropped.
+
+    if not branches:
+        return else_
+
+    if len(branches) == 1:
+        # The common if / if-else shape, without the arm loop.
+        (cond, block), = branches
+
+        def run_one(scope):
+            c = cond(scope)
+            if c.val if c.type == "Boolean" else is_truthy(c):
+                return block(scope)
+            return else_(scope)
+        return run_one
+
+    def run(scope):
+        for cond, block in branches:
+            c = cond(scope)
+            if c.val if c.type == "Boolean" else is_truthy(c):
+                return block(scope)
+        return else_(scope)
+    return run
+
+
+def _loop_test(cond_node, cond, layout):
+    # Returns test(scope) -> bool for a loop condition. A comparison is
+    # tested on its operands directly: an Integer pair goes straight to the
+    # raw operator with no Boolean boxed or unwrapped per iteration, and a
+    # literal operand is unwrapped once, here. Any other pair takes the
+    # generic operator, with its type rules and error messages.
+    kind = getattr(cond_node, "data", None)
+    fn = _RAW_COMPARE.get(kind)
+    if fn is None:
+        def test(scope):
+            c = cond(scope)
+            return c.val if c.type == "Boolean" else is_truthy(c)
+        return test
+
+    binop = BINOPS[kind]
+    left = compile_node(cond_node.children[0], layout)
+    right = compile_node(cond_node.children[1], layout)
+    lc = _constant_of(left)
+    rc = _constant_of(right)
+
+    def fallback(l, r):
+        c = binop(l, r)
+        return c.val if c.type == "Boolean" else is_truthy(c)
+
+    if rc is not None and rc.type == "Integer":
+        k = rc.val
+
+        def test_right_literal(scope):
+            l = left(scope)
+            if l.type == "Integer":
+                return fn(l.val, k)
+            return fallback(l, rc)
+        return test_right_literal
+    if lc is not None and lc.type == "Integer":
+        k = lc.val
+
+        def test_left_literal(scope):
+            r = right(scope)
+            if r.type == "Integer":
+                return fn(k, r.val)
+            return fallback(lc, r)
+        return test_left_literal
+
+    def test_pair(scope):
+        l = left(scope)
+        r = right(scope)
+        if l.type == "Integer" and r.type == "Integer":
+            return fn(l.val, r.val)
+        return fallback(l, r)
+    return test_pair
+
+
+def _compile_while_stmt(node, layout):
+    cond_node = node.children[0]
+    cond = compile_node(cond_node, layout)
+    body_node = node.children[1]
+    const = _constant_of(cond)
+    if const is not None:
+        if not (const.val if const.type == "Boolean" else is_truthy(const)):
+            return _unit
+        if getattr(body_node, "data", None) == "block":
+            return _compile_endless_loop(node, body_node, layout)
+    test = _loop_test(cond_node, cond, layout)
+    if getattr(body_node, "data", None) != "block":
+        body = compile_node(body_node, layout)
+
+        def run(scope):
+            while test(scope):
+                if body(scope) is RETURNED:
+                    return RETURNED
+            return UNIT_VALUE
+        return run
+
+    # The body's statements are run inline by the loop itself, so an
+    # iteration costs no block call and no try setup. Errors are wrapped
+    # against the failing statement, or the loop when the condition fails,
+    # as the enclosing blocks would have done.
+    stmts = [(n, compile_node(n, layout)) for n in body_node.children]
+
+    def run_block(scope):
+        n = None
+        try:
+            while True:
+                n = None
+                if not test(scope):
+                    break
+                for n, code in stmts:
+                    if code(scope) is RETURNED:
+                        return RETURNED
+        except _PASSTHROUGH:
+            raise
+        except Exception as e:
+            raise ArkRuntimeError(str(e), n if n is not None else node) from e
+        return UNIT_VALUE
+    return run_block
+
+
+def _compile_endless_loop(node, body_node, layout):
+    # `while 1 { ... }`: the constant condition is not re-evaluated; only a
+    # return (or an error) leaves the loop.
+    stmts = [(n, compile_node(n, layout)) for n in body_node.children]
+
+    def run(scope):
+        n = None
+        try:
+            while True:
+                for n, code in stmts:
+                    if code(scope) is RETURNED:
+                        return RETURNED
+        except _PASSTHROUGH:
+            raise
+        except Exception as e:
+            raise ArkRuntimeError(str(e), n if n is not None else node) from e
+    return run
+
+
+def _compile_assign_var(node, layout):
+    name = sys.intern(node.children[0].value)
+    value = compile_node(node.children[1], layout)
+
+    if layout is not None and name in layout:
+        slot = layout[name]
+
+        def run_local(scope):
+            val = scope.slots[slot] = value(scope)
+            return val
+        return run_local
+
+    def run(scope):
+        val = value(scope)
+        scope.set(name, val)
+        return val
+    return run
+
+
+def _compile_assign_destructure(node, layout):
+    value = compile_node(node.children[-1], layout)
+    names = [sys.intern(t.value) for t in node.children[:-1]]
+    needed = len(names)
+    # Slot index per target, or None for a name bound through scope.set.
+    slots = [layout.get(name) if layout is not None else None for name in names]
+    targets = list(zip(names, slots))
+
+    def run(scope):
+        val = value(scope)
+        if val.type != "List":
+            raise ArkRuntimeError(f"Destructuring expects List, got {val.type}", node)
+        items = val.val
+        if len(items) < needed:
+            raise ArkRuntimeError(f"Not enough items to destructure: needed {needed}, got {len(items)}", node)
+        for (name, slot), item in zip(targets, items):
+            if slot is not None:
+                scope.slots[slot] = item
+            else:
+                scope.set(name, item)
+        return val
+    return run
+
+
+def _compile_assign_attr(node, layout):
+    obj_code = compile_node(node.children[0], layout)
+    attr = sys.intern(node.children[1].value)
+    value = compile_node(node.children[2], layout)
+
+    def run(scope):
+        obj = obj_code(scope)
+        val = value(scope)
+        if obj.type == "Instance":
+            obj.val.fields[attr] = val
+            return val
+        raise ArkRuntimeError(f"Cannot set attribute on {obj.type}", node)
+    return run
+
+
+def _mark_captured(scope):
+    # Frames are pooled per OptimizedScope class; sys.vm.eval may reach the
+    # interpreter under a second import name, so test for the slot, not the
+    # type.
+    try:
+        scope.captured = True
+    except AttributeError:
+        pass
+
+
+# Definitions are decoded once (ark_ir); running one only builds the
+# ArkFunction or ArkClass around the scope it closes over.
+
+def _compile_function_def(node, layout):
+    fd = ir_of(node)
+    name, params, body = fd.name, fd.params, fd.body
+
+    def run(scope):
+        _mark_captured(scope)
+        func = ArkValue(ArkFunction(name, params, body, scope), "Function")
+        scope.set(name, func)
+        return func
+    return run
+
+
+def _compile_class_def(node, layout):
+    cd = ir_of(node)
+    name = cd.name
+    methods = tuple((m.name, m.params, m.body) for m in cd.methods)
+
+    def run(scope):
+        _mark_captured(scope)
+        klass = ArkValue(ArkClass(name, {m: ArkFunction(m, params, body, scope)
+                                         for m, params, body in methods}), "Class")
+        scope.set(name, klass)
+        return klass
+    return run
+
+
+# ─── Expressions ──────────────────────────────────────────────────────────────
+
+def _fold_logical(left, right, short_circuit):
+    # Folds || (short_circuit=True) or && (False) when the left operand is a
+    # constant that decides the result, or both operands are constants.
+    lc = _constant_of(left)
+    if lc is None:
+        return None
+    if bool(lc.val if lc.type == "Boolean" else is_truthy(lc)) == short_circuit:
+        return _constant(TRUE_VALUE if short_circuit else FALSE_VALUE)
+    rc = _constant_of(right)
+    if rc is None:
+        return None
+    return _constant(TRUE_VALUE if (rc.val if rc.type == "Boolean" else is_truthy(rc)) else FALSE_VALUE)
+
+
+def _compile_logical_or(node, layout):
+    left = compile_node(node.children[0], layout)
+    right = compile_node(node.children[-1], layout)
+    folded = _fold_logical(left, right, True)
+    if folded is not None:
+        return folded
+
+    def run(scope):
+        c = left(scope)
+        if c.val if c.type == "Boolean" else is_truthy(c):
+            return TRUE_VALUE
+        c = right(scope)
+        return TRUE_VALUE if (c.val if c.type == "Boolean" else is_truthy(c)) else FALSE_VALUE
+    return run
+
+
+def _compile_logical_and(node, layout):
+    left = compile_node(node.children[0], layout)
+    right = compile_node(node.children[-1], layout)
+    folded = _fold_logical(left, right, False)
+    if folded is not None:
+        return folded
+
+    def run(scope):
+        c = left(scope)
+        if not (c.val if c.type == "Boolean" else is_truthy(c)):
+            return FALSE_VALUE
+        c = right(scope)
+        return TRUE_VALUE if (c.val if c.type == "Boolean" else is_truthy(c)) else FALSE_VALUE
+    return run
+
+
+def _compile_var(node, layout):
+    name = sys.intern(node.children[0].value)
+    # What the name evaluates to when nothing in scope binds it and it names
+    # an intrinsic (print, len, ...). Membership is still checked per lookup.
+    intrinsic_val = ArkValue(name, "Intrinsic")
+
+    def run(scope):
+        # Names bound in the current scope's dict (top-level code, names
+        # bound dynamically inside a frame) are read with one probe; misses,
+        # slot-resident names and moved values take the full lookup.
+        val = scope.vars.get(name)
+        if val is not None and val.type != "Moved":
+            return val
+        val = scope.get(name)
+        if val is not None:
+            return val
+        if name in INTRINSICS:
+            return intrinsic_val
+        raise ArkRuntimeError(f"Undefined variable: {name}", node)
+
+    if layout is not None and name in layout:
+        slot = layout[name]
+
+        def run_local(scope):
+            val = scope.slots[slot]
+            if val is not None and val.type != "Moved":
+                return val
+            # Not bound yet (the name may still resolve in an enclosing
+            # scope) or moved: the by-name path reports both precisely.
+            return run(scope)
+        return run_local
+
+    if layout is not None:
+        # A name the body never binds (a global, a function called by name,
+        # a variable of an enclosing function) resolves in the frame's
+        # parent. Unless code run by sys.vm.eval bound names in this frame,
+        # the lookup starts there and skips the frame's own tables.
+        def run_free(scope):
+            parent = scope.parent
+            if parent is not None and not scope.vars:
+                val = parent.get(name)
+                if val is not None:
+                    return val
+                if name in INTRINSICS:
+                    return intrinsic_val
+            return run(scope)
+        return run_free
+    return run
+
+
+def _method_of(cell, klass, attr):
+    # Slow path of a method inline cache: resolve on the class and remember
+    # (class, method) for the site. The entry is one tuple, so a concurrent
+    # reader always sees a matching pair.
+    method = klass.methods.get(attr)
+    if method is not None:
+        cell[0] = (klass, method)
+    return method
+
+
+def _attr_getter(attr, node):
+    """Returns get(obj) resolving attr on a value, with a method inline cache.
+
+    Namespace lookups are cached too: the site remembers the last parent
+    path and the value it resolved to, so a repeated ``sys.list`` neither
+    builds the dotted path nor probes INTRINSICS again.
+    """
+    cell = [(None, None)]
+    ns = [(None, None)]
+
+    def get(obj):
+        kind = obj.type
+        if kind == "Instance":
+            inst = obj.val
+            fields = inst.fields
+            if attr in fields:
+                return fields[attr]
+            bound = inst.bound.get(attr)
+            if bound is not None:
+                return bound
+            klass = inst.klass
+            if klass is not None:
+                entry = cell[0]
+                method = entry[1] if entry[0] is klass else _method_of(cell, klass, attr)
+                if method is not None:
+                    bound = inst.bound[attr] = ArkValue((method, obj), "BoundMethod")
+                    return bound
+        elif kind == "Namespace":
+            path = obj.val
+            entry = ns[0]
+            if entry[0] == path:
+                return entry[1]
+            new_path = sys.intern(f"{path}.{attr}")
+            value = ArkValue(new_path, "Intrinsic" if new_path in INTRINSICS else "Namespace")
+            ns[0] = (path, value)
+            return value
+        elif kind == "Class":
+            method = obj.val.methods.get(attr)
+            if method is not None:
+                return ArkValue(method, "Function")
+        raise ArkRuntimeError(f"Attribute {attr} not found on {kind}", node)
+    return get, cell
+
+
+def _compile_get_attr(node, layout):
+    obj_node = node.children[0]
+    get, _ = _attr_getter(sys.intern(node.children[1].value), node)
+    if getattr(obj_node, "data", None) == "get_attr":
+        # A static chain such as sys.io.fs.read is resolved as a whole: the
+        # root is read once and, while it names the same namespace, the
+        # resolved leaf value is returned without walking the levels.
+        gets = [get]
+        while getattr(obj_node, "data", None) == "get_attr":
+            gets.append(_attr_getter(sys.intern(obj_node.children[1].value), obj_node)[0])
+            obj_node = obj_node.children[0]
+        gets.reverse()
+        root = compile_node(obj_node, layout)
+        cache = [(None, None)]
+
+        def run_chain(scope):
+            obj = root(scope)
+            if obj.type == "Namespace":
+                path = obj.val
+                entry = cache[0]
+                if entry[0] == path:
+                    return entry[1]
+                for level in gets:
+                    obj = level(obj)
+                cache[0] = (path, obj)
+                return obj
+            for level in gets:
+                obj = level(obj)
+            return obj
+        return run_chain
+
+    obj_code = compile_node(obj_node, layout)
+
+    def run(scope):
+        return get(obj_code(scope))
+    return run
+
+
+def _callee_name(func_val):
+    if func_val is not None:
+        if func_val.type == "Function":
+            return func_val.val.name
+        if func_val.type == "BoundMethod":
+            return func_val.val[0].name
+    return "<unknown>"
+
+
+# Static facts about each intrinsic called so far, by name: whether it takes
+# the caller's scope and the argument positions it consumes. Shared by all
+# call sites, so a site that switches intrinsics rebuilds its record from
+# one lookup.
+_INTRINSIC_FLAGS = {}
+
+
+def _intrinsic_flags(name):
+    flags = _INTRINSIC_FLAGS.get(name)
+    if flags is None:
+        flags = _INTRINSIC_FLAGS[name] = (name in INTRINSICS_WITH_SCOPE,
+                                          tuple(LINEAR_SPECS.get(name, ())))
+    return flags
+
+
+def _arg_builder(arg_codes):
+    # Argument lists for the common small arities are built as literals,
+    # which is cheaper than running a comprehension on every call.
+    n = len(arg_codes)
+    if n == 0:
+        return lambda scope: []
+    if n == 1:
+        a0, = arg_codes
+        return lambda scope: [a0(scope)]
+    if n == 2:
+        a0, a1 = arg_codes
+        return lambda scope: [a0(scope), a1(scope)]
+    if n == 3:
+        a0, a1, a2 = arg_codes
+        return lambda scope: [a0(scope), a1(scope), a2(scope)]
+    return lambda scope: [a(scope) for a in arg_codes]
+
+
+def _compile_call_expr(node, layout):
+    call = ir_of(node)
+    args_of = _arg_builder([compile_node(a, layout) for a in call.args])
+    # Argument names for linear intrinsics that consume a variable.
+    arg_vars = [a.children[0].value if getattr(a, "data", None) == "var" else None
+                for a in call.args]
+    line, col = _position(node)
+    # Per-site record of the last intrinsic called here: its name, whether it
+    # takes the caller's scope, and the argument variables it consumes. The
+    # function itself is looked up on every call, so INTRINSICS stays the
+    # single source of truth.
+    intrinsic = [(None, False, ())]
+
+    def intrinsic_record(name):
+        needs_scope, linear = _intrinsic_flags(name)
+        moved = tuple(arg_vars[idx] for idx in linear
+                      if idx < len(arg_vars) and arg_vars[idx] is not None)
+        entry = intrinsic[0] = (name, needs_scope, moved)
+        return entry
+
+    def invoke(func_val, args, scope):
+        kind = func_val.type
+
+        if kind == "Intrinsic":
+            name = func_val.val
+            entry = intrinsic[0]
+            if entry[0] != name:
+                entry = intrinsic_record(name)
+            for var in entry[2]:
+                scope.mark_moved(var)
+            if entry[1]:
+                return INTRINSICS[name](args, scope)
+            return INTRINSICS[name](args)
+
+        if kind == "Function":
+            return call_user_func(func_val.val, args)
+
+        if kind == "Class":
+            return instantiate_class(func_val.val, args)
+
+        if kind == "BoundMethod":
+            method, instance = func_val.val
+            return call_user_func(method, args, instance)
+
+        raise ArkRuntimeError(f"Not callable: {kind}", node)
+
+    callee_node = call.callee
+    if getattr(callee_node, "data", None) != "get_attr":
+        callee = compile_node(callee_node, layout)
+
+        def run(scope):
+            func_val = None
+            try:
+                func_val = callee(scope)
+                return invoke(func_val, args_of(scope), scope)
+            except ArkRuntimeError as e:
+                # Caller side of the call: record this call site on the trace.
+                e.add_frame(line, col, _callee_name(func_val))
+                raise
+        return run
+
+    # obj.attr(...) call site. A method found through the site's inline cache
+    # is called directly with its instance, without materialising the
+    # BoundMethod value; fields, namespaces and classes resolve as get_attr.
+    obj_code = compile_node(callee_node.children[0], layout)
+    attr = sys.intern(callee_node.children[1].value)
+    get, cell = _attr_getter(attr, callee_node)
+
+    def run_attr(scope):
+        func_val = None
+        method = None
+        try:
+            obj = obj_code(scope)
+            if obj.type == "Instance":
+                inst = obj.val
+                klass = inst.klass
+                if klass is not None and attr not in inst.fields:
+                    entry = cell[0]
+                    method = entry[1] if entry[0] is klass else _method_of(cell, klass, attr)
+                    if method is not None:
+                        return call_user_func(method, args_of(scope), obj)
+            func_val = get(obj)
+            return invoke(func_val, args_of(scope), scope)
+        except ArkRuntimeError as e:
+            e.add_frame(line, col, method.name if method is not None else _callee_name(func_val))
+            raise
+    return run_attr
+
+
+# Literals are decoded once, when the node is compiled, and every evaluation
+# returns the same ArkValue; values are never mutated in place, so sharing
+# one constant between all its uses is safe.
+
+def _constant(value):
+    def run(scope):
+        return value
+    # Lets enclosing operators fold over this operand at compile time.
+    run.constant = value
+    return run
+
+
+def _constant_of(code):
+    return getattr(code, "constant", None)
+
+
+def _compile_number(node, layout):
+    v = int(node.children[0].value)
+    return _constant(SMALL_INTS[v + 5] if -5 <= v <= 256 else ArkValue(v, "Integer"))
+
+
+def _compile_string(node, layout):
+    raw = node.children[0].value
+    try:
+        s = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        s = raw[1:-1]
+    return _constant(ArkValue(s, "String"))
+
+
+# ─── Unboxed integer expressions ──────────────────────────────────────────────
+#
+# An operator whose operands are integer literals, variables and nested
+# arithmetic is evaluated on raw Python ints: literals are used as constants,
+# variables are unwrapped once, and only the final result is boxed into an
+# ArkValue. If a variable turns out not to hold an Integer, the expression is
+# re-evaluated on the boxed path, which reproduces the exact result or error;
+# re-reading variables and literals has no side effects.
+
+_RAW_ARITH = {
+    "add": operator.add, "sub": operator.sub, "mul": operator.mul,
+    "div": operator.floordiv, "mod": operator.mod,
+}
+_RAW_COMPARE = {
+    "lt": operator.lt, "gt": operator.gt, "le": operator.le,
+    "ge": operator.ge, "eq": operator.eq, "neq": operator.ne,
+}
+
+
+class _NotInteger(Exception):
+    """Raised by an unboxed leaf whose variable holds a non-Integer."""
+
+
+def _raw_int(node, layout):
+    # Returns (constant, None) for a literal, (None, thunk) for a raw-int
+    # thunk, or None when node is outside the unboxed subset.
+    kind = getattr(node, "data", None)
+    if kind == "number":
+        return int(node.children[0].value), None
+    if kind == "var":
+        code = compile_node(node, layout)
+
+        def leaf(scope):
+            val = code(scope)
+            if val.type != "Integer":
+                raise _NotInteger
+            return val.val
+        return None, leaf
+    fn = _RAW_ARITH.get(kind)
+    if fn is None:
+        return None
+    folded = _constant_of(compile_node(node, layout))
+    if folded is not None and folded.type == "Integer":
+        return folded.val, None
+    left = _raw_int(node.children[0], layout)
+    right = _raw_int(node.children[1], layout)
+    if left is None or right is None:
+        return None
+    return None, _raw_pair(fn, left, right)
+
+
+def _raw_pair(fn, left, right):
+    lk, lf = left
+    rk, rf = right
+    if lf is None and rf is None:
+        # Both literal: leave the arithmetic (and any ZeroDivisionError) to
+        # run time, as the boxed path would.
+        return lambda scope: fn(lk, rk)
+    if lf is None:
+        return lambda scope: fn(lk, rf(scope))
+    if rf is None:
+        return lambda scope: fn(lf(scope), rk)
+    return lambda scope: fn(lf(scope), rf(scope))
+
+
+def _compile_binop(node, layout):
+    binop = BINOPS[node.data]
+    left = compile_node(node.children[0], layout)
+    right = compile_node(node.children[1], layout)
+
+    # An operator over constants is evaluated once, here. If it fails (a
+    # type error, division by zero) it is left to fail at run time, where
+    # the error is reported against the statement as usual.
+    lc = _constant_of(left)
+    rc = _constant_of(right)
+    if lc is not None and rc is not None:
+        try:
+            return _constant(binop(lc, rc))
+        except Exception:
+            pass
+
+    kind = node.data
+    fn = _RAW_ARITH.get(kind)
+    compare = fn is None
+    if compare:
+        fn = _RAW_COMPARE[kind]
+
+    # Every site is specialised for the Integer/Integer case: one guard on
+    # the operand types, then the raw operator. Any other pair takes the
+    # generic operator, which keeps the full type rules and error messages.
+    # Comparisons return the shared Boolean values rather than boxing.
+    if compare:
+        def run(scope):
+            l = left(scope)
+            r = right(scope)
+            if l.type == "Integer" and r.type == "Integer":
+                return TRUE_VALUE if fn(l.val, r.val) else FALSE_VALUE
+            return binop(l, r)
+    elif kind == "add":
+        # + is also string concatenation: a String/String pair joins the
+        # ropes directly. A literal right operand is wrapped once, here.
+        right_rope = None
+        if rc is not None and rc.type == "String" and type(rc.val) is str:
+            right_rope = RopeString(rc.val)
+
+        def run(scope):
+            l = left(scope)
+            r = right(scope)
+            lt = l.type
+            rt = r.type
+            if lt == "Integer" and rt == "Integer":
+                v = l.val + r.val
+                if type(v) is int and -5 <= v <= 256:
+                    return SMALL_INTS[v + 5]
+                return ArkValue(v, "Integer")
+            if lt == "String" and rt == "String":
+                lv = l.val
+                rv = right_rope if right_rope is not None else r.val
+                if type(lv) is str:
+                    lv = RopeString(lv)
+                if type(rv) is str:
+                    rv = RopeString(rv)
+                if type(lv) is RopeString and type(rv) is RopeString:
+                    return ArkValue(RopeString._concat(lv, rv), "String")
+            return binop(l, r)
+    else:
+        def run(scope):
+            l = left(scope)
+            r = right(scope)
+            if l.type == "Integer" and r.type == "Integer":
+                v = fn(l.val, r.val)
+                if type(v) is int and -5 <= v <= 256:
+                    return SMALL_INTS[v + 5]
+                return ArkValue(v, "Integer")
+            return binop(l, r)
+
+    raw_left = _raw_int(node.children[0], layout)
+    raw_right = _raw_int(node.children[1], layout)
+    if raw_left is None or raw_right is None or (raw_left[1] is None and raw_right[1] is None):
+        return run
+    raw = _raw_pair(fn, raw_left, raw_right)
+
+    # A site that once sees a non-Integer (say, == on Strings) stays on the
+    # boxed path from then on, rather than raising and catching _NotInteger
+    # on every evaluation.
+    unboxed = [True]
+
+    if compare:
+        def run_raw(scope):
+            if unboxed[0]:
+                try:
+                    return TRUE_VALUE if raw(scope) else FALSE_VALUE
+                except _NotInteger:
+                    unboxed[0] = False
+            return run(scope)
+    else:
+        def run_raw(scope):
+            if not unboxed[0]:
+                return run(scope)
+            try:
+                v = raw(scope)
+            except _NotInteger:
+                unboxed[0] = False
+                return run(scope)
+            if type(v) is int and -5 <= v <= 256:
+                return SMALL_INTS[v + 5]
+            return ArkValue(v, "Integer")
+    return run_raw
+
+
+def _compile_struct_init(node, layout):
+    fields = []
+    if node.children:
+        child = node.children[0]
+        if getattr(child, "data", None) == "field_list":
+            fields = [(sys.intern(f.children[0].value), compile_node(f.children[1], layout))
+                      for f in child.children]
+
+    def run(scope):
+        return ArkValue(ArkInstance(None, {name: code(scope) for name, code in fields}), "Instance")
+    return run
+
+
+_LITERAL_KINDS = ("number", "string")
+
+
+def _compile_list_cons(node, layout):
+    elements = []
+    if node.children:
+        child = node.children[0]
+        if getattr(child, "data", None) == "expr_list":
+            elements = child.children
+    items = [compile_node(c, layout) for c in elements]
+
+    if all(getattr(c, "data", None) in _LITERAL_KINDS for c in elements):
+        # All-literal list: the elements are built once, and each evaluation
+        # only copies them into the fresh list the program may mutate.
+        # Literal thunks ignore their scope.
+        values = tuple(item(None) for item in items)
+
+        def run_const(scope):
+            return ArkValue(list(values), "List")
+        return run_const
+
+    build = _arg_builder(items)
+
+    def run(scope):
+        return ArkValue(build(scope), "List")
+    return run
+
+
+def _compile_get_item(node, layout):
+    coll_code = compile_node(node.children[0], layout)
+    index_code = compile_node(node.children[1], layout)
+
+    def run(scope):
+        collection = coll_code(scope)
+        index_val = index_code(scope)
+        if index_val.type != "Integer":
+            raise ArkRuntimeError(f"Index must be Integer, got {index_val.type}", node)
+        idx = index_val.val
+
+        # The containers bounds-check the index themselves; only negative
+        # indices, which Ark rejects rather than counting from the end, need
+        # a test of their own.
+        kind = collection.type
+        if kind == "List":
+            if idx >= 0:
+                try:
+                    return collection.val[idx]
+                except IndexError:
+                    pass
+            raise ArkRuntimeError(f"List index out of range: {idx}", node)
+        if kind == "String":
+            if idx >= 0:
+                try:
+                    return ArkValue(collection.val[idx], "String")
+                except IndexError:
+                    pass
+            raise ArkRuntimeError(f"String index out of range: {idx}", node)
+        if kind == "Buffer":
+            if idx >= 0:
+                try:
+                    v = collection.val[idx]
+                except IndexError:
+                    pass
+                else:
+                    # Buffers are bytearrays: every element is a shared int.
+                    return SMALL_INTS[v + 5]
+            raise ArkRuntimeError(f"Buffer index out of range: {idx}", node)
+        raise ArkRuntimeError(f"Cannot index type {kind}", node)
+    return run
+
+
+_COMPILERS = {
+    "start": _compile_block,
+    "block": _compile_block,
+    "flow_stmt": _compile_flow_stmt,
+    "return_stmt": _compile_return_stmt,
+    "if_stmt": _compile_if_stmt,
+    "while_stmt": _compile_while_stmt,
+    "assign_var": _compile_assign_var,
+    "assign_destructure": _compile_assign_destructure,
+    "assign_attr": _compile_assign_attr,
+    "function_def": _compile_function_def,
+    "class_def": _compile_class_def,
+    "logical_or": _compile_logical_or,
+    "logical_and": _compile_logical_and,
+    "var": _compile_var,
+    "get_attr": _compile_get_attr,
+    "call_expr": _compile_call_expr,
+    "number": _compile_number,
+    "string": _compile_string,
+    "add": _compile_binop,
+    "sub": _compile_binop,
+    "mul": _compile_binop,
+    "div": _compile_binop,
+    "mod": _compile_binop,
+    "lt": _compile_binop,
+    "gt": _compile_binop,
+    "le": _compile_binop,
+    "ge": _compile_binop,
+    "eq": _compile_binop,
+    "neq": _compile_binop,
+    "list_cons": _compile_list_cons,
+    "struct_init": _compile_struct_init,
+    "get_item": _compile_get_item,
+}
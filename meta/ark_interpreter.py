@@ -2,28 +2,42 @@
 Ark Interpreter — AST evaluation engine.
 
 Extracted from ark.py (Phase 72: Structural Hardening).
-Contains: eval_node, all handle_* functions, NODE_HANDLERS, eval_binop, is_truthy.
+Contains: eval_node, the handle_* functions for statements not lowered by
+ark_compile, NODE_HANDLERS, eval_binop, is_truthy.
 """
 import os
 import sys
-import ast
+import pickle
+import hashlib
+import operator
 from typing import List, Optional
+import lark
 from lark import Lark
 
 try:
     from meta.ark_types import (
-        ArkValue, UNIT_VALUE, CENSORED_VALUE, ArkFunction, ArkClass, ArkInstance, Scope,
-        ReturnException, RopeString, CensoredAccessError
+        ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, CENSORED_VALUE,
+        ArkFunction, ArkClass, ArkInstance, Scope, ReturnException, RopeString, CensoredAccessError
     )
     from meta.ark_intrinsics import INTRINSICS, LINEAR_SPECS, INTRINSICS_WITH_SCOPE
     from meta.ark_security import SandboxViolation
+    from meta.ark_jit import compile_function, JIT_THRESHOLD
+    from meta.ark_compile import (
+        compile_node, compile_statements, compile_body, bind_runtime,
+        SLOT_THIS, SLOT_ARGS, RETURNED
+    )
 except ModuleNotFoundError:
     from ark_types import (
-        ArkValue, UNIT_VALUE, CENSORED_VALUE, ArkFunction, ArkClass, ArkInstance, Scope,
-        ReturnException, RopeString, CensoredAccessError
+        ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, CENSORED_VALUE,
+        ArkFunction, ArkClass, ArkInstance, Scope, ReturnException, RopeString, CensoredAccessError
     )
     from ark_intrinsics import INTRINSICS, LINEAR_SPECS, INTRINSICS_WITH_SCOPE
     from ark_security import SandboxViolation
+    from ark_jit import compile_function, JIT_THRESHOLD
+    from ark_compile import (
+        compile_node, compile_statements, compile_body, bind_runtime,
+        SLOT_THIS, SLOT_ARGS, RETURNED
+    )
 
 
 # --- Global Parser ---
@@ -31,7 +45,36 @@ grammar_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ark.lar
 with open(grammar_path, "r") as f:
     ARK_GRAMMAR = f.read()
 
-ARK_PARSER = Lark(ARK_GRAMMAR, start="start", parser="lalr", propagate_positions=True)
+# Lark pickles the LALR tables to disk (keyed on grammar and options) so only
+# the first process pays for table construction. ARK_PARSER_CACHE may name an
+# explicit cache file. The default lives in the per-user ~/.ark_cache rather
+# than Lark's own choice in the shared temp directory, where any local user
+# could plant the pickle that Lark loads. Without a private directory the
+# tables are simply rebuilt.
+def _default_parser_cache():
+    cache_dir = os.path.join(os.path.expanduser("~"), ".ark_cache")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.stat(cache_dir)
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        return False
+    return os.path.join(cache_dir, "lark_parser.cache")
+
+PARSER_CACHE = os.environ.get("ARK_PARSER_CACHE") or _default_parser_cache()
+_PARSER = None
+
+
+def get_parser():
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = Lark(ARK_GRAMMAR, start="start", parser="lalr", lexer="contextual",
+                       propagate_positions=True, cache=PARSER_CACHE)
+    return _PARSER
+
+
+ARK_PARSER = get_parser()
 
 
 # ─── Hardening Structures ─────────────────────────────────────────────────────
@@ -56,7 +99,10 @@ class ArkRuntimeError(Exception):
         else:
             self.line = None
             self.col = None
-        super().__init__(self.__str__())
+        # The traceback text is rendered by __str__ when asked for, not here:
+        # call sites append frames while the error unwinds, and an error that
+        # is caught never needs the text at all.
+        super().__init__(msg)
 
     def add_frame(self, line, col, func_name):
         self.stack.append((line, col, func_name))
@@ -84,16 +130,59 @@ class TailCall(Exception):
         self.func = func
         self.args = args
 
+_NO_SLOTS = {}
+
+
 class OptimizedScope(Scope):
-    __slots__ = ('_cache', '_access_counts')
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._cache = {}
-        self._access_counts = {}
+    __slots__ = ('_cache', '_access_counts', 'captured', 'layout', 'slots', 'result', 'tail', 'func')
+    def __init__(self, parent=None, layout=_NO_SLOTS):
+        self.vars = {}
+        self.parent = parent
+        # Parent-lookup cache for names read by name (code run through
+        # sys.vm.eval, mostly). Compiled bodies read their locals from slots,
+        # so most frames never look a name up here: both dicts are created on
+        # the first parent lookup rather than with every frame.
+        self._cache = None
+        self._access_counts = None
+        # Value of the body's return statement, read by call_user_func when
+        # the body finishes with RETURNED; tail holds (function, args) instead
+        # when the return was a tail call.
+        self.result = None
+        self.tail = None
+        # The ArkFunction running in this frame (set by call_user_func).
+        self.func = None
+        # Set once a closure or class captures this scope; a captured frame
+        # must outlive its call and is never returned to the frame pool.
+        self.captured = False
+        # Locals known at compile time live in slots (see compile_body);
+        # vars only holds names bound dynamically, e.g. by sys.vm.eval.
+        self.layout = layout
+        self.slots = [None] * len(layout)
+
+    def clear(self):
+        # Drop everything the finished call bound, keeping the layout, so the
+        # frame can be handed to the next call of the same function.
+        if self.vars:
+            self.vars.clear()
+        if self._access_counts:
+            self._cache.clear()
+            self._access_counts.clear()
+        self.slots = [None] * len(self.slots)
+        self.result = None
+        self.tail = None
 
     def get(self, name: str) -> Optional[ArkValue]:
+        # 0. Slot Lookup
+        idx = self.layout.get(name)
+        if idx is not None:
+            val = self.slots[idx]
+            if val is not None:
+                if val.type == "Moved":
+                    raise ArkRuntimeError(f"Use of moved variable '{name}'")
+                return val
+
         # 1. Local Lookup (O(1))
-        if name in self.vars:
+        elif name in self.vars:
             val = self.vars[name]
             if val.type == "Moved":
                 # We can't easily import LinearityViolation, relying on runtime checks or generic error
@@ -103,16 +192,21 @@ class OptimizedScope(Scope):
             return val
 
         # 2. Cache Lookup (O(1))
-        if name in self._cache:
-            return self._cache[name]
+        cache = self._cache
+        if cache is not None and name in cache:
+            return cache[name]
 
         # 3. Parent Lookup (O(depth))
         if self.parent:
             val = self.parent.get(name)
             if val:
                 # Heuristic: Only cache frequent variables to avoid thrashing
-                count = self._access_counts.get(name, 0) + 1
-                self._access_counts[name] = count
+                counts = self._access_counts
+                if counts is None:
+                    counts = self._access_counts = {}
+                    self._cache = {}
+                count = counts.get(name, 0) + 1
+                counts[name] = count
                 if count > 10:
                     self._cache[name] = val
             return val
@@ -120,310 +214,76 @@ class OptimizedScope(Scope):
 
     def set(self, name: str, val: ArkValue):
         # Always set in local scope (shadowing)
-        self.vars[name] = val
+        idx = self.layout.get(name)
+        if idx is None:
+            self.vars[name] = val
+        else:
+            self.slots[idx] = val
 
     def mark_moved(self, name: str):
         # Invalidate cache if we mark a variable as moved (even if it's in parent)
         # Actually mark_moved logic:
         # If in self.vars: mark moved.
         # Else if parent: parent.mark_moved(name).
-        if name in self._cache:
+        if self._cache and name in self._cache:
             del self._cache[name]
+        idx = self.layout.get(name)
+        if idx is not None and self.slots[idx] is not None:
+            self.slots[idx] = ArkValue(None, "Moved")
+            return
         super().mark_moved(name)
 
 
 # ─── Evaluator ────────────────────────────────────────────────────────────────
 
-def handle_block(node, scope):
-    return eval_block(node.children, scope)
-
-def handle_flow_stmt(node, scope):
-    return eval_node(node.children[0], scope)
-
-def handle_function_def(node, scope):
-    name = node.children[0].value
-    params = []
-    body_idx = 1
-    if len(node.children) > 1:
-        child1 = node.children[1]
-        if child1 is None:
-            body_idx = 2
-        elif hasattr(child1, "data") and child1.data == "param_list":
-            params = [t.value for t in child1.children]
-            body_idx = 2
-    body = node.children[body_idx]
-    func = ArkValue(ArkFunction(name, params, body, scope), "Function")
-    scope.set(name, func)
-    return func
-
-def handle_class_def(node, scope):
-    name = node.children[0].value
-    methods = {}
-    for child in node.children[1:]:
-        if child.data == "function_def":
-            m_name = child.children[0].value
-            m_params = []
-            m_body_idx = 1
-            if len(child.children) > 1 and hasattr(child.children[1], "data") and child.children[1].data == "param_list":
-                m_params = [t.value for t in child.children[1].children]
-                m_body_idx = 2
-            m_body = child.children[m_body_idx]
-            methods[m_name] = ArkFunction(m_name, m_params, m_body, scope)
-    klass = ArkValue(ArkClass(name, methods), "Class")
-    scope.set(name, klass)
-    return klass
-
-def handle_struct_init(node, scope):
-    fields = {}
-    if node.children:
-        child = node.children[0]
-        if hasattr(child, "data") and child.data == "field_list":
-            for field in child.children:
-                name = field.children[0].value
-                val = eval_node(field.children[1], scope)
-                fields[name] = val
-    return ArkValue(ArkInstance(None, fields), "Instance")
-
-def handle_return_stmt(node, scope):
-    if node.children:
-        expr = node.children[0]
-
-        # TCO Detection: Check if we are returning a call to the current function
-        if hasattr(expr, "data") and expr.data == "call_expr":
-             # We need to check if the function being called is the same as __current_func__
-             # First, resolve the function expression (first child of call_expr)
-             func_expr_node = expr.children[0]
-
-             # We evaluate the function reference.
-             # Note: This might have side effects if it's a complex expression, but usually it's just a var.
-             func_val = eval_node(func_expr_node, scope)
-
-             current_func = scope.get("__current_func__")
-
-             # Strict check: same function object and purely self-recursive (not method call on different instance)
-             # If it's a simple function call
-             if current_func and func_val.val == current_func.val:
-                 # Evaluate arguments
-                 arg_vals = []
-                 if len(expr.children) > 1:
-                     arg_list_node = expr.children[1]
-                     if hasattr(arg_list_node, "children"):
-                         arg_vals = [eval_node(c, scope) for c in arg_list_node.children]
-
-                 # Raise TailCall exception to unwind to call_user_func loop
-                 raise TailCall(func_val.val, arg_vals)
-
-        val = eval_node(expr, scope)
-        raise ReturnException(val)
-    raise ReturnException(UNIT_VALUE)
-
-def handle_if_stmt(node, scope):
-    num_children = len(node.children)
-    i = 0
-    while i + 1 < num_children:
-        cond = eval_node(node.children[i], scope)
-        if is_truthy(cond):
-            return eval_node(node.children[i+1], scope)
-        i += 2
-    if i < num_children and node.children[i]:
-        return eval_node(node.children[i], scope)
-    return UNIT_VALUE
-
-def handle_while_stmt(node, scope):
-    cond_node = node.children[0]
-    body_node = node.children[1]
-    while is_truthy(eval_node(cond_node, scope)):
-        eval_node(body_node, scope)
-    return UNIT_VALUE
-
-def handle_logical_or(node, scope):
-    left = eval_node(node.children[0], scope)
-    if is_truthy(left): return ArkValue(True, "Boolean")
-    right = eval_node(node.children[-1], scope)
-    return ArkValue(is_truthy(right), "Boolean")
-
-def handle_logical_and(node, scope):
-    left = eval_node(node.children[0], scope)
-    if not is_truthy(left): return ArkValue(False, "Boolean")
-    right = eval_node(node.children[-1], scope)
-    return ArkValue(is_truthy(right), "Boolean")
-
-def handle_var(node, scope):
-    name = node.children[0].value
-    val = scope.get(name)
-    if val: return val
-    if name in INTRINSICS:
-        return ArkValue(name, "Intrinsic")
-    raise ArkRuntimeError(f"Undefined variable: {name}", node)
-
-def handle_assign_var(node, scope):
-    name = node.children[0].value
-    val = eval_node(node.children[1], scope)
-    scope.set(name, val)
-    return val
-
-def handle_assign_destructure(node, scope):
-    expr_node = node.children[-1]
-    var_tokens = node.children[:-1]
-    val = eval_node(expr_node, scope)
-    if val.type != "List":
-        raise ArkRuntimeError(f"Destructuring expects List, got {val.type}", node)
-    items = val.val
-    if len(items) < len(var_tokens):
-        raise ArkRuntimeError(f"Not enough items to destructure: needed {len(var_tokens)}, got {len(items)}", node)
-    for i, token in enumerate(var_tokens):
-        scope.set(token.value, items[i])
-    return val
-
-def handle_assign_attr(node, scope):
-    obj = eval_node(node.children[0], scope)
-    attr = node.children[1].value
-    val = eval_node(node.children[2], scope)
-    if obj.type == "Instance":
-        obj.val.fields[attr] = val
-        return val
-    raise ArkRuntimeError(f"Cannot set attribute on {obj.type}", node)
-
-def handle_get_attr(node, scope):
-    obj = eval_node(node.children[0], scope)
-    attr = node.children[1].value
-    if obj.type == "Namespace":
-        new_path = f"{obj.val}.{attr}"
-        if new_path in INTRINSICS:
-            return ArkValue(new_path, "Intrinsic")
-        return ArkValue(new_path, "Namespace")
-    if obj.type == "Instance":
-        if attr in obj.val.fields:
-            return obj.val.fields[attr]
-        klass = obj.val.klass
-        if klass and attr in klass.methods:
-            method = klass.methods[attr]
-            return ArkValue((method, obj), "BoundMethod")
-    if obj.type == "Class":
-        if attr in obj.val.methods:
-            return ArkValue(obj.val.methods[attr], "Function")
-    raise ArkRuntimeError(f"Attribute {attr} not found on {obj.type}", node)
-
-def handle_call_expr(node, scope):
-    # This handler might be re-entered after TCO loop or normally
-    try:
-        func_val = eval_node(node.children[0], scope)
-        args = []
-        arg_list_node = None
-        if len(node.children) > 1:
-            arg_list_node = node.children[1]
-            if hasattr(arg_list_node, "children"):
-                args = [eval_node(c, scope) for c in arg_list_node.children]
-        
-        if func_val.type == "Intrinsic":
-            intrinsic_name = func_val.val
-            if intrinsic_name in LINEAR_SPECS:
-                consumed_indices = LINEAR_SPECS[intrinsic_name]
-                if arg_list_node and hasattr(arg_list_node, "children"):
-                    for idx in consumed_indices:
-                        if idx < len(arg_list_node.children):
-                            arg_node = arg_list_node.children[idx]
-                            if hasattr(arg_node, "data") and arg_node.data == "var":
-                                var_name = arg_node.children[0].value
-                                scope.mark_moved(var_name)
-
-            if intrinsic_name in INTRINSICS_WITH_SCOPE:
-                return INTRINSICS[func_val.val](args, scope)
-            return INTRINSICS[func_val.val](args)
-
-        if func_val.type == "Function":
-            return call_user_func(func_val.val, args)
-
-        if func_val.type == "Class":
-            return instantiate_class(func_val.val, args)
-
-        if func_val.type == "BoundMethod":
-            method, instance = func_val.val
-            return call_user_func(method, args, instance)
-
-        raise ArkRuntimeError(f"Not callable: {func_val.type}", node)
-
-    except ArkRuntimeError as e:
-        # Annotate with call site info if available and needed?
-        # The ArkRuntimeError already has the inner node.
-        # We could add a frame here if we want to trace calls.
-        # But call_user_func handles the recursion loop.
-        # This handle_call_expr is the CALLER side.
-        # So yes, we can add a frame here.
-        func_name = "<unknown>"
-        try:
-            if func_val.type == "Function":
-                func_name = func_val.val.name
-            elif func_val.type == "BoundMethod":
-                func_name = func_val.val[0].name
-        except Exception:
-            pass
-
-        line = getattr(node, 'line', None)
-        if line is None and hasattr(node, 'meta'):
-            line = getattr(node.meta, 'line', None)
-        col = getattr(node, 'column', None)
-        if col is None and hasattr(node, 'meta'):
-            col = getattr(node.meta, 'column', None)
-        e.add_frame(line, col, func_name)
-        raise
+# Parsed module trees by absolute path, with the mtime they were read at.
+_MODULE_TREES = {}
 
-def handle_number(node, scope):
-    return ArkValue(int(node.children[0].value), "Integer")
+# Module trees are also pickled to disk, keyed on a hash of the source, the
+# grammar and the Lark version, so a new process skips the LALR parse of any
+# module it has seen before. ARK_TREE_CACHE may name another directory, or
+# "0" to turn the disk cache off.
+TREE_CACHE_DIR = os.environ.get("ARK_TREE_CACHE") or os.path.join(os.path.expanduser("~"), ".ark_cache")
+if TREE_CACHE_DIR == "0":
+    TREE_CACHE_DIR = None
+_TREE_CACHE_SALT = hashlib.sha1((ARK_GRAMMAR + lark.__version__).encode("utf-8")).digest()
 
-def handle_string(node, scope):
+
+def _parse_module(code):
+    if not TREE_CACHE_DIR:
+        return ARK_PARSER.parse(code)
+    digest = hashlib.sha1(_TREE_CACHE_SALT + code.encode("utf-8")).hexdigest()
+    path = os.path.join(TREE_CACHE_DIR, digest + ".pkl")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+    tree = ARK_PARSER.parse(code)
+    # Pickled before evaluation, while the tree carries no compiled code.
+    # A cache that cannot be written is skipped; the parse already succeeded.
     try:
-        s = ast.literal_eval(node.children[0].value)
-    except (ValueError, SyntaxError):
-        s = node.children[0].value[1:-1]
-    return ArkValue(s, "String")
-
-def handle_binop(node, scope):
-    left = eval_node(node.children[0], scope)
-    right = eval_node(node.children[1], scope)
-
-    # Assertions
-    if node.data == "add":
-        if not (left.type in ("Integer", "String", "List") and right.type in ("Integer", "String", "List")):
-             # Actually Ark supports Int+Int, Str+Str, List+List?
-             pass
-
-    return eval_binop(node.data, left, right)
-
-def handle_list_cons(node, scope):
-    items = []
-    if node.children:
-        child = node.children[0]
-        if hasattr(child, "data") and child.data == "expr_list":
-            items = [eval_node(c, scope) for c in child.children]
-    return ArkValue(items, "List")
-
-def handle_get_item(node, scope):
-    collection = eval_node(node.children[0], scope)
-    index_val = eval_node(node.children[1], scope)
-    if index_val.type != "Integer":
-        raise ArkRuntimeError(f"Index must be Integer, got {index_val.type}", node)
-    idx = index_val.val
-
-    if collection.type == "List":
-        if idx < 0 or idx >= len(collection.val):
-            raise ArkRuntimeError(f"List index out of range: {idx}", node)
-        return collection.val[idx]
-    if collection.type == "String":
-        if idx < 0 or idx >= len(collection.val):
-            raise ArkRuntimeError(f"String index out of range: {idx}", node)
-        return ArkValue(collection.val[idx], "String")
-    if collection.type == "Buffer":
-        if idx < 0 or idx >= len(collection.val):
-            raise ArkRuntimeError(f"Buffer index out of range: {idx}", node)
-        return ArkValue(int(collection.val[idx]), "Integer")
-    raise ArkRuntimeError(f"Cannot index type {collection.type}", node)
+        os.makedirs(TREE_CACHE_DIR, mode=0o700, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+    return tree
 
-def handle_import(node, scope):
-    parts = [t.value for t in node.children]
+# Resolved module paths by (cwd, dotted name); the sandbox check on a path
+# only depends on those two, so repeated imports skip it.
+_IMPORT_PATHS = {}
 
+
+def _resolve_import(parts, node):
     # Security: Restrict imports to CWD and lib/
     cwd = os.getcwd()
+    key = (cwd, tuple(parts))
+    abs_path = _IMPORT_PATHS.get(key)
+    if abs_path is not None:
+        return abs_path
 
     if parts[0] == "std":
         rel_path = os.path.join(cwd, "lib", *parts) + ".ark"
@@ -439,31 +299,56 @@ def handle_import(node, scope):
     except Exception as e:
          raise ArkRuntimeError(f"Import Error: Invalid path resolution: {e}", node)
 
-    if not os.path.exists(abs_path):
-        raise ArkRuntimeError(f"Import Error: Module {'.'.join(parts)} not found at {abs_path}", node)
+    _IMPORT_PATHS[key] = abs_path
+    return abs_path
+
 
+def _loaded_imports(scope):
+    # The registry lives on the root scope: each program run starts from a
+    # fresh root and loads its modules once, independently of earlier runs.
     root = scope
-    while root.parent:
-        root = root.parent
-    
-    if "__loaded_imports__" not in root.vars:
-        root.vars["__loaded_imports__"] = ArkValue(set(), "Set")
-    
-    loaded_set = root.vars["__loaded_imports__"].val
-    
+    parent = root.parent
+    while parent is not None:
+        root = parent
+        parent = root.parent
+    registry = root.vars.get("__loaded_imports__")
+    if registry is None:
+        registry = root.vars["__loaded_imports__"] = ArkValue(set(), "Set")
+    return registry.val
+
+
+def handle_import(node, scope):
+    parts = [t.value for t in node.children]
+    abs_path = _resolve_import(parts, node)
+
+    # An already-loaded module returns before touching the filesystem.
+    loaded_set = _loaded_imports(scope)
     if abs_path in loaded_set:
-        return ArkValue(None, "Unit")
-    
+        return UNIT_VALUE
+
+    if not os.path.exists(abs_path):
+        raise ArkRuntimeError(f"Import Error: Module {'.'.join(parts)} not found at {abs_path}", node)
+
     loaded_set.add(abs_path)
 
+    # Reuse the parsed (and already compiled) tree while the file is
+    # unchanged, e.g. when a fresh root scope imports the same module again.
+    code = None
     try:
-        with open(abs_path, "r", encoding="utf-8") as f:
-            code = f.read()
+        stamp = os.stat(abs_path).st_mtime_ns
+        cached = _MODULE_TREES.get(abs_path)
+        if cached is None or cached[0] != stamp:
+            with open(abs_path, "r", encoding="utf-8") as f:
+                code = f.read()
     except Exception as e:
         raise ArkRuntimeError(f"Import Error: Failed to read module {'.'.join(parts)}: {e}", node)
     
     try:
-        tree = ARK_PARSER.parse(code)
+        if code is None:
+            tree = cached[1]
+        else:
+            tree = _parse_module(code)
+            _MODULE_TREES[abs_path] = (stamp, tree)
         eval_node(tree, scope)
     except Exception as e:
         # Wrap parser errors to prevent leakage
@@ -474,39 +359,45 @@ def handle_import(node, scope):
 
 # ─── Node Handler Registry ───────────────────────────────────────────────────
 
+def _run_compiled(node, scope):
+    # Kinds lowered by ark_compile run their memoized closure; the entry keeps
+    # NODE_HANDLERS complete for callers that dispatch on it directly.
+    return compile_node(node)(scope)
+
+
 NODE_HANDLERS = {
-    "start": handle_block,
-    "block": handle_block,
-    "flow_stmt": handle_flow_stmt,
-    "function_def": handle_function_def,
-    "class_def": handle_class_def,
-    "struct_init": handle_struct_init,
-    "return_stmt": handle_return_stmt,
-    "if_stmt": handle_if_stmt,
-    "while_stmt": handle_while_stmt,
-    "logical_or": handle_logical_or,
-    "logical_and": handle_logical_and,
-    "var": handle_var,
-    "assign_var": handle_assign_var,
-    "assign_destructure": handle_assign_destructure,
-    "assign_attr": handle_assign_attr,
-    "get_attr": handle_get_attr,
-    "call_expr": handle_call_expr,
-    "number": handle_number,
-    "string": handle_string,
-    "add": handle_binop,
-    "sub": handle_binop,
-    "mul": handle_binop,
-    "div": handle_binop,
-    "mod": handle_binop,
-    "lt": handle_binop,
-    "gt": handle_binop,
-    "le": handle_binop,
-    "ge": handle_binop,
-    "eq": handle_binop,
-    "neq": handle_binop,
-    "list_cons": handle_list_cons,
-    "get_item": handle_get_item,
+    "start": _run_compiled,
+    "block": _run_compiled,
+    "flow_stmt": _run_compiled,
+    "function_def": _run_compiled,
+    "class_def": _run_compiled,
+    "struct_init": _run_compiled,
+    "return_stmt": _run_compiled,
+    "if_stmt": _run_compiled,
+    "while_stmt": _run_compiled,
+    "logical_or": _run_compiled,
+    "logical_and": _run_compiled,
+    "var": _run_compiled,
+    "assign_var": _run_compiled,
+    "assign_destructure": _run_compiled,
+    "assign_attr": _run_compiled,
+    "get_attr": _run_compiled,
+    "call_expr": _run_compiled,
+    "number": _run_compiled,
+    "string": _run_compiled,
+    "add": _run_compiled,
+    "sub": _run_compiled,
+    "mul": _run_compiled,
+    "div": _run_compiled,
+    "mod": _run_compiled,
+    "lt": _run_compiled,
+    "gt": _run_compiled,
+    "le": _run_compiled,
+    "ge": _run_compiled,
+    "eq": _run_compiled,
+    "neq": _run_compiled,
+    "list_cons": _run_compiled,
+    "get_item": _run_compiled,
     "import_stmt": handle_import,
 }
 
@@ -515,19 +406,16 @@ def eval_node(node, scope):
     if node is None: return UNIT_VALUE
 
     try:
-        if hasattr(node, "data"):
-            handler = NODE_HANDLERS.get(node.data)
-            if handler:
-                return handler(node, scope)
-        return UNIT_VALUE
-    except ReturnException:
-        raise
-    except TailCall:
-        raise
-    except ArkRuntimeError:
-        raise
-    except SandboxViolation:
-        # Pass-through security exceptions unwrapped
+        # The node is lowered to a closure on first visit (ark_compile) and
+        # the closure is kept on the node; every later visit reads it back
+        # directly and makes a single call.
+        try:
+            code = node._ark_code
+        except AttributeError:
+            code = compile_node(node)
+        return code(scope)
+    except (ReturnException, TailCall, ArkRuntimeError, SandboxViolation):
+        # Control flow and security exceptions pass through unwrapped
         raise
     except Exception as e:
         # Catch unexpected Python errors (like ZeroDivisionError) and wrap them
@@ -537,6 +425,38 @@ def eval_node(node, scope):
 MAX_RECURSION_DEPTH = 1000
 _recursion_depth = 0
 
+# Free list of call frames per function body (FrameCode.pool). A frame whose
+# scope was never captured by a closure is dead once its call returns, so it
+# is cleared and reused by the next call of the same body: the slot layout is
+# already right and only the parent needs rebinding. list.pop/append are
+# atomic, so the runtime and worker threads can share a pool.
+FRAME_POOL_SIZE = 64
+
+
+def _acquire_scope(parent, frame):
+    # An empty pool is the normal case inside recursion (every active call
+    # holds its own frame), so test for it instead of paying for an
+    # IndexError per call.
+    pool = frame.pool
+    if not pool:
+        return OptimizedScope(parent, frame.layout)
+    try:
+        scope = pool.pop()
+    except IndexError:
+        # Another thread took the last frame after the check.
+        return OptimizedScope(parent, frame.layout)
+    scope.parent = parent
+    return scope
+
+
+def _release_scope(scope, frame):
+    if scope.captured:
+        return
+    pool = frame.pool
+    if len(pool) < FRAME_POOL_SIZE:
+        scope.clear()
+        pool.append(scope)
+
 def call_user_func(func: ArkFunction, args: List[ArkValue], instance: Optional[ArkValue] = None):
     global _recursion_depth
     if _recursion_depth > MAX_RECURSION_DEPTH:
@@ -549,38 +469,61 @@ def call_user_func(func: ArkFunction, args: List[ArkValue], instance: Optional[A
     current_instance = instance
 
     try:
+        # Hot plain functions are handed to the integer JIT. A None result
+        # means the call left the compiled subset; interpret it as usual.
+        jit = func.jit_code
+        if jit is None and instance is None:
+            func.call_count += 1
+            if func.call_count >= JIT_THRESHOLD:
+                jit = func.jit_code = compile_function(func) or False
+        if jit:
+            result = jit(args, MAX_RECURSION_DEPTH - _recursion_depth + 1)
+            if result is not None:
+                return result
+
         # Loop for TCO
         while True:
-            # Use OptimizedScope with caching
-            func_scope = OptimizedScope(current_func.closure)
+            # Use OptimizedScope with caching, laid out for this body's slots
+            frame = compile_body(current_func)
+            func_scope = _acquire_scope(current_func.closure, frame)
+            slots = func_scope.slots
 
-            # Inject current function for TCO detection in return statements
-            func_scope.set("__current_func__", ArkValue(current_func, "Function"))
+            # Lets returns compiled by name detect a self tail call.
+            func_scope.func = current_func
 
             if current_instance:
-                func_scope.set("this", current_instance)
+                slots[SLOT_THIS] = current_instance
 
-            for i, param in enumerate(current_func.params):
-                if i < len(current_args):
-                    func_scope.set(param, current_args[i])
+            # Arguments bind positionally; missing arguments stay unbound
+            # and extra ones are ignored, as with zip().
+            if len(current_args) == frame.packed_arity:
+                slots[SLOT_ARGS:frame.args_end] = current_args
+            else:
+                for slot, arg in zip(frame.param_slots, current_args):
+                    slots[slot] = arg
 
             try:
-                eval_node(current_func.body, func_scope)
-                return UNIT_VALUE
+                if frame.code(func_scope) is not RETURNED:
+                    return UNIT_VALUE
+                tail = func_scope.tail
+                if tail is None:
+                    return func_scope.result
             except TailCall as tc:
-                # Unwind stack frame for tail call
-                current_func = tc.func
-                current_args = tc.args
-                # Reset instance if needed, but for self-recursion it's same or handled?
-                # If tc.func is same as current_func, instance is preserved if it's bound.
-                # But if we are calling a method on self, 'this' is in scope.
-                # If we pass 'this' explicitly?
-                # Ark methods implicitly bind.
-                # If we are in TCO, we are just looping.
-                # We assume strict self-recursion on same function object.
-                continue
+                # Tail calls from code compiled by name, e.g. run by sys.vm.eval.
+                tail = (tc.func, tc.args)
             except ReturnException as ret:
+                # Returns from code compiled by name, e.g. run by sys.vm.eval.
                 return ret.value
+            finally:
+                _release_scope(func_scope, frame)
+
+            # Tail call: loop instead of nesting a Python frame. A method
+            # recursing into itself keeps its instance; any other callee is a
+            # plain function call and must not see the caller's `this`.
+            next_func, current_args = tail
+            if next_func is not current_func:
+                current_instance = None
+            current_func = next_func
     finally:
         _recursion_depth -= 1
 
@@ -591,24 +534,22 @@ def instantiate_class(klass: ArkClass, _args: List[ArkValue]):
 
 
 def eval_block(nodes, scope):
-    last = UNIT_VALUE
-    try:
-        for n in nodes:
-            last = eval_node(n, scope)
-    except ReturnException:
-        raise
-    return last
+    # Runs a statement sequence through the compiled closures, wrapping errors
+    # against the statement that raised them, exactly as eval_node would.
+    return compile_statements(nodes)(scope)
 
 
 def is_truthy(val):
-    if val.type == "Boolean": return val.val
-    if val.type == "Integer": return val.val != 0
-    if val.type == "String": return len(val.val) > 0
-    if val.type == "List": return True
-    return False
+    # Compiled conditions test Booleans inline and only call this for other
+    # types, so the tag is read once and the cases stay a short cascade.
+    t = val.type
+    if t == "Boolean": return val.val
+    if t == "Integer": return val.val != 0
+    if t == "String": return len(val.val) > 0
+    return t == "List"
 
 
-def eval_binop(op, left, right):
+def _reject_operands(op, left, right):
     # GCD Epistemic Firewall: Censored values cannot participate in arithmetic.
     # They must be explicitly unwrapped via pattern matching (match Finite/Censored).
     # This is the data-layer analog of Ark's linear types preventing double-spend.
@@ -618,35 +559,102 @@ def eval_binop(op, left, right):
             f"Operands: {left.type} {op} {right.type}. "
             f"Use pattern matching to unwrap: match gcd.evaluate_return() {{ Finite(v) => ... | Censored => ... }}"
         )
+
+
+def _binop_add(left, right):
+    lt = left.type
+    rt = right.type
+    if lt == "Integer" and rt == "Integer":
+        v = left.val + right.val
+        if type(v) is int and -5 <= v <= 256:
+            return SMALL_INTS[v + 5]
+        return ArkValue(v, "Integer")
+    _reject_operands("add", left, right)
     l = left.val
     r = right.val
-    if op == "add":
-        if left.type == "String" or right.type == "String":
-            if not isinstance(l, RopeString):
-                l = RopeString(str(l))
-            return ArkValue(l + r, "String")
+    if lt == "String" or rt == "String":
+        if not isinstance(l, RopeString):
+            l = RopeString(str(l))
+        return ArkValue(l + r, "String")
+    # Other operand types fall through to Python's +, tagged as before.
+    return ArkValue(l + r, "Integer")
+
+
+def _arith(op, fn):
+    def binop(left, right):
         if left.type != "Integer" or right.type != "Integer":
-             # Should we allow List concat?
-             # Original code implied string/integer only.
-             # Strictness.
-             pass
-        return ArkValue(l + r, "Integer")
-
-    # Check types for arithmetic
-    if op in ("sub", "mul", "div", "mod"):
-         if left.type != "Integer" or right.type != "Integer":
-              raise ArkRuntimeError(f"Operator {op} requires Integers, got {left.type} and {right.type}")
-
-    if op == "sub": return ArkValue(l - r, "Integer")
-    if op == "mul": return ArkValue(l * r, "Integer")
-    if op == "div": return ArkValue(l // r, "Integer")
-    if op == "mod": return ArkValue(l % r, "Integer")
-
-    # Comparisons
-    if op == "lt": return ArkValue(l < r, "Boolean")
-    if op == "gt": return ArkValue(l > r, "Boolean")
-    if op == "le": return ArkValue(l <= r, "Boolean")
-    if op == "ge": return ArkValue(l >= r, "Boolean")
-    if op == "eq": return ArkValue(l == r, "Boolean")
-    if op == "neq": return ArkValue(l != r, "Boolean")
-    return UNIT_VALUE
+            _reject_operands(op, left, right)
+            raise ArkRuntimeError(f"Operator {op} requires Integers, got {left.type} and {right.type}")
+        v = fn(left.val, right.val)
+        if type(v) is int and -5 <= v <= 256:
+            return SMALL_INTS[v + 5]
+        return ArkValue(v, "Integer")
+    return binop
+
+
+def _compare(op, fn):
+    def binop(left, right):
+        if left.type == "Censored" or right.type == "Censored":
+            _reject_operands(op, left, right)
+        return TRUE_VALUE if fn(left.val, right.val) else FALSE_VALUE
+    return binop
+
+
+# Operator table. Each entry is resolved once per binop node when the node is
+# compiled, so evaluation calls the operator directly instead of walking a
+# chain of string comparisons on the operator name.
+BINOPS = {
+    "add": _binop_add,
+    "sub": _arith("sub", operator.sub),
+    "mul": _arith("mul", operator.mul),
+    "div": _arith("div", operator.floordiv),
+    "mod": _arith("mod", operator.mod),
+    "lt": _compare("lt", operator.lt),
+    "gt": _compare("gt", operator.gt),
+    "le": _compare("le", operator.le),
+    "ge": _compare("ge", operator.ge),
+    "eq": _compare("eq", operator.eq),
+    "neq": _compare("neq", operator.ne),
+}
+
+
+# Raw Integer/Integer operators. eval_binop is the generic entry point (the
+# Python-AST backend in compile.py calls it for every operator), so the common
+# Integer pair is handled inline rather than through the BINOPS closure.
+_INT_ARITH = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": operator.floordiv,
+    "mod": operator.mod,
+}
+_INT_COMPARE = {
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "le": operator.le,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "neq": operator.ne,
+}
+
+
+def eval_binop(op, left, right):
+    if left.type == "Integer" and right.type == "Integer":
+        fn = _INT_ARITH.get(op)
+        if fn is not None:
+            v = fn(left.val, right.val)
+            if type(v) is int and -5 <= v <= 256:
+                return SMALL_INTS[v + 5]
+            return ArkValue(v, "Integer")
+        fn = _INT_COMPARE.get(op)
+        if fn is not None:
+            return TRUE_VALUE if fn(left.val, right.val) else FALSE_VALUE
+    binop = BINOPS.get(op)
+    if binop is None:
+        _reject_operands(op, left, right)
+        return UNIT_VALUE
+    return binop(left, right)
+
+
+bind_runtime(ArkRuntimeError, TailCall, call_user_func, instantiate_class,
+             BINOPS, is_truthy, NODE_HANDLERS)
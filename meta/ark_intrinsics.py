@@ -10,6 +10,7 @@ import re
 import time
 import math
 import json
+import operator
 import shlex
 import subprocess
 import hashlib
@@ -21,17 +22,19 @@ import urllib.request
 import urllib.error
 import urllib.parse
 import queue
-import secrets
 import hmac
+import itertools
+import selectors
+from collections import deque
+from email.utils import formatdate
+from functools import lru_cache
+from http import HTTPStatus
 from typing import List, Optional
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 try:
     from meta.ark_types import (
-        ArkValue, UNIT_VALUE, ArkFunction, ArkClass, ArkInstance, Scope,
-        ReturnException, RopeString
+        ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ArkFunction, ArkClass,
+        ArkInstance, Scope, ReturnException, RopeString
     )
     from meta.ark_security import (
         SandboxViolation, check_path_security, check_exec_security,
@@ -40,8 +43,8 @@ try:
     )
 except ModuleNotFoundError:
     from ark_types import (
-        ArkValue, UNIT_VALUE, ArkFunction, ArkClass, ArkInstance, Scope,
-        ReturnException, RopeString
+        ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE, SMALL_INTS, ArkFunction, ArkClass,
+        ArkInstance, Scope, ReturnException, RopeString
     )
     from ark_security import (
         SandboxViolation, check_path_security, check_exec_security,
@@ -53,6 +56,7 @@ except ModuleNotFoundError:
 # --- Global Event Queue ---
 EVENT_QUEUE = queue.Queue()
 ARK_AI_MODE = None
+ARK_AI_KEY = None  # GOOGLE_API_KEY as seen when ARK_AI_MODE was detected
 
 
 # ─── Core Intrinsics ─────────────────────────────────────────────────────────
@@ -71,6 +75,13 @@ def core_get(args: List[ArkValue]):
         raise Exception("get() expects two arguments: list/string and index")
     collection = args[0].val
     index = args[1].val
+    # Fast path: an in-range int index into a plain list of ArkValues. Anything
+    # else falls through to the checked path, which raises the same errors.
+    if type(collection) is list and type(index) is int and 0 <= index < len(collection):
+        val = collection[index]
+        if isinstance(val, ArkValue):
+            return val
+        return ArkValue(val, "Any")
     if not isinstance(index, int):
         raise Exception("Index must be an integer")
     if not isinstance(collection, (str, list, RopeString)):
@@ -92,16 +103,16 @@ def core_get(args: List[ArkValue]):
 # ─── Command Whitelist ────────────────────────────────────────────────────────
 
 def load_whitelist():
-    default_whitelist = {
+    default_whitelist = frozenset({
         "ls", "grep", "cat", "echo",
         "date", "whoami", "pwd", "mkdir", "touch"
-    }
+    })
     if os.path.exists("security.json"):
         try:
             with open("security.json", "r") as f:
                 config = json.load(f)
                 if "whitelist" in config:
-                    return set(config["whitelist"])
+                    return frozenset(config["whitelist"])
         except Exception as e:
             print(f"Warning: Failed to load security.json: {e}", file=sys.stderr)
     return default_whitelist
@@ -111,6 +122,10 @@ COMMAND_WHITELIST = load_whitelist()
 
 # ─── System Intrinsics ────────────────────────────────────────────────────────
 
+# Characters that make shlex differ from a plain whitespace split: quotes, the
+# escape character, and whitespace that str.split() knows but shlex does not.
+_EXEC_SHLEX_CHARS = frozenset("'\"\\\x0b\x0c\x1c\x1d\x1e\x1f")
+
 def sys_exec(args: List[ArkValue]):
     if not args or args[0].type != "String":
         raise Exception("sys.exec expects a string command")
@@ -119,20 +134,28 @@ def sys_exec(args: List[ArkValue]):
     if not command_str:
         return ArkValue("", "String")
 
-    try:
-        cmd_args = shlex.split(command_str, posix=(os.name != 'nt'))
-    except Exception as e:
-        return ArkValue(f"Security Error: Failed to parse command: {e}", "String")
+    # Commands without quotes, escapes or unusual whitespace tokenize the same
+    # under str.split() as under shlex, which costs far more than the
+    # capability check below.
+    if command_str.isascii() and _EXEC_SHLEX_CHARS.isdisjoint(command_str):
+        cmd_args = command_str.split()
+    else:
+        try:
+            cmd_args = shlex.split(command_str, posix=(os.name != 'nt'))
+        except Exception as e:
+            return ArkValue(f"Security Error: Failed to parse command: {e}", "String")
 
     if not cmd_args:
         return ArkValue("", "String")
 
     base_cmd = cmd_args[0]
 
-    # Capability check: require 'exec' capability for non-whitelisted commands
-    if not has_capability("exec") and not has_capability("all"):
-        if base_cmd not in COMMAND_WHITELIST:
-            raise SandboxViolation(f"Command '{base_cmd}' is not in the whitelist. Set ARK_CAPABILITIES=exec or ALLOW_DANGEROUS_LOCAL_EXECUTION=true to bypass.")
+    # Capability check: require 'exec' capability for non-whitelisted commands.
+    # The whitelist is tested first, so whitelisted commands skip the capability
+    # lookup; has_capability already honours "all". Capabilities are read on
+    # every call rather than cached, so revoking one takes effect at once.
+    if base_cmd not in COMMAND_WHITELIST and not has_capability("exec"):
+        raise SandboxViolation(f"Command '{base_cmd}' is not in the whitelist. Set ARK_CAPABILITIES=exec or ALLOW_DANGEROUS_LOCAL_EXECUTION=true to bypass.")
 
     try:
         result = subprocess.run(
@@ -195,8 +218,10 @@ def sys_fs_write_buffer(args: List[ArkValue]):
     check_path_security(path, is_write=True)
     buf = args[1].val
     try:
+        # The whole payload goes out in one write; anything larger than the
+        # file buffer is passed straight to the OS, so no copy is needed.
         with open(path, "wb") as f:
-            f.write(bytes(buf))
+            f.write(buf)
         return ArkValue(True, "Boolean")
     except Exception as e:
         print(f"Write Buffer Error: {e}", file=sys.stderr)
@@ -361,25 +386,37 @@ def gcd_normalize(args: List[ArkValue]):
 # Tensors are ArkValue(Instance) with fields: data (flat ArkValue List), shape (dim List)
 # Used by: tests/test_tensor.ark
 
-def _make_tensor(flat_data, shape):
-    """Helper: build an ArkValue tensor struct from a flat Python list and shape list."""
-    data_ark = ArkValue([ArkValue(v, "Integer") for v in flat_data], "List")
-    shape_ark = ArkValue([ArkValue(s, "Integer") for s in shape], "List")
+def _box_ints(values):
+    """Helper: box raw ints as Integer ArkValues, sharing the small ones."""
+    small = SMALL_INTS
+    return [small[v + 5] if type(v) is int and -5 <= v <= 256 else ArkValue(v, "Integer")
+            for v in values]
+
+def _wrap_tensor(items, shape):
+    """Helper: build a tensor struct around an already boxed flat element list."""
+    shape_ark = ArkValue(_box_ints(shape), "List")
     inst = ArkInstance.__new__(ArkInstance)
-    inst.fields = {"data": data_ark, "shape": shape_ark}
+    inst.fields = {"data": ArkValue(items, "List"), "shape": shape_ark}
     return ArkValue(inst, "Instance")
 
-def _extract_tensor(ark_val):
-    """Helper: extract (flat_python_list, shape_python_list) from an ArkValue tensor."""
+def _make_tensor(flat_data, shape):
+    """Helper: build an ArkValue tensor struct from a flat Python list and shape list."""
+    return _wrap_tensor(_box_ints(flat_data), shape)
+
+def _tensor_items(ark_val):
+    """Helper: (boxed flat element list, shape python list) of an ArkValue tensor."""
     if ark_val.type != "Instance":
         raise Exception(f"Expected tensor (Instance), got {ark_val.type}")
     data_ark = ark_val.val.fields.get("data")
     shape_ark = ark_val.val.fields.get("shape")
     if data_ark is None or shape_ark is None:
         raise Exception("Tensor must have 'data' and 'shape' fields")
-    data = [v.val for v in data_ark.val]
-    shape = [v.val for v in shape_ark.val]
-    return data, shape
+    return data_ark.val, [v.val for v in shape_ark.val]
+
+def _extract_tensor(ark_val):
+    """Helper: extract (flat_python_list, shape_python_list) from an ArkValue tensor."""
+    items, shape = _tensor_items(ark_val)
+    return [v.val for v in items], shape
 
 def math_tensor(args: List[ArkValue]):
     """math.Tensor(data: List, shape: List) → Tensor struct"""
@@ -387,9 +424,41 @@ def math_tensor(args: List[ArkValue]):
         raise Exception("math.Tensor expects data(list) and shape(list)")
     if args[0].type != "List" or args[1].type != "List":
         raise Exception("math.Tensor expects List arguments")
-    data = [v.val for v in args[0].val]
+    # Integer elements are already boxed and immutable, so the tensor shares
+    # them with the source list instead of holding a second copy of each.
+    small = SMALL_INTS
+    data = [v if v.type == "Integer" else
+            small[v.val + 5] if type(v.val) is int and -5 <= v.val <= 256 else ArkValue(v.val, "Integer")
+            for v in args[0].val]
     shape = [v.val for v in args[1].val]
-    return _make_tensor(data, shape)
+    return _wrap_tensor(data, shape)
+
+# Inner product of two equal-length sequences. math.sumprod (3.12+) runs the
+# loop in C and is exact for ints; older interpreters fall back to map().
+try:
+    _sumprod = math.sumprod
+except AttributeError:
+    def _sumprod(p, q):
+        return sum(map(operator.mul, p, q))
+
+# Small matmuls are dispatched to a kernel generated once per (m, k, n): the
+# whole product is a single list display of unrolled sums over a and b, so no
+# rows or columns are sliced and no per-cell call is made.
+_MM_UNROLL_MAX = 8
+_MM_KERNELS = {}
+
+def _matmul_kernel(m, k, n):
+    key = (m, k, n)
+    fn = _MM_KERNELS.get(key)
+    if fn is None:
+        cells = ", ".join(
+            " + ".join(f"a[{i * k + p}] * b[{p * n + j}]" for p in range(k))
+            for i in range(m) for j in range(n)
+        )
+        namespace = {}
+        exec(compile(f"def kernel(a, b):\n    return [{cells}]\n", f"<matmul {m}x{k}x{n}>", "exec"), namespace)
+        fn = _MM_KERNELS[key] = namespace["kernel"]
+    return fn
 
 def math_matmul(args: List[ArkValue]):
     """math.matmul(A, B) → Tensor.  A=[m,k], B=[k,n] → C=[m,n]"""
@@ -403,70 +472,75 @@ def math_matmul(args: List[ArkValue]):
     k2, n = b_shape
     if k != k2:
         raise Exception(f"math.matmul dimension mismatch: {k} vs {k2}")
-    result = []
-    for i in range(m):
-        for j in range(n):
-            s = 0
-            for p in range(k):
-                s += a_data[i * k + p] * b_data[p * n + j]
-            result.append(s)
+    if 0 < m <= _MM_UNROLL_MAX and 0 < k <= _MM_UNROLL_MAX and 0 < n <= _MM_UNROLL_MAX:
+        return _make_tensor(_matmul_kernel(m, k, n)(a_data, b_data), [m, n])
+    # B is split into its columns once; each cell is then one inner product
+    # over a row/column pair rather than a Python-level inner loop.
+    # Values stay Python ints, so products never overflow.
+    rows = [a_data[i * k:(i + 1) * k] for i in range(m)]
+    cols = [b_data[j::n] for j in range(n)]
+    result = [_sumprod(row, col) for row in rows for col in cols]
     return _make_tensor(result, [m, n])
 
 def math_transpose(args: List[ArkValue]):
     """math.transpose(T) → Tensor.  T=[m,n] → T'=[n,m]"""
     if len(args) != 1:
         raise Exception("math.transpose expects 1 tensor")
-    data, shape = _extract_tensor(args[0])
+    items, shape = _tensor_items(args[0])
     if len(shape) != 2:
         raise Exception("math.transpose expects a 2D tensor")
     m, n = shape
-    result = []
-    for j in range(n):
-        for i in range(m):
-            result.append(data[i * n + j])
-    return _make_tensor(result, [n, m])
+    if len(items) < m * n:
+        raise Exception(f"math.transpose: data has {len(items)} elements, shape needs {m * n}")
+    # Column j of the input is the stride-n slice from j; it becomes row j.
+    # Elements are moved, not recomputed, so the boxed values are reused.
+    result = [v for j in range(n) for v in items[j:m * n:n]]
+    return _wrap_tensor(result, [n, m])
+
+# The element-wise operations below read the elements straight off the boxed
+# lists instead of unpacking both operands to plain lists first.
 
 def math_dot(args: List[ArkValue]):
     """math.dot(a, b) → Integer.  Element-wise multiply and sum (1D vectors)."""
     if len(args) != 2:
         raise Exception("math.dot expects 2 tensors")
-    a_data, a_shape = _extract_tensor(args[0])
-    b_data, b_shape = _extract_tensor(args[1])
-    if len(a_data) != len(b_data):
-        raise Exception(f"math.dot dimension mismatch: {len(a_data)} vs {len(b_data)}")
-    s = sum(a * b for a, b in zip(a_data, b_data))
+    a_items, a_shape = _tensor_items(args[0])
+    b_items, b_shape = _tensor_items(args[1])
+    if len(a_items) != len(b_items):
+        raise Exception(f"math.dot dimension mismatch: {len(a_items)} vs {len(b_items)}")
+    s = _sumprod([a.val for a in a_items], [b.val for b in b_items])
     return ArkValue(s, "Integer")
 
 def math_tensor_add(args: List[ArkValue]):
     """math.add(a, b) → Tensor.  Element-wise addition."""
     if len(args) != 2:
         raise Exception("math.add expects 2 tensors")
-    a_data, a_shape = _extract_tensor(args[0])
-    b_data, b_shape = _extract_tensor(args[1])
+    a_items, a_shape = _tensor_items(args[0])
+    b_items, b_shape = _tensor_items(args[1])
     if a_shape != b_shape:
         raise Exception(f"math.add shape mismatch: {a_shape} vs {b_shape}")
-    result = [a + b for a, b in zip(a_data, b_data)]
-    return _make_tensor(result, a_shape)
+    result = _box_ints([a.val + b.val for a, b in zip(a_items, b_items)])
+    return _wrap_tensor(result, a_shape)
 
 def math_tensor_sub(args: List[ArkValue]):
     """math.sub(a, b) → Tensor.  Element-wise subtraction."""
     if len(args) != 2:
         raise Exception("math.sub expects 2 tensors")
-    a_data, a_shape = _extract_tensor(args[0])
-    b_data, b_shape = _extract_tensor(args[1])
+    a_items, a_shape = _tensor_items(args[0])
+    b_items, b_shape = _tensor_items(args[1])
     if a_shape != b_shape:
         raise Exception(f"math.sub shape mismatch: {a_shape} vs {b_shape}")
-    result = [a - b for a, b in zip(a_data, b_data)]
-    return _make_tensor(result, a_shape)
+    result = _box_ints([a.val - b.val for a, b in zip(a_items, b_items)])
+    return _wrap_tensor(result, a_shape)
 
 def math_mul_scalar(args: List[ArkValue]):
     """math.mul_scalar(t, scalar) → Tensor.  Multiply every element by scalar."""
     if len(args) != 2:
         raise Exception("math.mul_scalar expects tensor and scalar")
-    data, shape = _extract_tensor(args[0])
+    items, shape = _tensor_items(args[0])
     scalar = args[1].val
-    result = [v * scalar for v in data]
-    return _make_tensor(result, shape)
+    result = _box_ints([v.val * scalar for v in items])
+    return _wrap_tensor(result, shape)
 
 
 # ─── System Utilities ─────────────────────────────────────────────────────────
@@ -496,12 +570,30 @@ def sys_str_from_code(args: List[ArkValue]):
 
 # ─── Cryptography ─────────────────────────────────────────────────────────────
 
+# The cryptography package is imported inside the intrinsics that use it, so
+# scripts that never sign, encrypt or derive keys skip its ~15 ms load.
+
+# Strings are hashed in slices of this many characters, so only one slice's
+# UTF-8 encoding is held at a time instead of a copy of the whole string.
+HASH_CHUNK_CHARS = 1 << 16
+
+def _utf8_chunks(text):
+    # A rope is read leaf by leaf rather than flattened first.
+    pieces = text.chunks() if isinstance(text, RopeString) else (text,)
+    for piece in pieces:
+        for i in range(0, len(piece), HASH_CHUNK_CHARS):
+            yield piece[i:i + HASH_CHUNK_CHARS].encode('utf-8')
+
 def sys_crypto_hash(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "String":
         raise Exception("sys.crypto.hash expects a string")
-    data = args[0].val.encode('utf-8')
-    digest = hashlib.sha256(data).hexdigest()
-    return ArkValue(digest, "String")
+    text = args[0].val
+    if type(text) is str and len(text) <= HASH_CHUNK_CHARS:
+        return ArkValue(hashlib.sha256(text.encode('utf-8')).hexdigest(), "String")
+    h = hashlib.sha256()
+    for chunk in _utf8_chunks(text):
+        h.update(chunk)
+    return ArkValue(h.hexdigest(), "String")
 
 def sys_crypto_sha512(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "String":
@@ -524,6 +616,8 @@ def sys_crypto_hmac_sha512(args: List[ArkValue]):
     except Exception as e:
         raise Exception(f"HMAC-SHA512 Error: {e}")
 
+PBKDF2_MAX_DKLEN = 1024
+
 def sys_crypto_pbkdf2_hmac_sha512(args: List[ArkValue]):
     if len(args) != 4:
         raise Exception("sys.crypto.pbkdf2_hmac_sha512 expects password, salt, iterations, dklen")
@@ -531,22 +625,50 @@ def sys_crypto_pbkdf2_hmac_sha512(args: List[ArkValue]):
     salt = str(args[1].val).encode('utf-8')
     iterations = args[2].val
     dklen = args[3].val
+    # Each 64-byte block of output reruns every iteration, so the key length is
+    # bounded up front. The derivation runs in cryptography's bundled OpenSSL,
+    # which is faster than hashlib's and also releases the GIL.
+    if type(iterations) is not int or iterations < 1:
+        raise Exception("PBKDF2 Error: iterations must be a positive integer")
+    if type(dklen) is not int or not 1 <= dklen <= PBKDF2_MAX_DKLEN:
+        raise Exception(f"PBKDF2 Error: dklen must be between 1 and {PBKDF2_MAX_DKLEN}")
     try:
-        key = hashlib.pbkdf2_hmac('sha512', password, salt, iterations, dklen)
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA512(), length=dklen, salt=salt, iterations=iterations)
+        key = kdf.derive(password)
         return ArkValue(key.hex(), "String")
     except Exception as e:
         raise Exception(f"PBKDF2 Error: {e}")
 
+def _aead_bytes(val: ArkValue, text: bool = False):
+    # Buffers are used as-is; Strings are hex (keys, nonces, ciphertext) or
+    # UTF-8 text (plaintext, aad) depending on the argument.
+    if val.type == "Buffer":
+        return val.val
+    return str(val.val).encode('utf-8') if text else bytes.fromhex(str(val.val))
+
 def sys_crypto_aes_gcm_encrypt(args: List[ArkValue]):
+    """Each argument may be a Buffer or a String (hex key/nonce, UTF-8 text).
+
+    A Buffer plaintext yields [ciphertext, tag] as Buffers, otherwise as hex Strings.
+    """
     if len(args) != 4:
         raise Exception("sys.crypto.aes_gcm_encrypt expects key(hex), nonce(hex), plaintext(utf8), aad(utf8)")
     try:
-        key = bytes.fromhex(str(args[0].val))
-        nonce = bytes.fromhex(str(args[1].val))
-        plaintext = str(args[2].val).encode('utf-8')
-        aad = str(args[3].val).encode('utf-8')
+        key = bytes(_aead_bytes(args[0]))
+        nonce = _aead_bytes(args[1])
+        plaintext = _aead_bytes(args[2], text=True)
+        aad = _aead_bytes(args[3], text=True)
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
         aesgcm = AESGCM(key)
         ciphertext_with_tag = aesgcm.encrypt(nonce, plaintext, aad)
+        if args[2].type == "Buffer":
+            view = memoryview(ciphertext_with_tag)
+            return ArkValue([
+                ArkValue(bytearray(view[:-16]), "Buffer"),
+                ArkValue(bytearray(view[-16:]), "Buffer")
+            ], "List")
         tag = ciphertext_with_tag[-16:]
         ciphertext = ciphertext_with_tag[:-16]
         return ArkValue([
@@ -557,25 +679,57 @@ def sys_crypto_aes_gcm_encrypt(args: List[ArkValue]):
         raise Exception(f"AES-GCM Encrypt Error: {e}")
 
 def sys_crypto_aes_gcm_decrypt(args: List[ArkValue]):
+    """Each argument may be a Buffer or a String (hex key/nonce/ciphertext/tag, UTF-8 aad).
+
+    A Buffer ciphertext yields the plaintext as a Buffer, otherwise as a UTF-8 String.
+    """
     if len(args) != 5:
         raise Exception("sys.crypto.aes_gcm_decrypt expects key(hex), nonce(hex), ciphertext(hex), tag(hex), aad(utf8)")
     try:
-        key = bytes.fromhex(str(args[0].val))
-        nonce = bytes.fromhex(str(args[1].val))
-        ciphertext = bytes.fromhex(str(args[2].val))
-        tag = bytes.fromhex(str(args[3].val))
-        aad = str(args[4].val).encode('utf-8')
+        key = bytes(_aead_bytes(args[0]))
+        nonce = _aead_bytes(args[1])
+        ciphertext = _aead_bytes(args[2])
+        tag = _aead_bytes(args[3])
+        aad = _aead_bytes(args[4], text=True)
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
         aesgcm = AESGCM(key)
         plaintext = aesgcm.decrypt(nonce, ciphertext + tag, aad)
+        if args[2].type == "Buffer":
+            return ArkValue(bytearray(plaintext), "Buffer")
         return ArkValue(plaintext.decode('utf-8'), "String")
     except Exception as e:
         raise Exception(f"AES-GCM Decrypt Error: {e}")
 
+# Small requests (nonces, salts) are served from a pool refilled by one
+# os.urandom call, so only the refill enters the kernel. Each byte is handed
+# out once; a forked child drops the pool so it never repeats the parent's.
+_RAND_POOL_SIZE = 4096
+_RAND_POOL = b""
+_RAND_POS = 0
+_RAND_LOCK = threading.Lock()
+
+def _reset_rand_pool():
+    global _RAND_POOL, _RAND_POS
+    _RAND_POOL, _RAND_POS = b"", 0
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rand_pool)
+
 def sys_crypto_random_bytes(args: List[ArkValue]):
+    global _RAND_POOL, _RAND_POS
     if len(args) != 1 or args[0].type != "Integer":
         raise Exception("sys.crypto.random_bytes expects length(int)")
     n = args[0].val
-    rand_bytes = secrets.token_bytes(n)
+    if n < 0:
+        raise Exception("sys.crypto.random_bytes expects a non-negative length")
+    if n >= _RAND_POOL_SIZE:
+        return ArkValue(os.urandom(n).hex(), "String")
+    with _RAND_LOCK:
+        end = _RAND_POS + n
+        if end > len(_RAND_POOL):
+            _RAND_POOL, _RAND_POS, end = os.urandom(_RAND_POOL_SIZE), 0, n
+        rand_bytes = _RAND_POOL[_RAND_POS:end]
+        _RAND_POS = end
     return ArkValue(rand_bytes.hex(), "String")
 
 def sys_math_pow_mod(args: List[ArkValue]):
@@ -600,20 +754,28 @@ def sys_crypto_merkle_root(args: List[ArkValue]):
         leaves.append(item.val)
     if not leaves:
         return ArkValue("", "String")
-    current_level = [hashlib.sha256(s.encode('utf-8')).hexdigest() for s in leaves]
-    while len(current_level) > 1:
-        next_level = []
-        for i in range(0, len(current_level), 2):
-            left = current_level[i]
-            right = current_level[i+1] if i+1 < len(current_level) else left
-            combined = (left + right).encode('utf-8')
-            next_level.append(hashlib.sha256(combined).hexdigest())
-        current_level = next_level
-    return ArkValue(current_level[0], "String")
+    # Interior nodes hash the hex digests of their children (matching the Rust
+    # core), so each level is kept as ASCII bytes and reduced in place.
+    sha256 = hashlib.sha256
+    level = [sha256(s.encode('utf-8')).hexdigest().encode('ascii') for s in leaves]
+    n = len(level)
+    while n > 1:
+        if n & 1:
+            level.append(level[n - 1])
+            n += 1
+        for i in range(0, n, 2):
+            h = sha256(level[i])
+            h.update(level[i + 1])
+            level[i >> 1] = h.hexdigest().encode('ascii')
+        n >>= 1
+        del level[n:]
+    return ArkValue(level[0].decode('ascii'), "String")
 
 def sys_crypto_ed25519_gen(args: List[ArkValue]):
     if len(args) != 0:
         raise Exception("sys.crypto.ed25519.gen expects 0 arguments")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519
     priv = ed25519.Ed25519PrivateKey.generate()
     pub = priv.public_key()
     priv_bytes = priv.private_bytes(
@@ -630,15 +792,25 @@ def sys_crypto_ed25519_gen(args: List[ArkValue]):
         ArkValue(pub_bytes.hex(), "String")
     ], "List")
 
+def _ed25519_private_key(priv_hex: str):
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+    return ed25519.Ed25519PrivateKey.from_private_bytes(bytes.fromhex(priv_hex))
+
+# Programs usually verify against a handful of keys, so parsed public keys are
+# cached by their hex encoding instead of decoded on every call. Private keys
+# are not: a process-wide cache would keep secrets alive for its lifetime.
+@lru_cache(maxsize=256)
+def _ed25519_public_key(pub_hex: str):
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+    return ed25519.Ed25519PublicKey.from_public_bytes(bytes.fromhex(pub_hex))
+
 def sys_crypto_ed25519_sign(args: List[ArkValue]):
     if len(args) != 2:
         raise Exception("sys.crypto.ed25519.sign expects msg(string) and priv(hex string)")
     msg = args[0].val.encode('utf-8')
     priv_hex = args[1].val
     try:
-        priv_bytes = bytes.fromhex(priv_hex)
-        priv = ed25519.Ed25519PrivateKey.from_private_bytes(priv_bytes)
-        sig = priv.sign(msg)
+        sig = _ed25519_private_key(priv_hex).sign(msg)
         return ArkValue(sig.hex(), "String")
     except Exception as e:
         raise Exception(f"Ed25519 Sign Error: {e}")
@@ -650,13 +822,25 @@ def sys_crypto_ed25519_verify(args: List[ArkValue]):
     sig_hex = args[1].val
     pub_hex = args[2].val
     try:
-        sig_bytes = bytes.fromhex(sig_hex)
-        pub_bytes = bytes.fromhex(pub_hex)
-        pub = ed25519.Ed25519PublicKey.from_public_bytes(pub_bytes)
-        pub.verify(sig_bytes, msg)
-        return ArkValue(True, "Boolean")
+        _ed25519_public_key(pub_hex).verify(bytes.fromhex(sig_hex), msg)
+        return TRUE_VALUE
     except Exception:
-        return ArkValue(False, "Boolean")
+        return FALSE_VALUE
+
+def sys_crypto_ed25519_verify_batch(args: List[ArkValue]):
+    """sys.crypto.ed25519.verify_batch(msgs, sigs, pubs) → Boolean.  True only if every signature verifies."""
+    if len(args) != 3 or any(a.type != "List" for a in args):
+        raise Exception("sys.crypto.ed25519.verify_batch expects msgs, sigs, pubs (Lists)")
+    msgs, sigs, pubs = (a.val for a in args)
+    if not len(msgs) == len(sigs) == len(pubs):
+        raise Exception("sys.crypto.ed25519.verify_batch expects lists of equal length")
+    # The first bad signature ends the batch.
+    try:
+        for msg, sig, pub in zip(msgs, sigs, pubs):
+            _ed25519_public_key(str(pub.val)).verify(bytes.fromhex(str(sig.val)), msg.val.encode('utf-8'))
+    except Exception:
+        return FALSE_VALUE
+    return TRUE_VALUE
 
 
 # ─── Memory & Buffer ──────────────────────────────────────────────────────────
@@ -689,6 +873,19 @@ def sys_mem_write(args: List[ArkValue]):
     buf[idx] = val
     return ArkValue(buf, "Buffer")
 
+def sys_mem_write_bulk(args: List[ArkValue]):
+    """sys.mem.write_bulk(buf, offset, src) → Buffer.  Copies all of src into buf at offset."""
+    if len(args) != 3 or args[0].type != "Buffer" or args[2].type != "Buffer":
+        raise Exception("sys.mem.write_bulk expects buffer, offset, source buffer")
+    buf = args[0].val
+    offset = args[1].val
+    src = args[2].val
+    if type(offset) is not int or offset < 0 or offset + len(src) > len(buf):
+        raise Exception(f"sys.mem.write_bulk: {len(src)} bytes do not fit at offset {offset} of {len(buf)}")
+    # Same-length slice assignment is a single memmove and never resizes buf.
+    buf[offset:offset + len(src)] = src
+    return ArkValue(buf, "Buffer")
+
 
 # ─── List & Struct ────────────────────────────────────────────────────────────
 
@@ -788,39 +985,34 @@ def sys_struct_has(args: List[ArkValue]):
 
 # ─── Logic ────────────────────────────────────────────────────────────────────
 
+# sys.and / sys.or / not only treat Integers and Booleans as truthy; for both,
+# the truth of .val is the answer, so the check is inlined below.
+_LOGIC_TRUTHY_TYPES = frozenset(("Integer", "Boolean"))
+
 def sys_and(args: List[ArkValue]):
     if len(args) != 2: raise Exception("sys.and expects 2 arguments")
-    def is_truthy(v):
-        if v.type == "Integer": return v.val != 0
-        if v.type == "Boolean": return v.val
-        return False
-    left = is_truthy(args[0])
-    right = is_truthy(args[1])
-    return ArkValue(left and right, "Boolean")
+    a, b = args
+    if a.type in _LOGIC_TRUTHY_TYPES and a.val and b.type in _LOGIC_TRUTHY_TYPES and b.val:
+        return TRUE_VALUE
+    return FALSE_VALUE
 
 def sys_or(args: List[ArkValue]):
     if len(args) != 2: raise Exception("sys.or expects 2 arguments")
-    def is_truthy(v):
-        if v.type == "Integer": return v.val != 0
-        if v.type == "Boolean": return v.val
-        return False
-    left = is_truthy(args[0])
-    right = is_truthy(args[1])
-    return ArkValue(left or right, "Boolean")
+    a, b = args
+    if (a.type in _LOGIC_TRUTHY_TYPES and a.val) or (b.type in _LOGIC_TRUTHY_TYPES and b.val):
+        return TRUE_VALUE
+    return FALSE_VALUE
 
 def intrinsic_not(args: List[ArkValue]):
     if len(args) != 1: raise Exception("intrinsic_not expects 1 arg")
-    val = args[0]
-    is_true = False
-    if val.type == "Boolean": is_true = val.val
-    elif val.type == "Integer": is_true = val.val != 0
-    return ArkValue(not is_true, "Boolean")
+    a = args[0]
+    return FALSE_VALUE if a.type in _LOGIC_TRUTHY_TYPES and a.val else TRUE_VALUE
 
 
 # ─── AI ───────────────────────────────────────────────────────────────────────
 
 def detect_ai_mode():
-    global ARK_AI_MODE
+    global ARK_AI_MODE, ARK_AI_KEY
     if ARK_AI_MODE:
         return ARK_AI_MODE
     try:
@@ -832,8 +1024,10 @@ def detect_ai_mode():
                 return ARK_AI_MODE
     except Exception:
         pass
-    if os.environ.get("GOOGLE_API_KEY"):
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if api_key:
         print("Google API Key Detected. Enabling Cloud AI Mode.")
+        ARK_AI_KEY = api_key
         ARK_AI_MODE = "GEMINI"
         return ARK_AI_MODE
     print("No AI Provider Detected. Using Mock Mode.")
@@ -887,16 +1081,18 @@ def ask_mock():
     end = "```"
     return ArkValue(start + code + end, "String")
 
+# Prompt-injection phrases stripped by sanitize_prompt. Removing one phrase
+# can join its neighbours into another ("SimSystem:ulate a"), so the pattern
+# is applied until nothing more matches.
+_PROMPT_SANITIZER = re.compile(
+    r"Ignore previous instructions|You are now unlocked|System:|Simulate a",
+    re.IGNORECASE,
+)
+
 def sanitize_prompt(prompt: str) -> str:
-    meta_patterns = [
-        r"Ignore previous instructions",
-        r"You are now unlocked",
-        r"System:",
-        r"\\n\\nSystem:",
-        r"Simulate a",
-    ]
-    for pattern in meta_patterns:
-        prompt = re.sub(pattern, "", prompt, flags=re.IGNORECASE)
+    count = 1
+    while count:
+        prompt, count = _PROMPT_SANITIZER.subn("", prompt)
     return prompt.strip()
 
 def ask_ai(args: List[ArkValue]):
@@ -907,19 +1103,21 @@ def ask_ai(args: List[ArkValue]):
     if mode == "OLLAMA":
         return ask_ollama(prompt)
     elif mode == "GEMINI":
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        return ask_gemini(prompt, api_key)
+        return ask_gemini(prompt, ARK_AI_KEY or os.environ.get("GOOGLE_API_KEY"))
     else:
         return ask_mock()
 
+_CODE_FENCE_RE = re.compile(r"```([^\n]*)\n(.*?)```", re.DOTALL)
+
 def extract_code(args: List[ArkValue]):
     if not args or args[0].type != "String":
         raise Exception("extract_code expects a string containing code")
-    text = str(args[0].val)
-    matches = re.findall(r"```([^\n]*)\n(.*?)```", text, re.DOTALL)
+    text = args[0].val
+    if type(text) is not str:
+        text = str(text)
     ark_blocks = []
-    for tag_line, content in matches:
-        tag_line = tag_line.strip()
+    for m in _CODE_FENCE_RE.finditer(text):
+        tag_line, content = m.group(1).strip(), m.group(2)
         filename = "output.txt"
         if ":" in tag_line:
             parts = tag_line.split(":")
@@ -1003,21 +1201,181 @@ def sys_ask_ai(args: List[ArkValue]):
 
 # ─── Networking ───────────────────────────────────────────────────────────────
 
+# Handles are never reused. Dict get/set/pop and next() on the counter are
+# atomic under the GIL, so the table needs no lock; closing a handle while
+# another thread is still using it is the caller's race to avoid.
 SOCKETS = {}
-SOCKET_ID = 0
-SOCKET_LOCK = threading.Lock()
+SOCKET_ID = itertools.count(1)
+HTTP_SERVE_QUEUE_SIZE = 256
+HTTP_SERVE_BACKLOG = 128
+HTTP_SERVE_MAX_HEADER = 65536
+HTTP_SERVE_IDLE_TIMEOUT = 30.0
+
+
+class _HTTPConn:
+    __slots__ = ("inbuf", "out", "deadline")
+
+    def __init__(self, deadline):
+        self.inbuf = bytearray()
+        self.out = None
+        self.deadline = deadline
+
+
+class ArkHTTPReactor:
+    """HTTP/1.0 server for sys.net.http.serve.
+
+    A single thread multiplexes every connection through a selector, so an
+    idle or slow client holds a file descriptor rather than a worker thread.
+    Each complete GET request is passed to dispatch(path, reply); reply(status,
+    body) may be called from any thread and hands the response back to the
+    reactor, which writes it and closes the connection.
+    """
+
+    def __init__(self, port, dispatch):
+        self.listener = socket.create_server(("", port), backlog=HTTP_SERVE_BACKLOG)
+        self.listener.setblocking(False)
+        self.dispatch = dispatch
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ, self._accept)
+        # Replies queued from other threads wake the selector through this pair.
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ, self._drain_outbox)
+        self._outbox = deque()
+        self._conns = {}
+
+    def serve_forever(self):
+        select = self.selector.select
+        while True:
+            for key, mask in select(timeout=1.0):
+                key.data(key.fileobj)
+            self._expire_idle()
+
+    def _accept(self, listener):
+        deadline = time.monotonic() + HTTP_SERVE_IDLE_TIMEOUT
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            conn.setblocking(False)
+            self._conns[conn] = _HTTPConn(deadline)
+            self.selector.register(conn, selectors.EVENT_READ, self._read)
+
+    def _read(self, conn):
+        state = self._conns[conn]
+        try:
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(conn)
+            return
+        inbuf = state.inbuf
+        inbuf += data
+        end = inbuf.find(b"\r\n\r\n")
+        if end < 0:
+            end = inbuf.find(b"\n\n")
+        if end < 0:
+            if len(inbuf) > HTTP_SERVE_MAX_HEADER:
+                self.selector.unregister(conn)
+                self._send(conn, self._response(431, b"Request header fields too large"))
+            return
+        self.selector.unregister(conn)
+        request_line = bytes(inbuf[:inbuf.find(b"\n")]).decode("iso-8859-1").split()
+        state.inbuf = None
+        if len(request_line) not in (2, 3):
+            self._send(conn, self._response(400, b"Bad request"))
+        elif request_line[0] != "GET":
+            self._send(conn, self._response(501, f"Unsupported method ({request_line[0]!r})".encode("utf-8")))
+        else:
+            # The handler may take arbitrarily long, so the idle timer stops.
+            state.deadline = None
+            self.dispatch(request_line[1], lambda status, body, _c=conn: self.reply(_c, status, body))
+
+    @staticmethod
+    def _response(status, body):
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        head = (f"HTTP/1.0 {status} {reason}\r\n"
+                f"Server: Ark\r\n"
+                f"Date: {formatdate(usegmt=True)}\r\n"
+                f"Content-Type: text/html; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n")
+        return head.encode("latin-1") + body
+
+    def reply(self, conn, status, body):
+        self._outbox.append((conn, self._response(status, body)))
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # The pair is full, so a wake-up is already pending.
+
+    def _drain_outbox(self, wake_r):
+        try:
+            while wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        outbox = self._outbox
+        while outbox:
+            conn, data = outbox.popleft()
+            if conn in self._conns:
+                self._send(conn, data)
+
+    def _send(self, conn, data):
+        state = self._conns[conn]
+        state.out = memoryview(data)
+        state.deadline = time.monotonic() + HTTP_SERVE_IDLE_TIMEOUT
+        self._write(conn, registered=False)
+
+    def _write(self, conn, registered=True):
+        state = self._conns[conn]
+        try:
+            sent = conn.send(state.out)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._close(conn)
+            return
+        state.out = state.out[sent:]
+        if not state.out:
+            self._close(conn)
+        elif not registered:
+            self.selector.register(conn, selectors.EVENT_WRITE, self._write)
+
+    def _expire_idle(self):
+        now = time.monotonic()
+        expired = [c for c, st in self._conns.items() if st.deadline is not None and st.deadline < now]
+        for conn in expired:
+            self._close(conn)
+
+    def _close(self, conn):
+        self._conns.pop(conn, None)
+        try:
+            self.selector.unregister(conn)
+        except (KeyError, ValueError):
+            pass
+        conn.close()
 
 def get_socket(handle):
     if handle.type != "Integer":
         raise Exception(f"Socket handle must be Integer, got {handle.type}")
-    with SOCKET_LOCK:
-        if handle.val not in SOCKETS:
-            raise Exception(f"Invalid socket handle: {handle.val}")
-        return SOCKETS[handle.val]
+    s = SOCKETS.get(handle.val)
+    if s is None:
+        raise Exception(f"Invalid socket handle: {handle.val}")
+    return s
 
 def sys_net_socket_bind(args: List[ArkValue]):
     check_capability("net")
-    global SOCKET_ID
     if len(args) != 1 or args[0].type != "Integer":
         raise Exception("sys.net.socket.bind expects integer port")
     port = args[0].val
@@ -1025,23 +1383,19 @@ def sys_net_socket_bind(args: List[ArkValue]):
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(('0.0.0.0', port))
     s.listen(5)
-    with SOCKET_LOCK:
-        SOCKET_ID += 1
-        SOCKETS[SOCKET_ID] = s
-        return ArkValue(SOCKET_ID, "Integer")
+    sid = next(SOCKET_ID)
+    SOCKETS[sid] = s
+    return ArkValue(sid, "Integer")
 
 def sys_net_socket_accept(args: List[ArkValue]):
-    global SOCKET_ID
     if len(args) != 1:
         raise Exception("sys.net.socket.accept expects socket handle")
     server_handle = args[0]
     s = get_socket(server_handle)
     try:
         conn, addr = s.accept()
-        with SOCKET_LOCK:
-            SOCKET_ID += 1
-            SOCKETS[SOCKET_ID] = conn
-            sid = SOCKET_ID
+        sid = next(SOCKET_ID)
+        SOCKETS[sid] = conn
         return ArkValue([ArkValue(sid, "Integer"), ArkValue(addr[0], "String")], "List")
     except socket.timeout:
         return ArkValue(False, "Boolean")
@@ -1051,9 +1405,52 @@ def sys_net_socket_accept(args: List[ArkValue]):
         print(f"Accept Error: {e}", file=sys.stderr)
         return ArkValue(False, "Boolean")
 
+SOCKET_ACCEPT_BATCH_MAX = 64
+
+def sys_net_socket_accept_batch(args: List[ArkValue]):
+    """sys.net.socket.accept_batch(handle, max=64) → List of [handle, ip].
+
+    Waits for one connection like accept (honouring the socket timeout), then
+    takes whatever else is already queued, up to max. Returns an empty List on
+    timeout. The listener must not be shared with other acceptors: one that
+    takes a queued connection first leaves this call waiting for the next.
+    """
+    if len(args) not in (1, 2) or (len(args) == 2 and args[1].type != "Integer"):
+        raise Exception("sys.net.socket.accept_batch expects socket handle and optional max")
+    limit = args[1].val if len(args) == 2 else SOCKET_ACCEPT_BATCH_MAX
+    s = get_socket(args[0])
+    accepted = []
+    if limit < 1:
+        return ArkValue([], "List")
+    try:
+        accepted.append(s.accept())
+    except (socket.timeout, BlockingIOError):
+        return ArkValue([], "List")
+    except Exception as e:
+        print(f"Accept Error: {e}", file=sys.stderr)
+        return ArkValue([], "List")
+    # Readiness is polled rather than switching the listener to non-blocking,
+    # which would leak into other users of the handle. A selector, unlike
+    # select.select, also copes with fds past FD_SETSIZE on busy servers.
+    try:
+        with selectors.DefaultSelector() as ready:
+            ready.register(s, selectors.EVENT_READ)
+            while len(accepted) < limit and ready.select(0):
+                accepted.append(s.accept())
+    except (socket.timeout, BlockingIOError, InterruptedError):
+        pass
+    except Exception as e:
+        print(f"Accept Error: {e}", file=sys.stderr)
+    result = []
+    for conn, addr in accepted:
+        conn.setblocking(True)
+        sid = next(SOCKET_ID)
+        SOCKETS[sid] = conn
+        result.append(ArkValue([ArkValue(sid, "Integer"), ArkValue(addr[0], "String")], "List"))
+    return ArkValue(result, "List")
+
 def sys_net_socket_connect(args: List[ArkValue]):
     check_capability("net")
-    global SOCKET_ID
     if len(args) != 2 or args[0].type != "String" or args[1].type != "Integer":
         raise Exception("sys.net.socket.connect expects ip (String) and port (Integer)")
     ip = str(args[0].val)
@@ -1061,36 +1458,93 @@ def sys_net_socket_connect(args: List[ArkValue]):
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.connect((ip, port))
-        with SOCKET_LOCK:
-            SOCKET_ID += 1
-            SOCKETS[SOCKET_ID] = s
-            return ArkValue(SOCKET_ID, "Integer")
+        sid = next(SOCKET_ID)
+        SOCKETS[sid] = s
+        return ArkValue(sid, "Integer")
     except Exception as e:
         raise Exception(f"Connection failed: {e}")
 
+# Most platforms cap a single sendmsg at 1024 iovecs (IOV_MAX).
+SOCKET_SEND_MAX_PARTS = 1024
+
+def _socket_send_parts(s, parts):
+    """Send every part with as few syscalls as possible: one sendmsg (writev) per
+    batch of parts, resuming after partial writes, or one joined sendall where
+    sendmsg does not exist."""
+    if not hasattr(s, "sendmsg"):
+        s.sendall(b"".join(parts))
+        return
+    views = [memoryview(p) for p in parts if p]
+    while views:
+        batch = views[:SOCKET_SEND_MAX_PARTS]
+        sent = s.sendmsg(batch)
+        done = 0
+        for view in batch:
+            if sent < len(view):
+                break
+            sent -= len(view)
+            done += 1
+        del views[:done]
+        if sent:
+            views[0] = views[0][sent:]
+
+def _socket_payload(val: ArkValue):
+    if val.type == "String":
+        return val.val.encode('utf-8')
+    if val.type == "Buffer":
+        return val.val
+    raise Exception("sys.net.socket.send expects handle and data (String, Buffer or List of them)")
+
 def sys_net_socket_send(args: List[ArkValue]):
-    if len(args) != 2 or args[0].type != "Integer" or args[1].type != "String":
-        raise Exception("sys.net.socket.send expects handle and data string")
+    """sys.net.socket.send(handle, data) → Boolean.  data is a String, a Buffer,
+    or a List of them; a List goes out in a single vectored write."""
+    if len(args) != 2 or args[0].type != "Integer" or args[1].type not in ("String", "Buffer", "List"):
+        raise Exception("sys.net.socket.send expects handle and data (String, Buffer or List of them)")
     handle = args[0]
-    data = args[1].val
+    data = args[1]
+    if data.type == "List":
+        parts = [_socket_payload(v) for v in data.val]
+    else:
+        parts = None
     try:
         s = get_socket(handle)
-        s.sendall(data.encode('utf-8'))
+        if parts is None:
+            s.sendall(_socket_payload(data))
+        else:
+            _socket_send_parts(s, parts)
         return ArkValue(True, "Boolean")
     except Exception as e:
         return ArkValue(False, "Boolean")
 
+# Each thread receives into its own reusable buffer and decodes straight out of
+# it, so a recv neither allocates a size-byte bytes object nor copies it.
+SOCKET_RECV_BUFFER_SIZE = 65536
+_RECV_LOCAL = threading.local()
+
 def sys_net_socket_recv(args: List[ArkValue]):
-    if len(args) != 2 or args[0].type != "Integer" or args[1].type != "Integer":
+    """sys.net.socket.recv(handle, size, binary=false) → String, or Buffer when binary."""
+    if len(args) not in (2, 3) or args[0].type != "Integer" or args[1].type != "Integer":
         raise Exception("sys.net.socket.recv expects handle and size")
     handle = args[0]
     size = args[1].val
+    binary = len(args) == 3 and args[2].type == "Boolean" and args[2].val
     s = get_socket(handle)
+    if size <= 0:
+        # recv_into reads a full buffer for nbytes=0; recv(0) read nothing.
+        return ArkValue(bytearray(), "Buffer") if binary else ArkValue("", "String")
     try:
-        data = s.recv(size)
-        if not data:
+        if size > SOCKET_RECV_BUFFER_SIZE:
+            view = memoryview(s.recv(size))
+        else:
+            buf = getattr(_RECV_LOCAL, "buf", None)
+            if buf is None:
+                buf = _RECV_LOCAL.buf = bytearray(SOCKET_RECV_BUFFER_SIZE)
+            view = memoryview(buf)[:s.recv_into(buf, size)]
+        if binary:
+            return ArkValue(bytearray(view), "Buffer")
+        if not view:
             return ArkValue("", "String")
-        return ArkValue(data.decode('utf-8', errors='ignore'), "String")
+        return ArkValue(str(view, 'utf-8', 'ignore'), "String")
     except socket.timeout:
         return ArkValue(False, "Boolean")
     except BlockingIOError:
@@ -1102,13 +1556,12 @@ def sys_net_socket_close(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "Integer":
         raise Exception("sys.net.socket.close expects handle")
     handle = args[0]
-    with SOCKET_LOCK:
-        if handle.val in SOCKETS:
-            try:
-                SOCKETS[handle.val].close()
-            except:
-                pass
-            del SOCKETS[handle.val]
+    s = SOCKETS.pop(handle.val, None)
+    if s is not None:
+        try:
+            s.close()
+        except:
+            pass
     return UNIT_VALUE
 
 def sys_net_socket_set_timeout(args: List[ArkValue]):
@@ -1121,6 +1574,70 @@ def sys_net_socket_set_timeout(args: List[ArkValue]):
     s.settimeout(timeout)
     return UNIT_VALUE
 
+# Requests go through one lazily created urllib3 PoolManager so repeated calls
+# to a host reuse its keep-alive connection instead of reconnecting (and
+# renegotiating TLS) every time. Without urllib3 each call opens a fresh
+# connection through urllib. False marks urllib3 as unavailable. URLs that
+# HTTP(S)_PROXY / NO_PROXY route through a proxy also go through urllib, whose
+# ProxyHandler already honours them.
+_HTTP_POOL = None
+HTTP_MAX_REDIRECTS = 10
+
+def _http_pool():
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        try:
+            import urllib3
+        except ImportError:
+            _HTTP_POOL = False
+        else:
+            _HTTP_POOL = urllib3.PoolManager(num_pools=16, maxsize=32, retries=False)
+    return _HTTP_POOL
+
+def _http_needs_proxy(url):
+    parts = urllib.parse.urlsplit(url)
+    return (parts.scheme in urllib.request.getproxies()
+            and not urllib.request.proxy_bypass(parts.hostname or ""))
+
+def _http_request_pooled(pool, method, url, data):
+    headers = {"Content-Type": "application/x-www-form-urlencoded"} if data is not None else None
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        # Bodies are read only for the final response; redirect bodies are
+        # drained off the connection without being kept.
+        resp = pool.request(method, url, body=data, headers=headers,
+                            redirect=False, preload_content=False)
+        location = resp.headers.get("Location")
+        # Redirects are followed like urllib's handler: GET/HEAD always, POST
+        # on 301-303 (re-sent as a bodiless GET), and every hop re-validated.
+        if resp.status not in (301, 302, 303, 307, 308) or not location:
+            break
+        if method not in ("GET", "HEAD") and not (method == "POST" and resp.status in (301, 302, 303)):
+            break
+        resp.drain_conn()
+        resp.release_conn()
+        url = urllib.parse.urljoin(url, location)
+        validate_url_security(url)
+        if method == "POST":
+            method, data, headers = "GET", None, None
+        if _http_needs_proxy(url):
+            return _http_request_urllib(method, url, data)
+    else:
+        raise Exception(f"too many redirects (more than {HTTP_MAX_REDIRECTS})")
+    try:
+        body = resp.read()
+    finally:
+        resp.release_conn()
+    return resp.status, body.decode('utf-8')
+
+def _http_request_urllib(method, url, data):
+    opener = urllib.request.build_opener(SafeRedirectHandler)
+    req = urllib.request.Request(url, data=data, method=method)
+    try:
+        with opener.open(req) as response:
+            return response.getcode(), response.read().decode('utf-8')
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode('utf-8')
+
 def sys_net_http_request(args: List[ArkValue]):
     if len(args) < 2:
         raise Exception("sys.net.http.request expects method, url")
@@ -1130,16 +1647,12 @@ def sys_net_http_request(args: List[ArkValue]):
     data = None
     if len(args) > 2:
         data = args[2].val.encode('utf-8')
-    opener = urllib.request.build_opener(SafeRedirectHandler)
-    req = urllib.request.Request(url, data=data, method=method)
     try:
-        with opener.open(req) as response:
-            status = response.getcode()
-            body = response.read().decode('utf-8')
-            return ArkValue([ArkValue(status, "Integer"), ArkValue(body, "String")], "List")
-    except urllib.error.HTTPError as e:
-        status = e.code
-        body = e.read().decode('utf-8')
+        pool = _http_pool()
+        if pool and not _http_needs_proxy(url):
+            status, body = _http_request_pooled(pool, method, url, data)
+        else:
+            status, body = _http_request_urllib(method, url, data)
         return ArkValue([ArkValue(status, "Integer"), ArkValue(body, "String")], "List")
     except Exception as e:
         raise Exception(f"HTTP Request Failed: {e}")
@@ -1147,26 +1660,84 @@ def sys_net_http_request(args: List[ArkValue]):
 
 # ─── IO ───────────────────────────────────────────────────────────────────────
 
+# sys.io.read_file_async runs its reads on a fixed set of worker threads
+# draining one queue, rather than a new thread per call. They are daemons like
+# the old per-call threads, so a read that never completes (e.g. on a FIFO)
+# does not hold up exit. Started on first use, like the HTTP pool.
+_ASYNC_TASKS = queue.Queue()
+_ASYNC_WORKERS = []
+_ASYNC_POOL_LOCK = threading.Lock()
+
+def _async_worker():
+    while True:
+        _ASYNC_TASKS.get()()
+
+def _submit_async(task):
+    with _ASYNC_POOL_LOCK:
+        if not _ASYNC_WORKERS:
+            for i in range(max(4, (os.cpu_count() or 1) * 2)):
+                t = threading.Thread(target=_async_worker, name=f"ark-async-{i}", daemon=True)
+                t.start()
+                _ASYNC_WORKERS.append(t)
+    _ASYNC_TASKS.put(task)
+
 def sys_io_read_bytes(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "Integer":
         raise Exception("sys.io.read_bytes expects integer length")
     n = args[0].val
+    sys.stdout.flush()
     data = sys.stdin.buffer.read(n)
     return ArkValue(data.decode('utf-8', errors='ignore'), "String")
 
 def sys_io_read_line(args: List[ArkValue]):
     if len(args) != 0:
         raise Exception("sys.io.read_line expects 0 arguments")
+    sys.stdout.flush()
     line = sys.stdin.buffer.readline()
     return ArkValue(line.decode('utf-8', errors='ignore'), "String")
 
+def sys_io_read_headers(args: List[ArkValue]):
+    """sys.io.read_headers() → Struct of the next "Name: value" block on stdin.
+
+    Reads up to the blank line that ends the block (the framing LSP uses) and
+    returns the fields keyed by lower-cased name, or false at end of input.
+    """
+    if len(args) != 0:
+        raise Exception("sys.io.read_headers expects 0 arguments")
+    sys.stdout.flush()
+    readline = sys.stdin.buffer.readline
+    fields = {}
+    while True:
+        line = readline()
+        if not line:
+            return FALSE_VALUE
+        name, sep, value = line.partition(b":")
+        if not sep:
+            if line.strip():
+                continue
+            return ArkValue(ArkInstance(None, fields), "Instance")
+        key = name.strip().lower().decode('utf-8', errors='ignore')
+        fields[key] = ArkValue(value.strip().decode('utf-8', errors='ignore'), "String")
+
+# sys.io.write leaves output in stdout's buffer rather than flushing every
+# call. A terminal (line-buffered stdout) still sees each line as it is
+# written; otherwise output goes out when the buffer fills, on sys.io.flush,
+# before any stdin read (so prompts show up) and at exit.
 def sys_io_write(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "String":
         raise Exception("sys.io.write expects string")
-    s = args[0].val
-    sys.stdout.buffer.write(s.encode('utf-8'))
-    sys.stdout.buffer.flush()
-    return ArkValue(None, "Unit")
+    data = args[0].val.encode('utf-8')
+    out = sys.stdout
+    out.buffer.write(data)
+    if out.line_buffering and b"\n" in data:
+        out.buffer.flush()
+    return UNIT_VALUE
+
+def sys_io_flush(args: List[ArkValue]):
+    if len(args) != 0:
+        raise Exception("sys.io.flush expects 0 arguments")
+    sys.stdout.flush()
+    return UNIT_VALUE
 
 
 # ─── Logging & JSON ──────────────────────────────────────────────────────────
@@ -1186,17 +1757,50 @@ def to_python_val(val: ArkValue):
     if val.type == "Unit": return None
     return str(val.val)
 
+# from_python_val fills containers one nesting level per round instead of
+# recursing, so a deeply nested value (whatever the parser accepted, or one
+# built by hand) converts without hitting the recursion limit. The round cap
+# stops a list that contains itself.
+CONVERT_MAX_DEPTH = 100_000
+
 def from_python_val(val):
-    if val is None: return ArkValue(None, "Unit")
-    if isinstance(val, bool): return ArkValue(val, "Boolean")
-    if isinstance(val, int): return ArkValue(val, "Integer")
-    if isinstance(val, float): return ArkValue(int(val), "Integer")
-    if isinstance(val, str): return ArkValue(val, "String")
-    if isinstance(val, list): return ArkValue([from_python_val(x) for x in val], "List")
-    if isinstance(val, dict):
-        fields = {k: from_python_val(v) for k, v in val.items()}
-        return ArkValue(ArkInstance(None, fields), "Instance")
-    return ArkValue(str(val), "String")
+    todo = []
+
+    def node(val, push=todo.append):
+        t = type(val)
+        if t is str: return ArkValue(val, "String")
+        if t is int:
+            return SMALL_INTS[val + 5] if -5 <= val <= 256 else ArkValue(val, "Integer")
+        if val is None: return UNIT_VALUE
+        if isinstance(val, bool): return TRUE_VALUE if val else FALSE_VALUE
+        if isinstance(val, int): return ArkValue(val, "Integer")
+        if isinstance(val, float): return ArkValue(int(val), "Integer")
+        if isinstance(val, str): return ArkValue(val, "String")
+        if isinstance(val, list):
+            items = []
+            push((val, items))
+            return ArkValue(items, "List")
+        if isinstance(val, dict):
+            fields = {}
+            push((val, fields))
+            return ArkValue(ArkInstance(None, fields), "Instance")
+        return ArkValue(str(val), "String")
+
+    root = node(val)
+    for _ in range(CONVERT_MAX_DEPTH):
+        if not todo:
+            return root
+        level = todo[:]
+        todo.clear()
+        for src, out in level:
+            if type(out) is list:
+                out.extend(map(node, src))
+            else:
+                for k, v in src.items():
+                    out[k] = node(v)
+    if todo:
+        raise Exception("value is nested too deeply (or contains itself)")
+    return root
 
 def to_ark(val):
     if isinstance(val, dict):
@@ -1207,9 +1811,9 @@ def to_ark(val):
     elif isinstance(val, str):
         return ArkValue(val, "String")
     elif isinstance(val, bool):
-        return ArkValue(val, "Boolean")
+        return TRUE_VALUE if val else FALSE_VALUE
     elif isinstance(val, int):
-        return ArkValue(val, "Integer")
+        return SMALL_INTS[val + 5] if -5 <= val <= 256 else ArkValue(val, "Integer")
     elif isinstance(val, float):
         return ArkValue(int(val), "Integer")
     elif val is None:
@@ -1233,11 +1837,30 @@ def from_ark(val):
         return None
     return str(val.val)
 
+# orjson parses about twice as fast, but turns integers wider than 64 bits
+# into floats and rejects NaN/Infinity. Text with a 19+ digit run (anything
+# that may not fit in an int64, negatives included), or that orjson refuses,
+# goes through json so Ark keeps exact Integers.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_JSON_WIDE_INT = re.compile(r"\d{19}")
+
+def _json_loads(text):
+    if orjson is not None and not _JSON_WIDE_INT.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 def sys_json_parse(args: List[ArkValue]):
     if len(args) != 1 or args[0].type != "String":
         raise Exception("sys.json.parse expects string")
     try:
-        data = json.loads(str(args[0].val))
+        text = args[0].val
+        data = _json_loads(text if type(text) is str else str(text))
         return from_python_val(data)
     except Exception as e:
         raise Exception(f"JSON Parse Error: {e}")
@@ -1310,9 +1933,14 @@ def _make_late_intrinsics(call_user_func_ref):
             raise Exception("sys.vm.eval expects a code string")
         code = str(args[0].val)
         try:
-            # Lazy import to avoid circular dependency
-            from ark_interpreter import eval_node, ARK_PARSER
-            tree = ARK_PARSER.parse(code)
+            # Lazy import to avoid circular dependency. Import the interpreter
+            # under the name it was loaded as: a second copy would rebind the
+            # compiler's runtime hooks to its own error class.
+            try:
+                from meta.ark_interpreter import eval_node, get_parser
+            except ModuleNotFoundError:
+                from ark_interpreter import eval_node, get_parser
+            tree = get_parser().parse(code)
             return eval_node(tree, scope)
         except Exception as e:
             raise Exception(f"Eval Error: {e}")
@@ -1325,8 +1953,11 @@ def _make_late_intrinsics(call_user_func_ref):
         try:
             with open(path, "r") as f:
                 code = f.read()
-            from ark_interpreter import eval_node, ARK_PARSER
-            tree = ARK_PARSER.parse(code)
+            try:
+                from meta.ark_interpreter import eval_node, get_parser
+            except ModuleNotFoundError:
+                from ark_interpreter import eval_node, get_parser
+            tree = get_parser().parse(code)
             return eval_node(tree, scope)
         except Exception as e:
             raise Exception(f"Source Error: {e}")
@@ -1338,27 +1969,35 @@ def _make_late_intrinsics(call_user_func_ref):
         handler_func = args[1]
         if handler_func.type != "Function":
             raise Exception("Handler must be a function")
-        from http.server import BaseHTTPRequestHandler, HTTPServer
-        class ArkHTTPHandler(BaseHTTPRequestHandler):
-            def do_GET(self):
-                req_path = ArkValue(self.path, "String")
-                call_args = [req_path]
+
+        # The interpreter is not thread-safe, so the reactor never calls into
+        # it directly. It enqueues each request and a single runtime thread
+        # runs the Ark handler for one request at a time, then hands the reply
+        # back. The bounded queue gives backpressure: a burst beyond its
+        # capacity gets a 503 instead of piling up in memory.
+        pending = queue.Queue(maxsize=HTTP_SERVE_QUEUE_SIZE)
+
+        def dispatch(path, reply, _put=pending.put_nowait):
+            try:
+                _put((path, reply))
+            except queue.Full:
+                reply(503, b"Server busy")
+
+        # Dependencies are bound as default arguments so the hot loop reads
+        # them as locals rather than through closure cells and attributes.
+        def runtime_loop(_get=pending.get, _call=call_user_func_ref, _func=handler_func.val):
+            while True:
+                req_path, reply = _get()
                 try:
-                    result = call_user_func_ref(handler_func.val, call_args)
-                    resp_body = str(result.val).encode('utf-8')
-                    self.send_response(200)
-                    self.end_headers()
-                    self.wfile.write(resp_body)
+                    result = _call(_func, [ArkValue(req_path, "String")])
+                    reply(200, str(result.val).encode('utf-8'))
                 except Exception as e:
                     print(f"Ark Handler Error: {e}")
-                    self.send_response(500)
-                    self.end_headers()
-                    self.wfile.write(str(e).encode('utf-8'))
-        server_address = ('', port)
-        httpd = HTTPServer(server_address, ArkHTTPHandler)
-        t = threading.Thread(target=httpd.serve_forever)
-        t.daemon = True
-        t.start()
+                    reply(500, str(e).encode('utf-8'))
+
+        httpd = ArkHTTPReactor(port, dispatch)
+        threading.Thread(target=runtime_loop, name=f"ark-runtime-{port}", daemon=True).start()
+        threading.Thread(target=httpd.serve_forever, name=f"ark-http-{port}", daemon=True).start()
         return UNIT_VALUE
 
     def sys_io_read_file_async(args: List[ArkValue]):
@@ -1376,9 +2015,7 @@ def _make_late_intrinsics(call_user_func_ref):
                 print(f"Async Read Error: {e}", file=sys.stderr)
                 val = UNIT_VALUE
                 EVENT_QUEUE.put((callback, [val]))
-        t = threading.Thread(target=task)
-        t.daemon = True
-        t.start()
+        _submit_async(task)
         return UNIT_VALUE
 
     def sys_event_poll(args: List[ArkValue]):
@@ -1423,6 +2060,7 @@ INTRINSICS = {
     "sys.crypto.ed25519.gen": sys_crypto_ed25519_gen,
     "sys.crypto.ed25519.sign": sys_crypto_ed25519_sign,
     "sys.crypto.ed25519.verify": sys_crypto_ed25519_verify,
+    "sys.crypto.ed25519.verify_batch": sys_crypto_ed25519_verify_batch,
     "sys.exec": sys_exec,
     "sys.fs.read": sys_fs_read,
     "sys.fs.read_buffer": sys_fs_read_buffer,
@@ -1438,9 +2076,11 @@ INTRINSICS = {
     "sys.mem.inspect": sys_mem_inspect,
     "sys.mem.read": sys_mem_read,
     "sys.mem.write": sys_mem_write,
+    "sys.mem.write_bulk": sys_mem_write_bulk,
     "sys.net.http.request": sys_net_http_request,
     "sys.net.socket.bind": sys_net_socket_bind,
     "sys.net.socket.accept": sys_net_socket_accept,
+    "sys.net.socket.accept_batch": sys_net_socket_accept_batch,
     "sys.net.socket.connect": sys_net_socket_connect,
     "sys.net.socket.send": sys_net_socket_send,
     "sys.net.socket.recv": sys_net_socket_recv,
@@ -1466,7 +2106,9 @@ INTRINSICS = {
     "ai.ask": sys_ask_ai,
     "sys.io.read_bytes": sys_io_read_bytes,
     "sys.io.read_line": sys_io_read_line,
+    "sys.io.read_headers": sys_io_read_headers,
     "sys.io.write": sys_io_write,
+    "sys.io.flush": sys_io_flush,
     "sys.exit": sys_exit,
     "exit": sys_exit,
     "quit": sys_exit,
@@ -1545,6 +2187,7 @@ def _eval_binop(op, left, right):
 
 LINEAR_SPECS = {
     "sys.mem.write": [0],
+    "sys.mem.write_bulk": [0],
     "sys.mem.read": [0],
 }
 
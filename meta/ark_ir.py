@@ -0,0 +1,108 @@
+"""
+Ark IR — fixed-shape records for the parse-tree nodes whose layout varies.
+
+Lark trees for definitions, conditionals and calls have optional parts (a
+leading doc comment, a None placeholder for an empty parameter or argument
+list, an optional else branch), so handlers used to probe children with len
+checks and attribute lookups every time the node ran. ir_of() decodes such a
+node once into a slotted record and memoizes it on the node, so every later
+evaluation reads plain attributes.
+"""
+import sys
+
+
+class FuncDef:
+    __slots__ = ('name', 'params', 'body')
+
+    def __init__(self, name, params, body):
+        self.name = name
+        self.params = params  # tuple of interned names
+        self.body = body
+
+
+class ClassDef:
+    __slots__ = ('name', 'methods')
+
+    def __init__(self, name, methods):
+        self.name = name
+        self.methods = methods  # tuple of FuncDef
+
+
+class IfStmt:
+    __slots__ = ('branches', 'else_')
+
+    def __init__(self, branches, else_):
+        self.branches = branches  # tuple of (cond, block) pairs
+        self.else_ = else_
+
+
+class Call:
+    __slots__ = ('callee', 'args')
+
+    def __init__(self, callee, args):
+        self.callee = callee
+        self.args = args  # tuple of argument nodes
+
+
+def _definition_parts(node):
+    # A leading DOC_COMMENT token is kept by the grammar; it is not the name.
+    children = [c for c in node.children if getattr(c, "type", None) != "DOC_COMMENT"]
+    return children[0].value, children[1:]
+
+
+def _build_function_def(node):
+    name, rest = _definition_parts(node)
+    name = sys.intern(name)
+    params = ()
+    body_idx = 0
+    if len(rest) > 1:
+        first = rest[0]
+        if first is None:
+            body_idx = 1
+        elif getattr(first, "data", None) == "param_list":
+            params = tuple(sys.intern(t.value) for t in first.children)
+            body_idx = 1
+    return FuncDef(name, params, rest[body_idx])
+
+
+def _build_class_def(node):
+    name, rest = _definition_parts(node)
+    methods = tuple(ir_of(c) for c in rest if getattr(c, "data", None) == "function_def")
+    return ClassDef(name, methods)
+
+
+def _build_if_stmt(node):
+    children = node.children
+    n = len(children)
+    branches = tuple((children[i], children[i + 1]) for i in range(0, n - 1, 2))
+    else_ = children[n - 1] if n % 2 == 1 else None
+    return IfStmt(branches, else_)
+
+
+def _build_call_expr(node):
+    args = ()
+    if len(node.children) > 1 and node.children[1] is not None:
+        args = tuple(node.children[1].children)
+    return Call(node.children[0], args)
+
+
+_BUILDERS = {
+    "function_def": _build_function_def,
+    "class_def": _build_class_def,
+    "if_stmt": _build_if_stmt,
+    "call_expr": _build_call_expr,
+}
+
+
+def ir_of(node):
+    """Returns the memoized IR record for a function_def, class_def, if_stmt or call_expr node."""
+    try:
+        return node._ark_ir
+    except AttributeError:
+        pass
+    record = _BUILDERS[node.data](node)
+    try:
+        node._ark_ir = record
+    except AttributeError:
+        pass
+    return record
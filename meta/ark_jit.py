@@ -0,0 +1,357 @@
+"""
+Ark JIT — specialises hot integer functions to native Python code.
+
+Ark arithmetic is integer-only, so a function whose body is made of integer
+locals, arithmetic, comparisons, if/while and calls to itself can be lowered
+to a plain Python function that works on unboxed ints: no ArkValue
+allocation, no scope chain, no handler dispatch. call_user_func counts calls
+on each ArkFunction and asks compile_function for an entry point once the
+count reaches JIT_THRESHOLD.
+
+Free variables the body only reads (module constants such as a modulus or a
+table size) are passed in as extra arguments: the entry point reads them from
+the closure once per call and bails unless they are Integers. Nothing in the
+subset can rebind them, so the snapshot stays exact for the whole call.
+
+Anything else outside that subset (intrinsics, strings, lists, methods) is
+rejected at compile time and the function stays on the interpreter.
+Because the subset is side-effect free, a compiled call that fails at run
+time (division by zero, recursion budget, unexpected types) simply bails and
+the interpreter re-executes the call from scratch, producing the exact
+interpreter result or error.
+"""
+try:
+    from meta.ark_types import ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE
+except ModuleNotFoundError:
+    from ark_types import ArkValue, UNIT_VALUE, TRUE_VALUE, FALSE_VALUE
+
+
+JIT_THRESHOLD = 100
+
+INT = "Integer"
+BOOL = "Boolean"
+ANY = "Any"
+
+_ARITH = {"add": "+", "sub": "-", "mul": "*", "div": "//", "mod": "%"}
+_COMPARE = {"lt": "<", "gt": ">", "le": "<=", "ge": ">=", "eq": "==", "neq": "!="}
+
+
+class _Bail(Exception):
+    """Raised inside compiled code to hand the call back to the interpreter."""
+
+
+class _Unsupported(Exception):
+    """Raised during code generation when a body leaves the JIT subset."""
+
+
+def _tree(node, data=None):
+    if not hasattr(node, "data"):
+        raise _Unsupported(repr(node))
+    if data is not None and node.data != data:
+        raise _Unsupported(node.data)
+    return node
+
+
+def _local(name):
+    # Prefix every Ark identifier so it can never collide with a Python
+    # keyword, builtin, or the generator's own names.
+    return "v_" + name
+
+
+def _always_returns(block):
+    stmts = [s for s in block.children if s is not None]
+    if not stmts:
+        return False
+    last = stmts[-1]
+    if not hasattr(last, "data"):
+        return False
+    if last.data == "return_stmt":
+        return True
+    if last.data == "if_stmt":
+        children = last.children
+        if len(children) % 2 == 0 or children[-1] is None:
+            return False
+        branches = children[1::2] + [children[-1]]
+        return all(_always_returns(b) for b in branches)
+    return False
+
+
+def _free_names(func):
+    # Names the body reads but never binds. A name assigned anywhere in the
+    # body is a local; reading it before the assignment stays unsupported,
+    # since the interpreter would fall through to the enclosing scope there.
+    reads = {}
+    bound = set(func.params)
+    for node in func.body.iter_subtrees_topdown():
+        if node.data == "var":
+            reads[node.children[0].value] = None
+        elif node.data == "assign_var":
+            bound.add(node.children[0].value)
+    return [name for name in reads
+            if name not in bound and name != func.name and name != "this"]
+
+
+class _Codegen:
+    def __init__(self, func, self_type):
+        self.func = func
+        self.name = func.name
+        self.params = list(func.params)
+        self.free = _free_names(func)
+        self.self_type = self_type
+        self.lines = []
+        self.return_types = set()
+        self.self_calls = False
+        self.tail_calls = False
+
+        if self.name in self.params or len(set(self.params)) != len(self.params):
+            raise _Unsupported("parameter shadows function")
+
+    def emit(self, depth, text):
+        self.lines.append("    " * depth + text)
+
+    # ── statements ──────────────────────────────────────────────────────
+
+    def block(self, node, depth, assigned, in_loop):
+        _tree(node, "block")
+        emitted = False
+        for stmt in node.children:
+            if stmt is None:
+                continue
+            assigned = self.stmt(stmt, depth, assigned, in_loop)
+            emitted = True
+        if not emitted:
+            self.emit(depth, "pass")
+        return assigned
+
+    def stmt(self, node, depth, assigned, in_loop):
+        kind = _tree(node).data
+
+        if kind == "assign_var":
+            name = node.children[0].value
+            if name == self.name:
+                raise _Unsupported("assignment to function name")
+            src, typ = self.expr(node.children[1], assigned)
+            if typ != INT:
+                raise _Unsupported("non-integer local")
+            self.emit(depth, f"{_local(name)} = {src}")
+            return assigned | {name}
+
+        if kind == "if_stmt":
+            children = node.children
+            i = 0
+            branch_sets = []
+            while i + 1 < len(children):
+                cond, _ = self.expr(children[i], assigned)
+                self.emit(depth, f"{'if' if i == 0 else 'elif'} {cond}:")
+                branch_sets.append(self.block(children[i + 1], depth + 1, assigned, in_loop))
+                i += 2
+            if i < len(children) and children[i] is not None:
+                self.emit(depth, "else:")
+                branch_sets.append(self.block(children[i], depth + 1, assigned, in_loop))
+                # With an else every path runs exactly one branch, so names
+                # bound on all of them are definitely assigned afterwards.
+                return set.intersection(*branch_sets)
+            return assigned
+
+        if kind == "while_stmt":
+            cond, _ = self.expr(node.children[0], assigned)
+            self.emit(depth, f"while {cond}:")
+            self.block(node.children[1], depth + 1, assigned, True)
+            return assigned
+
+        if kind == "return_stmt":
+            if not node.children or node.children[0] is None:
+                self.emit(depth, "return None")
+                return assigned
+            value = node.children[0]
+            if self._is_self_call(value):
+                if in_loop:
+                    raise _Unsupported("tail call inside loop")
+                args = self.call_args(value, assigned)
+                self.tail_calls = True
+                targets = "".join(f"{_local(p)}, " for p in self.params)
+                if targets:
+                    self.emit(depth, f"{targets}= {', '.join(args)},")
+                self.emit(depth, "continue")
+                self.return_types.add(self.self_type)
+                return assigned
+            src, typ = self.expr(value, assigned)
+            self.return_types.add(typ)
+            self.emit(depth, f"return {src}")
+            return assigned
+
+        raise _Unsupported(kind)
+
+    # ── expressions ─────────────────────────────────────────────────────
+
+    def _is_self_call(self, node):
+        if not (hasattr(node, "data") and node.data == "call_expr"):
+            return False
+        callee = node.children[0]
+        return (hasattr(callee, "data") and callee.data == "var"
+                and callee.children[0].value == self.name)
+
+    def call_args(self, node, assigned):
+        args = []
+        if len(node.children) > 1 and node.children[1] is not None:
+            for arg in _tree(node.children[1], "expr_list").children:
+                src, typ = self.expr(arg, assigned)
+                if typ != INT:
+                    raise _Unsupported("non-integer argument")
+                args.append(src)
+        if len(args) != len(self.params):
+            raise _Unsupported("arity mismatch")
+        return args
+
+    def expr(self, node, assigned):
+        kind = _tree(node).data
+
+        if kind == "number":
+            return repr(int(node.children[0].value)), INT
+
+        if kind == "var":
+            name = node.children[0].value
+            if name not in assigned and name not in self.free:
+                raise _Unsupported(f"unbound variable {name}")
+            return _local(name), INT
+
+        if kind in _ARITH:
+            left, lt = self.expr(node.children[0], assigned)
+            right, rt = self.expr(node.children[1], assigned)
+            allowed = (INT, BOOL) if kind == "add" else (INT,)
+            if lt not in allowed or rt not in allowed:
+                raise _Unsupported("non-integer arithmetic")
+            return f"({left} {_ARITH[kind]} {right})", INT
+
+        if kind in _COMPARE:
+            left, _ = self.expr(node.children[0], assigned)
+            right, _ = self.expr(node.children[1], assigned)
+            return f"({left} {_COMPARE[kind]} {right})", BOOL
+
+        if kind == "logical_or":
+            left, _ = self.expr(node.children[0], assigned)
+            right, _ = self.expr(node.children[-1], assigned)
+            return f"(True if {left} else bool({right}))", BOOL
+
+        if kind == "logical_and":
+            left, _ = self.expr(node.children[0], assigned)
+            right, _ = self.expr(node.children[-1], assigned)
+            return f"(bool({right}) if {left} else False)", BOOL
+
+        if kind == "call_expr" and self._is_self_call(node):
+            args = self.call_args(node, assigned) + [_local(n) for n in self.free]
+            self.self_calls = True
+            return f"_jit(_d - 1, {', '.join(args)})" if args else "_jit(_d - 1)", self.self_type
+
+        raise _Unsupported(kind)
+
+    # ── function ────────────────────────────────────────────────────────
+
+    def generate(self):
+        body = _tree(self.func.body, "block")
+        params = set(self.params)
+        header = ", ".join(["_d"] + [_local(p) for p in self.params + self.free])
+
+        # Generate the body first so we know whether a tail-call loop is needed.
+        outer = self.lines
+        self.lines = []
+        self.block(body, 2, params, False)
+        inner = self.lines
+        self.lines = outer
+
+        self.emit(0, f"def _jit({header}):")
+        self.emit(1, "if _d < 0:")
+        self.emit(2, "raise _Bail")
+        if self.tail_calls:
+            self.emit(1, "while True:")
+            self.lines.extend(inner)
+            self.emit(2, "return None")
+        else:
+            self.lines.extend(line[4:] for line in inner)
+            self.emit(1, "return None")
+        return "\n".join(self.lines) + "\n"
+
+
+def _generate(func):
+    gen = _Codegen(func, INT)
+    source = gen.generate()
+    if gen.self_calls:
+        # A non-tail self call feeds its result into the caller's expression,
+        # so it must never observe the implicit Unit of falling off the end.
+        if not _always_returns(func.body):
+            raise _Unsupported("self call may observe Unit")
+        if gen.return_types - {INT}:
+            gen = _Codegen(func, ANY)
+            source = gen.generate()
+    return source, gen.self_calls, gen.free
+
+
+def _lower(func):
+    # The lowering depends only on the definition, so it is memoized on the
+    # body node and shared by every ArkFunction created from that node, e.g.
+    # a definition re-run by a loop, a reload or sys.vm.source.
+    body = func.body
+    lowered = getattr(body, "_ark_jit", None)
+    if lowered is not None:
+        return lowered
+    try:
+        source, self_calls, free = _generate(func)
+        namespace = {"_Bail": _Bail}
+        exec(compile(source, f"<ark-jit:{func.name}>", "exec"), namespace)
+        lowered = (namespace["_jit"], self_calls, tuple(free))
+    except (_Unsupported, AttributeError, IndexError, TypeError, ValueError):
+        lowered = False
+    try:
+        body._ark_jit = lowered
+    except AttributeError:
+        pass
+    return lowered
+
+
+def compile_function(func):
+    """
+    Compiles an ArkFunction to a native entry point.
+    Returns entry(args, budget) -> ArkValue, or None if the body is outside
+    the JIT subset. The entry returns None instead of a value whenever the
+    call has to be handed back to the interpreter.
+    """
+    lowered = _lower(func)
+    if not lowered:
+        return None
+    native, self_calls, free = lowered
+    arity = len(func.params)
+    name = func.name
+    closure = func.closure
+
+    def entry(args, budget):
+        if len(args) != arity:
+            return None
+        raw = []
+        for arg in args:
+            if arg.type != INT:
+                return None
+            raw.append(arg.val)
+        try:
+            if self_calls:
+                # Self calls are resolved by name at run time; only trust the
+                # compiled recursion while that name still means this function.
+                bound = closure.get(name)
+                if bound is None or bound.val is not func:
+                    return None
+            for var in free:
+                bound = closure.get(var)
+                if bound is None or bound.type != INT:
+                    return None
+                raw.append(bound.val)
+            result = native(budget, *raw)
+        except Exception:
+            return None
+        if result is None:
+            return UNIT_VALUE
+        if result is True:
+            return TRUE_VALUE
+        if result is False:
+            return FALSE_VALUE
+        return ArkValue(result, INT)
+
+    return entry
@@ -4,7 +4,7 @@ Ark Type System — Core data types for the Ark runtime.
 Extracted from ark.py (Phase 72: Structural Hardening).
 """
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
 # slots=True requires Python 3.10+. Gracefully degrade on older versions.
@@ -16,6 +16,15 @@ else:
         return dataclass(cls)
 
 
+# Appends shorter than this are merged into the rope's rightmost leaf instead
+# of adding a node, so building a string piece by piece keeps the tree small.
+ROPE_LEAF_SIZE = 64
+
+# Indexing walks at most this many nodes toward a leaf before it flattens the
+# rope once and indexes the cached string instead.
+ROPE_WALK_LIMIT = 32
+
+
 class RopeString:
     __slots__ = ('left', 'right', 'val', 'length', '_str_cache')
     def __init__(self, val=None, left=None, right=None):
@@ -34,6 +43,8 @@ class RopeString:
     def __str__(self):
         if self._str_cache is not None:
             return self._str_cache
+        if self.val is not None:
+            return self.val
 
         parts = []
         stack = [self]
@@ -45,8 +56,26 @@ class RopeString:
                 if node.right: stack.append(node.right)
                 if node.left: stack.append(node.left)
 
-        self._str_cache = "".join(parts)
-        return self._str_cache
+        flat = "".join(parts)
+        self._str_cache = flat
+        # Collapse into a leaf: the value is unchanged, but later appends and
+        # flattens start from one leaf instead of re-walking the whole tree.
+        self.val = flat
+        self.left = None
+        self.right = None
+        return flat
+
+    def chunks(self):
+        """Yields the leaf strings left to right without flattening the rope."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.val is not None:
+                if node.val:
+                    yield node.val
+            else:
+                if node.right: stack.append(node.right)
+                if node.left: stack.append(node.left)
 
     def __repr__(self):
         return f"RopeString(len={self.length})"
@@ -54,25 +83,49 @@ class RopeString:
     def __len__(self):
         return self.length
 
+    @staticmethod
+    def _concat(left, right):
+        if left.length == 0: return right
+        if right.length == 0: return left
+        if right.val is not None and right.length < ROPE_LEAF_SIZE:
+            if left.val is not None:
+                if left.length < ROPE_LEAF_SIZE:
+                    return RopeString(left.val + right.val)
+            else:
+                ll, lr = left.left, left.right
+                if (ll is not None and lr is not None and lr.val is not None
+                        and lr.length + right.length <= ROPE_LEAF_SIZE):
+                    return RopeString(left=ll, right=RopeString(lr.val + right.val))
+        return RopeString(left=left, right=right)
+
     def __add__(self, other):
         if not isinstance(other, (str, RopeString)):
             other = str(other)
         if not isinstance(other, RopeString):
             other = RopeString(other)
-        if self.length == 0: return other
-        if other.length == 0: return self
-        return RopeString(left=self, right=other)
+        return RopeString._concat(self, other)
 
     def __radd__(self, other):
         if not isinstance(other, (str, RopeString)):
             other = str(other)
         if not isinstance(other, RopeString):
             other = RopeString(other)
-        if self.length == 0: return other
-        if other.length == 0: return self
-        return RopeString(left=other, right=self)
+        return RopeString._concat(other, self)
 
     def __getitem__(self, idx):
+        if self._str_cache is None and type(idx) is int and 0 <= idx < self.length:
+            # Walk toward the leaf holding idx; shallow ropes never flatten.
+            node = self
+            i = idx
+            for _ in range(ROPE_WALK_LIMIT):
+                if node.val is not None:
+                    return node.val[i]
+                left = node.left
+                if i < left.length:
+                    node = left
+                else:
+                    i -= left.length
+                    node = node.right
         return str(self)[idx]
 
     def __eq__(self, other):
@@ -108,6 +161,15 @@ class ArkValue:
 
 UNIT_VALUE = ArkValue(None, "Unit")
 
+# Shared Boolean results. ArkValues are never mutated in place, so operators
+# and logical expressions hand out these two instead of allocating per result.
+TRUE_VALUE = ArkValue(True, "Boolean")
+FALSE_VALUE = ArkValue(False, "Boolean")
+
+# Shared Integer values for -5..256, as CPython keeps for int: operators hand
+# out SMALL_INTS[v + 5] for a result in that range instead of allocating.
+SMALL_INTS = tuple(ArkValue(i, "Integer") for i in range(-5, 257))
+
 # GCD Typed Return Sentinel — τ_R = ∞_rec (no return under contract)
 # Ref: Clement Paulus, UMCP/GCD v2.1.3 §5 (Typed Return)
 CENSORED_VALUE = ArkValue(None, "Censored")
@@ -131,6 +193,11 @@ class ArkFunction:
     params: List[str]
     body: Any  # Tree node
     closure: 'Scope'
+    # Hot-path bookkeeping for the integer JIT (see ark_jit.py). jit_code is
+    # None until the threshold is reached, then the compiled entry point, or
+    # False when the body is outside the subset the JIT understands.
+    call_count: int = field(default=0, compare=False, repr=False)
+    jit_code: Any = field(default=None, compare=False, repr=False)
 
 
 @_dataclass_compat
@@ -143,6 +210,9 @@ class ArkClass:
 class ArkInstance:
     klass: ArkClass
     fields: Dict[str, ArkValue]
+    # BoundMethod values already handed out for this instance, keyed by
+    # method name, so repeated obj.method() calls reuse one wrapper.
+    bound: Dict[str, ArkValue] = field(default_factory=dict, compare=False, repr=False)
 
 
 class Scope:
@@ -153,22 +223,34 @@ class Scope:
         self.parent = parent
 
     def get(self, name: str) -> Optional[ArkValue]:
-        if name in self.vars:
-            val = self.vars[name]
-            if val.type == "Moved":
-                from ark_security import LinearityViolation
-                raise LinearityViolation(f"Use of moved variable '{name}'")
-            return val
-        if self.parent:
-            return self.parent.get(name)
-        return None
+        # Walks the chain in a loop rather than recursing per level. A parent
+        # with its own lookup (a function frame) takes over from there.
+        scope = self
+        while True:
+            val = scope.vars.get(name)
+            if val is not None:
+                if val.type == "Moved":
+                    from ark_security import LinearityViolation
+                    raise LinearityViolation(f"Use of moved variable '{name}'")
+                return val
+            scope = scope.parent
+            if scope is None:
+                return None
+            if type(scope) is not Scope:
+                return scope.get(name)
 
     def set(self, name: str, val: ArkValue):
         self.vars[name] = val
 
     def mark_moved(self, name: str):
-        if name in self.vars:
-            self.vars[name] = ArkValue(None, "Moved")
-            return
-        if self.parent:
-            self.parent.mark_moved(name)
+        scope = self
+        while True:
+            if name in scope.vars:
+                scope.vars[name] = ArkValue(None, "Moved")
+                return
+            scope = scope.parent
+            if scope is None:
+                return
+            if type(scope) is not Scope:
+                scope.mark_moved(name)
+                return
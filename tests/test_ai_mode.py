@@ -59,6 +59,16 @@ class TestAIMode(unittest.TestCase):
         self.assertEqual(mode, "MOCK")
         self.assertEqual(ark.ARK_AI_MODE, "MOCK")
 
+    @patch('urllib.request.urlopen')
+    @patch.dict(os.environ, {}, clear=True)
+    def test_detect_ai_mode_probes_once(self, mock_urlopen):
+        # A failed probe falls back to MOCK and is not retried
+        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+
+        self.assertEqual(ark.detect_ai_mode(), "MOCK")
+        self.assertEqual(ark.detect_ai_mode(), "MOCK")
+        mock_urlopen.assert_called_once()
+
     @patch('ark.detect_ai_mode')
     @patch('ark.ask_ollama')
     @patch('ark.ask_gemini')
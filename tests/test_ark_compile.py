@@ -0,0 +1,363 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+def run(code):
+    scope = ark.Scope()
+    ark.eval_node(ark.ARK_PARSER.parse(code), scope)
+    return scope
+
+
+class TestArkCompile(unittest.TestCase):
+    def test_closure_is_memoized_on_node(self):
+        tree = ark.ARK_PARSER.parse("x := 1 + 2")
+        code = ark.compile_node(tree)
+        self.assertIs(ark.compile_node(tree), code)
+        scope = ark.Scope()
+        code(scope)
+        self.assertEqual(scope.get("x"), ark.ArkValue(3, "Integer"))
+
+    def test_compiled_tree_reruns_with_fresh_values(self):
+        tree = ark.ARK_PARSER.parse("""
+xs := [1, 2]
+sys.list.append(xs, 3)
+""")
+        first = ark.Scope()
+        first.set("sys", ark.ArkValue("sys", "Namespace"))
+        ark.eval_node(tree, first)
+        second = ark.Scope()
+        second.set("sys", ark.ArkValue("sys", "Namespace"))
+        ark.eval_node(tree, second)
+        self.assertEqual(len(second.get("xs").val), 3)
+        self.assertIsNot(first.get("xs").val, second.get("xs").val)
+
+    def test_uncompiled_kinds_use_handlers(self):
+        scope = run("""
+class Point {
+    func norm() { return 7 }
+}
+let (a, b) := [4, 5]
+p := Point()
+n := p.norm()
+""")
+        self.assertEqual(scope.get("b").val, 5)
+        self.assertEqual(scope.get("n").val, 7)
+
+    def test_operator_table_matches_eval_binop(self):
+        scope = run("""
+a := 7 - 2
+b := 7 / 2
+c := "n" + 1
+d := 2 <= 2
+e := 1 < 0 || 3
+f := c + "x" + c
+""")
+        self.assertEqual(scope.get("a"), ark.ArkValue(5, "Integer"))
+        self.assertEqual(scope.get("b"), ark.ArkValue(3, "Integer"))
+        self.assertEqual(str(scope.get("c").val), "n1")
+        self.assertEqual(scope.get("d"), ark.ArkValue(True, "Boolean"))
+        self.assertEqual(scope.get("e"), ark.ArkValue(True, "Boolean"))
+        self.assertEqual(str(scope.get("f").val), "n1xn1")
+        with self.assertRaises(Exception) as ctx:
+            run('x := "a" - 1')
+        self.assertIn("Operator sub requires Integers", str(ctx.exception))
+
+    def test_unboxed_site_keeps_working_after_other_types(self):
+        scope = run("""
+func lt(a, b) { return a < b }
+func sub(a, b) { return a - b }
+x := lt("a", "b")
+y := lt(3, 2)
+z := 0
+if sub(7, 2) == 5 { z := sub(1, 1) }
+""")
+        self.assertIs(scope.get("x"), ark.TRUE_VALUE)
+        self.assertIs(scope.get("y"), ark.FALSE_VALUE)
+        self.assertEqual(scope.get("z").val, 0)
+        with self.assertRaises(Exception) as ctx:
+            run('func sub(a, b) { return a - b }\nq := sub(2, 1)\nw := sub("s", 1)')
+        self.assertIn("Operator sub requires Integers", str(ctx.exception))
+
+    def test_eval_binop_integer_pairs(self):
+        def ints(*pair):
+            return [ark.ArkValue(v, "Integer") for v in pair]
+        self.assertEqual(ark.eval_binop("div", *ints(-7, 2)), ark.ArkValue(-4, "Integer"))
+        self.assertEqual(ark.eval_binop("mod", *ints(-7, 2)), ark.ArkValue(1, "Integer"))
+        self.assertIs(ark.eval_binop("le", *ints(3, 3)), ark.TRUE_VALUE)
+        self.assertIs(ark.eval_binop("neq", *ints(3, 3)), ark.FALSE_VALUE)
+        self.assertEqual(str(ark.eval_binop("add", ark.ArkValue("n", "String"), *ints(1)).val), "n1")
+        with self.assertRaises(ZeroDivisionError):
+            ark.eval_binop("mod", *ints(1, 0))
+
+    def test_unboxed_integer_expressions_fall_back_on_other_types(self):
+        scope = run("""
+n := 6
+a := n * (n - 1) % 7 + 2
+b := 1 < 2
+c := b + n
+s := "x"
+d := s + n * 2
+e := n - 1 >= 5
+""")
+        self.assertEqual(scope.get("a"), ark.ArkValue(6 * 5 % 7 + 2, "Integer"))
+        self.assertEqual(scope.get("c"), ark.ArkValue(7, "Integer"))
+        self.assertEqual(str(scope.get("d").val), "x12")
+        self.assertEqual(scope.get("e"), ark.ArkValue(True, "Boolean"))
+        with self.assertRaises(Exception) as ctx:
+            run("z := 0\ny := 5 / z")
+        self.assertIn("division", str(ctx.exception))
+
+    def test_boolean_results_are_shared(self):
+        scope = run("""
+n := 3
+a := n < 4
+b := "x" == "x"
+c := 0 || n
+d := n && 0
+""")
+        self.assertIs(scope.get("a"), ark.TRUE_VALUE)
+        self.assertIs(scope.get("b"), ark.TRUE_VALUE)
+        self.assertIs(scope.get("c"), ark.TRUE_VALUE)
+        self.assertIs(scope.get("d"), ark.FALSE_VALUE)
+
+    def test_small_integer_results_are_shared(self):
+        scope = run("""
+n := 200
+a := n + 56
+b := n - 205
+c := n + 57
+d := 3 * 4
+""")
+        self.assertIs(scope.get("a"), ark.SMALL_INTS[256 + 5])
+        self.assertIs(scope.get("b"), ark.SMALL_INTS[-5 + 5])
+        self.assertEqual(scope.get("c"), ark.ArkValue(257, "Integer"))
+        self.assertIs(scope.get("d"), ark.SMALL_INTS[12 + 5])
+        self.assertIs(ark.eval_binop("mod", ark.ArkValue(7, "Integer"), ark.ArkValue(4, "Integer")),
+                      ark.SMALL_INTS[3 + 5])
+
+    def test_truthiness_by_type(self):
+        cases = [(ark.ArkValue(0, "Integer"), False), (ark.ArkValue(2, "Integer"), True),
+                 (ark.ArkValue("", "String"), False), (ark.ArkValue("a", "String"), True),
+                 (ark.ArkValue([], "List"), True), (ark.UNIT_VALUE, False),
+                 (ark.FALSE_VALUE, False)]
+        for value, expected in cases:
+            self.assertEqual(bool(ark.is_truthy(value)), expected, value)
+        scope = run("""
+a := intrinsic_and(1, "x")
+b := intrinsic_or(0, 1 < 2)
+c := intrinsic_not(0)
+""")
+        self.assertIs(scope.get("a"), ark.FALSE_VALUE)
+        self.assertIs(scope.get("b"), ark.TRUE_VALUE)
+        self.assertIs(scope.get("c"), ark.TRUE_VALUE)
+
+    def test_literals_are_decoded_once(self):
+        tree = ark.ARK_PARSER.parse('s := "a\\tb"\nn := 42')
+        first = ark.Scope()
+        ark.eval_node(tree, first)
+        second = ark.Scope()
+        ark.eval_node(tree, second)
+        self.assertEqual(first.get("s").val, "a\tb")
+        self.assertIs(first.get("s"), second.get("s"))
+        self.assertIs(first.get("n"), second.get("n"))
+
+    def test_constant_list_is_fresh_per_evaluation(self):
+        tree = ark.ARK_PARSER.parse("""
+func mk() { return [1, "a"] }
+a := mk()
+sys.list.append(a, 2)
+b := mk()
+""")
+        scope = ark.Scope()
+        scope.set("sys", ark.ArkValue("sys", "Namespace"))
+        ark.eval_node(tree, scope)
+        self.assertEqual(len(scope.get("a").val), 3)
+        self.assertEqual(scope.get("b").val, [ark.ArkValue(1, "Integer"), ark.ArkValue("a", "String")])
+
+    def test_constant_operands_fold_at_compile_time(self):
+        tree = ark.ARK_PARSER.parse("x := (2 + 3) * 4 == 20 && 0 || \"s\"")
+        code = ark.compile_node(tree.children[0].children[1])
+        self.assertIs(code.constant, ark.TRUE_VALUE)
+        scope = ark.Scope()
+        ark.eval_node(tree, scope)
+        self.assertIs(scope.get("x"), ark.TRUE_VALUE)
+        tree = ark.ARK_PARSER.parse("y := 1 / 0")
+        self.assertFalse(hasattr(ark.compile_node(tree.children[0].children[1]), "constant"))
+        with self.assertRaises(Exception) as ctx:
+            ark.eval_node(tree, ark.Scope())
+        self.assertIn("division", str(ctx.exception))
+
+    def test_if_chains_and_constant_conditions(self):
+        scope = run("""
+func grade(n) {
+    if n > 8 { return 3 } else if n > 4 { return 2 } else if n > 0 { return 1 }
+    return 0
+}
+a := grade(9) * 1000 + grade(5) * 100 + grade(1) * 10 + grade(0)
+if 0 { b := 1 } else if 1 { b := 2 } else { b := 3 }
+if 0 { c := 1 }
+while 0 { d := 1 }
+""")
+        self.assertEqual(scope.get("a").val, 3210)
+        self.assertEqual(scope.get("b").val, 2)
+        self.assertIsNone(scope.get("c"))
+        self.assertIsNone(scope.get("d"))
+
+    def test_method_site_cache_follows_receiver_class(self):
+        scope = run("""
+class A { func who() { return 1 } }
+class B { func who() { return 2 } }
+func f(o) { return o.who() }
+items := [A(), B(), A()]
+total := 0
+i := 0
+while i < 3 {
+    total := total * 10 + f(items[i])
+    i := i + 1
+}
+shadow := A()
+shadow.who := B().who
+r := shadow.who()
+""")
+        self.assertEqual(scope.get("total").val, 121)
+        self.assertEqual(scope.get("r").val, 2)
+
+    def test_namespace_chain_resolves_per_root(self):
+        tree = ark.ARK_PARSER.parse("f := ns.list.append")
+        first = ark.Scope()
+        first.set("ns", ark.ArkValue("sys", "Namespace"))
+        ark.eval_node(tree, first)
+        resolved = first.get("f")
+        self.assertEqual(resolved, ark.ArkValue("sys.list.append", "Intrinsic"))
+        ark.eval_node(tree, first)
+        self.assertIs(first.get("f"), resolved)
+        second = ark.Scope()
+        second.set("ns", ark.ArkValue("lib", "Namespace"))
+        ark.eval_node(tree, second)
+        self.assertEqual(second.get("f"), ark.ArkValue("lib.list.append", "Namespace"))
+        third = ark.Scope()
+        third.set("ns", ark.ArkValue(1, "Integer"))
+        with self.assertRaises(Exception) as ctx:
+            ark.eval_node(tree, third)
+        self.assertIn("Attribute list not found on Integer", str(ctx.exception))
+
+    def test_bare_intrinsic_names(self):
+        scope = run("""
+func size(xs) { return len(xs) }
+func shadow(xs) { return len }
+a := size([1, 2])
+b := size([3])
+len := 5
+c := shadow([])
+""")
+        self.assertEqual((scope.get("a").val, scope.get("b").val), (2, 1))
+        self.assertEqual(scope.get("c").val, 5)
+        tree = ark.ARK_PARSER.parse("f := print")
+        first = ark.Scope()
+        ark.eval_node(tree, first)
+        second = ark.Scope()
+        ark.eval_node(tree, second)
+        self.assertEqual(first.get("f"), ark.ArkValue("print", "Intrinsic"))
+        self.assertIs(first.get("f"), second.get("f"))
+
+    def test_call_site_tracks_linear_intrinsic_per_callee(self):
+        tree = ark.ARK_PARSER.parse("r := f(buf, 0)")
+        scope = ark.Scope()
+        scope.set("buf", ark.ArkValue([ark.ArkValue(7, "Integer")], "List"))
+        scope.set("f", ark.ArkValue("sys.list.get", "Intrinsic"))
+        ark.eval_node(tree, scope)
+        self.assertEqual(scope.get("buf").type, "List")
+        scope.set("buf", ark.ArkValue(bytearray(2), "Buffer"))
+        scope.set("f", ark.ArkValue("sys.mem.read", "Intrinsic"))
+        ark.eval_node(tree, scope)
+        self.assertEqual(scope.vars["buf"].type, "Moved")
+
+    def test_moved_variable_read_by_name_is_rejected(self):
+        scope = ark.Scope()
+        scope.set("sys", ark.ArkValue("sys", "Namespace"))
+        scope.set("buf", ark.ArkValue(bytearray(2), "Buffer"))
+        child = ark.Scope(scope)
+        ark.eval_node(ark.ARK_PARSER.parse("r := sys.mem.read(buf, 0)"), scope)
+        for target in (scope, child):
+            with self.assertRaises(Exception) as ctx:
+                ark.eval_node(ark.ARK_PARSER.parse("x := buf"), target)
+            self.assertIn("moved variable 'buf'", str(ctx.exception))
+
+    def test_comparison_loop_conditions(self):
+        scope = run("""
+i := 0
+n := 3
+a := 0
+while i < n { i := i + 1
+ a := a + 1 }
+b := 0
+while 0 < i { i := i - 1
+ b := b + 1 }
+s := "a"
+c := 0
+while s != "aaa" { s := s + "a"
+ c := c + 1 }
+""")
+        self.assertEqual([scope.get(n).val for n in "abc"], [3, 3, 2])
+        with self.assertRaises(Exception) as ctx:
+            run("s := \"a\"\nwhile s < 3 { s := 1 }")
+        self.assertEqual(ctx.exception.line, 2)
+
+    def test_index_bounds(self):
+        scope = ark.Scope()
+        scope.set("buf", ark.ArkValue(bytearray([7, 255]), "Buffer"))
+        ark.eval_node(ark.ARK_PARSER.parse("""
+l := [1, 2]
+s := "ab"
+n := 0 - 1
+r := [l[1], s[0], buf[1]]
+"""), scope)
+        self.assertEqual([v.val for v in scope.get("r").val], [2, "a", 255])
+        for expr, msg in (("l[2]", "List index out of range: 2"),
+                          ("l[n]", "List index out of range: -1"),
+                          ("s[2]", "String index out of range: 2"),
+                          ("buf[n]", "Buffer index out of range: -1"),
+                          ("n[0]", "Cannot index type Integer")):
+            with self.assertRaises(Exception) as ctx:
+                ark.eval_node(ark.ARK_PARSER.parse("x := " + expr), scope)
+            self.assertIn(msg, str(ctx.exception))
+
+    def test_short_blocks_report_failing_statement(self):
+        for code, line in (("x := 1 / z", 1), ("z := 0\ny := 1 / z", 2)):
+            with self.assertRaises(Exception) as ctx:
+                run(code)
+            self.assertEqual(ctx.exception.line, line)
+
+    def test_vm_eval_shares_the_runtime(self):
+        # sys.vm.eval must run on the same interpreter module: a second copy
+        # would bind its own error class, and errors raised afterwards would
+        # be wrapped again against the whole program.
+        scope = ark.Scope()
+        scope.set("sys", ark.ArkValue("sys", "Namespace"))
+        ark.eval_node(ark.ARK_PARSER.parse('sys.vm.eval("x := 1")'), scope)
+        self.assertEqual(scope.get("x").val, 1)
+        with self.assertRaises(Exception) as ctx:
+            run("z := 0\ny := 1 / z")
+        self.assertEqual(ctx.exception.line, 2)
+        self.assertEqual(str(ctx.exception).count("RuntimeError:"), 1)
+
+    def test_error_reports_call_site(self):
+        with self.assertRaises(Exception) as ctx:
+            run("""
+func boom(n) { return 10 / n }
+boom(0)
+""")
+        self.assertEqual(type(ctx.exception).__name__, "ArkRuntimeError")
+        self.assertIn("boom", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+from ark_ir import ir_of, FuncDef, IfStmt, Call
+
+
+def run(code):
+    scope = ark.Scope()
+    ark.eval_node(ark.ARK_PARSER.parse(code), scope)
+    return scope
+
+
+class TestArkIR(unittest.TestCase):
+    def test_records_are_memoized_on_the_node(self):
+        tree = ark.ARK_PARSER.parse("func f(a, b) { return a }\nif 1 { f(1, 2) } else { f(3, 4) }")
+        fdef, if_node = tree.children
+        rec = ir_of(fdef)
+        self.assertIsInstance(rec, FuncDef)
+        self.assertEqual(rec.params, ("a", "b"))
+        self.assertIs(ir_of(fdef), rec)
+
+        stmt = ir_of(if_node)
+        self.assertIsInstance(stmt, IfStmt)
+        self.assertEqual(len(stmt.branches), 1)
+        self.assertIsNotNone(stmt.else_)
+        call = ir_of(stmt.branches[0][1].children[0])
+        self.assertIsInstance(call, Call)
+        self.assertEqual(len(call.args), 2)
+
+    def test_doc_comment_is_not_the_function_name(self):
+        scope = run("/// Adds one.\nfunc inc(x) { return x + 1 }\nr := inc(1)")
+        self.assertEqual(scope.get("r").val, 2)
+
+    def test_functions_from_one_definition_share_params(self):
+        tree = ark.ARK_PARSER.parse("func f(a, b) { return a }")
+        made = []
+        for _ in range(2):
+            scope = ark.Scope()
+            ark.eval_node(tree, scope)
+            made.append(scope.get("f").val)
+        self.assertIsNot(made[0], made[1])
+        self.assertIs(made[0].params, made[1].params)
+        self.assertEqual(made[0].params, ("a", "b"))
+
+    def test_method_without_params_has_a_body(self):
+        scope = run("class C {\n func one() { return 1 }\n}\nc := C()\nr := c.one()")
+        self.assertEqual(scope.get("r").val, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+from ark_jit import JIT_THRESHOLD
+
+
+def run(code):
+    scope = ark.Scope()
+    ark.eval_node(ark.ARK_PARSER.parse(code), scope)
+    return scope
+
+
+class TestArkJit(unittest.TestCase):
+    def test_hot_recursive_function_is_compiled(self):
+        scope = run("""
+func fib(n) {
+    if n < 2 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+r := fib(15)
+""")
+        self.assertEqual(scope.get("r"), ark.ArkValue(610, "Integer"))
+        self.assertTrue(scope.get("fib").val.jit_code)
+
+    def test_tail_call_and_loop(self):
+        scope = run("""
+func acc(n, total) {
+    if n == 0 { return total }
+    return acc(n - 1, total + n)
+}
+func tri(n) {
+    i := 0
+    s := 0
+    while i <= n {
+        s := s + i
+        i := i + 1
+    }
+    return s
+}
+k := 0
+a := 0
+b := 0
+while k < 150 {
+    a := acc(k, 0)
+    b := tri(k)
+    k := k + 1
+}
+""")
+        self.assertEqual(scope.get("a").val, 149 * 150 // 2)
+        self.assertEqual(scope.get("b").val, 149 * 150 // 2)
+        self.assertTrue(scope.get("acc").val.jit_code)
+        self.assertTrue(scope.get("tri").val.jit_code)
+
+    def test_boolean_result_keeps_type(self):
+        scope = run("""
+func even(n) { return n % 2 == 0 }
+k := 0
+r := 0
+while k < 120 {
+    r := even(k)
+    k := k + 1
+}
+""")
+        self.assertIs(scope.get("r"), ark.FALSE_VALUE)
+        self.assertTrue(scope.get("even").val.jit_code)
+
+    def test_free_integer_variables_are_read_per_call(self):
+        scope = run("""
+M := 7
+func h(n) {
+    if n == 0 { return 1 }
+    return (h(n - 1) * 3) % M
+}
+k := 0
+a := 0
+while k < 120 {
+    a := h(5)
+    k := k + 1
+}
+M := 5
+b := h(5)
+M := "x"
+""")
+        self.assertEqual(scope.get("a").val, 3 ** 5 % 7)
+        self.assertEqual(scope.get("b").val, 3 ** 5 % 5)
+        func = scope.get("h").val
+        self.assertTrue(func.jit_code)
+        # A non-Integer binding hands the call back to the interpreter.
+        self.assertIsNone(func.jit_code([ark.ArkValue(2, "Integer")], 100))
+
+    def test_unsupported_body_stays_interpreted(self):
+        scope = run("""
+func greet(n) { return "hi" }
+k := 0
+while k < 120 {
+    greet(k)
+    k := k + 1
+}
+""")
+        self.assertIs(scope.get("greet").val.jit_code, False)
+
+    def test_runtime_error_falls_back_to_interpreter(self):
+        scope = run("""
+func inv(n) { return 10 / n }
+k := 1
+while k < 120 {
+    inv(k)
+    k := k + 1
+}
+""")
+        func = scope.get("inv").val
+        self.assertGreaterEqual(func.call_count, JIT_THRESHOLD)
+        self.assertTrue(func.jit_code)
+        # The compiled call bails and the interpreter reports the error.
+        with self.assertRaises(Exception) as ctx:
+            ark.call_user_func(func, [ark.ArkValue(0, "Integer")])
+        self.assertEqual(type(ctx.exception).__name__, "ArkRuntimeError")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import hashlib
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+ark_intrinsics = sys.modules.get("meta.ark_intrinsics") or sys.modules["ark_intrinsics"]
+
+
+def strings(values):
+    return ark.ArkValue([ark.ArkValue(v, "String") for v in values], "List")
+
+
+class TestCryptoIntrinsics(unittest.TestCase):
+    def setUp(self):
+        self.keys = [[v.val for v in ark.INTRINSICS["sys.crypto.ed25519.gen"]([]).val]
+                     for _ in range(2)]
+
+    def sign(self, msg, signer):
+        priv = ark.ArkValue(self.keys[signer][0], "String")
+        return ark.INTRINSICS["sys.crypto.ed25519.sign"]([ark.ArkValue(msg, "String"), priv]).val
+
+    def verify_batch(self, msgs, sigs, pubs):
+        return ark.INTRINSICS["sys.crypto.ed25519.verify_batch"](
+            [strings(msgs), strings(sigs), strings(pubs)]).val
+
+    def test_ed25519_verify_batch(self):
+        msgs = ["a", "b", "c"]
+        signers = [0, 1, 0]
+        sigs = [self.sign(m, k) for m, k in zip(msgs, signers)]
+        pubs = [self.keys[k][1] for k in signers]
+        self.assertIs(self.verify_batch(msgs, sigs, pubs), True)
+        self.assertIs(self.verify_batch(msgs, sigs[::-1], pubs), False)
+        self.assertIs(self.verify_batch(msgs, sigs, [pubs[0], "zz", pubs[2]]), False)
+        self.assertIs(self.verify_batch([], [], []), True)
+        with self.assertRaises(Exception):
+            self.verify_batch(msgs, sigs[:2], pubs)
+
+    def test_private_keys_are_not_cached(self):
+        self.sign("a", 0)
+        self.assertFalse(hasattr(ark_intrinsics._ed25519_private_key, "cache_info"))
+
+    def test_aes_gcm_buffers(self):
+        key = ark.ArkValue(bytearray(range(32)), "Buffer")
+        nonce = ark.ArkValue(bytearray(12), "Buffer")
+        aad = ark.ArkValue("hdr", "String")
+        plain = ark.ArkValue(bytearray(b"secret"), "Buffer")
+        ct, tag = ark.INTRINSICS["sys.crypto.aes_gcm_encrypt"]([key, nonce, plain, aad]).val
+        self.assertEqual((ct.type, tag.type), ("Buffer", "Buffer"))
+
+        # Buffer and hex forms interoperate.
+        hex_ct, hex_tag = ark.INTRINSICS["sys.crypto.aes_gcm_encrypt"](
+            [ark.ArkValue(bytes(range(32)).hex(), "String"), nonce,
+             ark.ArkValue("secret", "String"), aad]).val
+        self.assertEqual(hex_ct.val, bytes(ct.val).hex())
+        self.assertEqual(hex_tag.val, bytes(tag.val).hex())
+
+        out = ark.INTRINSICS["sys.crypto.aes_gcm_decrypt"]([key, nonce, ct, tag, aad])
+        self.assertEqual(out.type, "Buffer")
+        self.assertEqual(bytes(out.val), b"secret")
+        out = ark.INTRINSICS["sys.crypto.aes_gcm_decrypt"]([key, nonce, hex_ct, hex_tag, aad])
+        self.assertEqual(out.val, "secret")
+
+    def test_merkle_root(self):
+        merkle_root = ark.INTRINSICS["sys.crypto.merkle_root"]
+        # Interior nodes hash the hex digests of their children; odd levels
+        # duplicate the last node.
+        self.assertEqual(
+            merkle_root([strings(["a", "b", "c"])]).val,
+            "0bdf27bf7ec894ca7cadfe491ec1a3ece840f117989e8c5e9bd7086467bf6c38")
+        self.assertEqual(
+            merkle_root([strings(["a"])]).val,
+            "ca978112ca1bbdcafac231b39a23dc4da786eff8147c4e72b9807785afee48bb")
+        self.assertEqual(merkle_root([strings([])]).val, "")
+
+    def test_random_bytes(self):
+        random_bytes = ark.INTRINSICS["sys.crypto.random_bytes"]
+        small = [random_bytes([ark.ArkValue(16, "Integer")]).val for _ in range(600)]
+        self.assertTrue(all(len(h) == 32 for h in small))
+        self.assertEqual(len(set(small)), len(small))
+        self.assertEqual(len(random_bytes([ark.ArkValue(5000, "Integer")]).val), 10000)
+        self.assertEqual(random_bytes([ark.ArkValue(0, "Integer")]).val, "")
+
+    def test_pbkdf2_validates_arguments(self):
+        pbkdf2 = ark.INTRINSICS["sys.crypto.pbkdf2_hmac_sha512"]
+
+        def call(iterations, dklen):
+            return pbkdf2([ark.ArkValue("pw", "String"), ark.ArkValue("salt", "String"),
+                           ark.ArkValue(iterations, "Integer"), ark.ArkValue(dklen, "Integer")])
+
+        self.assertEqual(call(2, 64).val, hashlib.pbkdf2_hmac("sha512", b"pw", b"salt", 2, 64).hex())
+        for iterations, dklen in [(0, 64), (2, 0), (2, 1025)]:
+            with self.assertRaises(Exception):
+                call(iterations, dklen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import os
+import socket
+import threading
+import unittest
+import urllib.request
+import urllib.error
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark  # noqa: F401  (sets up the module variant used below)
+
+ark_intrinsics = sys.modules.get("meta.ark_intrinsics") or sys.modules["ark_intrinsics"]
+
+
+class TestHTTPReactor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        def dispatch(path, reply):
+            # Reply from another thread, as the Ark runtime thread does.
+            if path == "/boom":
+                threading.Thread(target=reply, args=(500, b"boom")).start()
+            else:
+                threading.Thread(target=reply, args=(200, f"hi {path}".encode())).start()
+
+        cls.reactor = ark_intrinsics.ArkHTTPReactor(0, dispatch)
+        cls.port = cls.reactor.listener.getsockname()[1]
+        threading.Thread(target=cls.reactor.serve_forever, daemon=True).start()
+
+    def get(self, path, method="GET"):
+        req = urllib.request.Request(f"http://127.0.0.1:{self.port}{path}", method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                return resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def test_get_and_errors(self):
+        self.assertEqual(self.get("/x"), (200, b"hi /x"))
+        self.assertEqual(self.get("/boom"), (500, b"boom"))
+        self.assertEqual(self.get("/x", method="POST")[0], 501)
+
+    def test_idle_connections_do_not_block_requests(self):
+        idle = [socket.create_connection(("127.0.0.1", self.port)) for _ in range(40)]
+        try:
+            for s in idle[:20]:
+                s.sendall(b"GET /partial HTTP/1.0\r\n")
+            self.assertEqual(self.get("/after"), (200, b"hi /after"))
+        finally:
+            for s in idle:
+                s.close()
+
+    def test_split_request(self):
+        with socket.create_connection(("127.0.0.1", self.port), timeout=5) as s:
+            s.sendall(b"GET /split HTT")
+            s.sendall(b"P/1.0\r\nHost: x\r\n\r\n")
+            data = b""
+            while chunk := s.recv(4096):
+                data += chunk
+        self.assertTrue(data.startswith(b"HTTP/1.0 200 OK\r\n"))
+        self.assertTrue(data.endswith(b"\r\n\r\nhi /split"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import shutil
+import unittest
+
+# Add repo root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+
+import meta.ark_interpreter as interpreter
+from meta.ark_interpreter import handle_import, Scope, ArkValue, ARK_PARSER, _MODULE_TREES
+
+
+class MockNode:
+    def __init__(self, parts):
+        self.children = [type('Token', (), {'value': p}) for p in parts]
+
+
+class ImportCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = os.path.abspath("test_import_cache_env")
+        os.makedirs(self.test_dir, exist_ok=True)
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.path = os.path.join(self.test_dir, "mod.ark")
+        self.write("x := 1")
+        self.saved_cache_dir = interpreter.TREE_CACHE_DIR
+        interpreter.TREE_CACHE_DIR = os.path.join(self.test_dir, "trees")
+
+    def tearDown(self):
+        interpreter.TREE_CACHE_DIR = self.saved_cache_dir
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.test_dir)
+        _MODULE_TREES.pop(self.path, None)
+
+    def write(self, code, mtime_ns=None):
+        with open(self.path, "w") as f:
+            f.write(code)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def load(self):
+        scope = Scope()
+        handle_import(MockNode(["mod"]), scope)
+        return scope
+
+    def test_unchanged_module_reuses_tree(self):
+        self.assertEqual(self.load().get("x").val, 1)
+        tree = _MODULE_TREES[self.path][1]
+        self.assertEqual(self.load().get("x").val, 1)
+        self.assertIs(_MODULE_TREES[self.path][1], tree)
+
+    def test_module_loads_once_per_root_scope(self):
+        scope = self.load()
+        scope.set("x", ArkValue(2, "Integer"))
+        child = Scope(Scope(scope))
+        handle_import(MockNode(["mod"]), child)
+        self.assertEqual(scope.get("x").val, 2)
+        self.assertIn(self.path, scope.vars["__loaded_imports__"].val)
+        self.assertEqual(self.load().get("x").val, 1)
+
+    def test_modified_module_is_reparsed(self):
+        self.load()
+        stamp = _MODULE_TREES[self.path][0]
+        self.write("x := 2", mtime_ns=stamp + 1_000_000_000)
+        self.assertEqual(self.load().get("x").val, 2)
+
+    def test_tree_is_read_back_from_disk(self):
+        self.load()
+        cached = os.listdir(interpreter.TREE_CACHE_DIR)
+        self.assertEqual(len(cached), 1)
+        # Another process has only the disk cache: a planted tree for the
+        # same source proves the cached copy is used instead of a parse.
+        _MODULE_TREES.pop(self.path)
+        with open(os.path.join(interpreter.TREE_CACHE_DIR, cached[0]), "wb") as f:
+            pickle.dump(ARK_PARSER.parse("x := 5"), f)
+        self.assertEqual(self.load().get("x").val, 5)
+
+    def test_parser_cache_is_private(self):
+        saved_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.test_dir
+        try:
+            path = interpreter._default_parser_cache()
+            cache_dir = os.path.join(self.test_dir, ".ark_cache")
+            self.assertEqual(path, os.path.join(cache_dir, "lark_parser.cache"))
+            self.assertEqual(os.stat(cache_dir).st_mode & 0o777, 0o700)
+            if hasattr(os, "getuid"):
+                os.chmod(cache_dir, 0o777)
+                self.assertIs(interpreter._default_parser_cache(), False)
+        finally:
+            if saved_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = saved_home
+
+
+if __name__ == "__main__":
+    unittest.main()
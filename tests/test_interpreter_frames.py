@@ -0,0 +1,234 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+def run(code):
+    scope = ark.Scope()
+    scope.set("sys", ark.ArkValue("sys", "Namespace"))
+    ark.eval_node(ark.ARK_PARSER.parse(code), scope)
+    return scope
+
+
+class TestInterpreterFrames(unittest.TestCase):
+    def test_closure_survives_frame_reuse(self):
+        # mk's frame is captured by the function sys.vm.eval defines in it,
+        # so later calls must not recycle that frame.
+        scope = run("""
+func mk(a) {
+    return sys.vm.eval("func inner(b) { return a + b }")
+}
+func noise(a) { y := a * 2
+ return y }
+add5 := mk(5)
+noise(1)
+noise(2)
+r := add5(10)
+""")
+        self.assertEqual(scope.get("r").val, 15)
+
+    def test_pooled_frame_starts_empty(self):
+        # A missing argument must not see the previous call's binding.
+        scope = run("""
+x := 100
+func f(x) { return x }
+a := f(1)
+b := f()
+""")
+        self.assertEqual(scope.get("a").val, 1)
+        self.assertEqual(scope.get("b").val, 100)
+
+    def test_while_condition_types(self):
+        scope = run("""
+i := 3
+n := 0
+while i { i := i - 1
+ n := n + 1 }
+""")
+        self.assertEqual(scope.get("n").val, 3)
+
+    def test_bound_method_reused_per_instance(self):
+        scope = run("""
+class Counter {
+    func get(x) { return x + 1 }
+}
+a := Counter()
+b := Counter()
+ma := a.get
+mb := b.get
+r := a.get(1)
+""")
+        self.assertIs(scope.get("ma"), scope.get("a").val.bound["get"])
+        self.assertIsNot(scope.get("ma"), scope.get("mb"))
+        self.assertEqual(scope.get("r").val, 2)
+
+    def test_slot_locals_visible_by_name(self):
+        # Slot-resident locals stay reachable through Scope.get/set, which is
+        # how code run by sys.vm.eval inside the frame sees them.
+        scope = run("""
+func f(a) {
+    b := a + 1
+    sys.vm.eval("b := b * 10")
+    return b
+}
+r := f(4)
+""")
+        self.assertEqual(scope.get("r").val, 50)
+
+    def test_unassigned_local_reads_enclosing_scope(self):
+        scope = run("""
+x := 7
+func f(n) {
+    first := x
+    if n > 0 { x := n }
+    return first + x
+}
+r := f(1)
+""")
+        self.assertEqual(scope.get("r").val, 8)
+        self.assertEqual(scope.get("x").val, 7)
+
+    def test_free_names_resolve_past_the_frame(self):
+        scope = run("""
+x := 1
+func f(dyn) {
+    if dyn { sys.vm.eval("x := 2") }
+    return x
+}
+a := f(0)
+b := f(1)
+x := 3
+c := f(0)
+""")
+        self.assertEqual([scope.get(n).val for n in "abc"], [1, 2, 3])
+        self.assertEqual(scope.get("x").val, 3)
+
+    def test_deep_scope_chain_lookup(self):
+        root = ark.Scope()
+        root.set("x", ark.ArkValue(1, "Integer"))
+        scope = root
+        for _ in range(sys.getrecursionlimit() * 2):
+            scope = ark.Scope(scope)
+        self.assertIs(scope.get("x"), root.vars["x"])
+        self.assertIsNone(scope.get("y"))
+        scope.mark_moved("x")
+        self.assertEqual(root.vars["x"].type, "Moved")
+
+    def test_frame_returns_cleared_to_its_function_pool(self):
+        scope = run("""
+func f(a) { b := a
+ return b }
+r := f(3)
+""")
+        frame = ark.compile_body(scope.get("f").val)
+        self.assertEqual(list(frame.layout), ["this", "a", "b"])
+        self.assertEqual(len(frame.pool), 1)
+        self.assertEqual(frame.pool[0].slots, [None] * frame.size)
+
+    def test_lookup_cache_is_created_on_demand(self):
+        scope = run("""
+g := 5
+func plain(a) { return a }
+func dyn(a) {
+    r := 0
+    sys.vm.eval("r := g + a")
+    return r
+}
+r1 := plain(1)
+r2 := dyn(1)
+""")
+        self.assertEqual(scope.get("r2").val, 6)
+        plain = ark.compile_body(scope.get("plain").val).pool[0]
+        self.assertIsNone(plain._cache)
+        dyn = ark.compile_body(scope.get("dyn").val).pool[0]
+        self.assertEqual(dyn._access_counts, {})
+
+    def test_mutual_tail_calls_run_in_constant_stack(self):
+        scope = run("""
+func is_even(n) { if n == 0 { return 1 }
+ return is_odd(n - 1) }
+func is_odd(n) { if n == 0 { return 0 }
+ return is_even(n - 1) }
+r := is_even(5001)
+""")
+        self.assertEqual(scope.get("r").val, 0)
+        frame = ark.compile_body(scope.get("is_even").val)
+        self.assertIsNone(frame.pool[0].tail)
+
+    def test_tail_call_from_method_drops_instance(self):
+        scope = run("""
+this := 42
+func peek() { return this }
+class C { func go() { return peek() } }
+c := C()
+r := c.go()
+""")
+        self.assertEqual(scope.get("r").val, 42)
+
+    def test_method_call_in_return_position(self):
+        scope = run("""
+class C {
+    func get(x) { return x + 1 }
+    func via(x) { return this.get(x) }
+}
+c := C()
+r := c.via(1)
+""")
+        self.assertEqual(scope.get("r").val, 2)
+        via = scope.get("C").val.methods["via"]
+        self.assertIsNone(ark.compile_body(via).pool[0].result)
+
+    def test_duplicate_and_missing_parameters(self):
+        scope = run("""
+func two(a, a) { return a }
+func three(p, q, r) { return p }
+r1 := two(1, 2)
+r2 := three(9)
+""")
+        self.assertEqual(scope.get("r1").val, 2)
+        self.assertEqual(scope.get("r2").val, 9)
+
+    def test_return_from_nested_loop_stops_body(self):
+        scope = run("""
+log := []
+func find(n) {
+    i := 0
+    while 1 {
+        if i == n { return i * 10 }
+        i := i + 1
+    }
+    sys.list.append(log, n)
+}
+r := find(4)
+""")
+        self.assertEqual(scope.get("r").val, 40)
+        self.assertEqual(scope.get("log").val, [])
+        frame = ark.compile_body(scope.get("find").val)
+        self.assertIsNone(frame.pool[0].result)
+
+    def test_destructure_and_attribute_stores_in_functions(self):
+        scope = run("""
+func swap(pair) {
+    let (a, b) := pair
+    p := {x: a}
+    p.y := b
+    return [p.y, p.x]
+}
+r := swap([1, 2])
+""")
+        self.assertEqual([v.val for v in scope.get("r").val], [2, 1])
+        self.assertIsNone(scope.get("a"))
+        with self.assertRaises(Exception) as ctx:
+            run("n := 1\nn.x := 2")
+        self.assertIn("Cannot set attribute on Integer", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
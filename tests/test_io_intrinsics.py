@@ -0,0 +1,87 @@
+import sys
+import os
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+class TestIOIntrinsics(unittest.TestCase):
+    def setUp(self):
+        sec_mod = sys.modules.get("meta.ark_security") or sys.modules.get("ark_security")
+        self._sec_mod = sec_mod
+        self._original_caps_dict = dict(sec_mod.CAPABILITIES)
+        sec_mod.CAPABILITIES["fs_read"] = None
+
+    def tearDown(self):
+        self._sec_mod.CAPABILITIES.clear()
+        self._sec_mod.CAPABILITIES.update(self._original_caps_dict)
+
+    def poll(self, count):
+        events = []
+        deadline = time.monotonic() + 5
+        while len(events) < count and time.monotonic() < deadline:
+            ev = ark.INTRINSICS["sys.event.poll"]([])
+            if ev.type == "Unit":
+                time.sleep(0.01)
+            else:
+                events.append(ev.val)
+        return events
+
+    def test_read_file_async_reuses_workers(self):
+        path = os.path.join(os.path.dirname(current_dir), "README.md")
+        with open(path) as f:
+            expected = f.read()
+        callback = ark.ArkValue("on_done", "String")
+        for _ in range(40):
+            ark.INTRINSICS["sys.io.read_file_async"]([ark.ArkValue(path, "String"), callback])
+        events = self.poll(40)
+        self.assertEqual(len(events), 40)
+        self.assertTrue(all(cb is callback and args.val[0].val == expected for cb, args in events))
+        workers = [t for t in threading.enumerate() if t.name.startswith("ark-async")]
+        self.assertTrue(0 < len(workers) <= max(4, (os.cpu_count() or 1) * 2))
+        self.assertTrue(all(t.daemon for t in workers))
+
+    def test_read_headers(self):
+        stdin = io.TextIOWrapper(io.BytesIO(
+            b"Content-Length: 12\r\nContent-Type: application/json\r\n\r\n"
+            b"{\"id\": 1234}"
+            b"content-length:3\n\nabc"
+            b"X-Partial: 1\r\n"))
+        read_headers = ark.INTRINSICS["sys.io.read_headers"]
+        read_bytes = ark.INTRINSICS["sys.io.read_bytes"]
+        with patch.object(sys, "stdin", stdin):
+            first = read_headers([]).val.fields
+            self.assertEqual({k: v.val for k, v in first.items()},
+                             {"content-length": "12", "content-type": "application/json"})
+            self.assertEqual(read_bytes([ark.ArkValue(12, "Integer")]).val, '{"id": 1234}')
+            self.assertEqual(read_headers([]).val.fields["content-length"].val, "3")
+            self.assertEqual(read_bytes([ark.ArkValue(3, "Integer")]).val, "abc")
+            self.assertIs(read_headers([]).val, False)
+
+    def test_write_buffers_until_flush(self):
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(io.BufferedWriter(raw))
+        write = ark.INTRINSICS["sys.io.write"]
+        with patch.object(sys, "stdout", stdout):
+            write([ark.ArkValue("héllo\n", "String")])
+            self.assertEqual(raw.getvalue(), b"")
+            ark.INTRINSICS["sys.io.flush"]([])
+            self.assertEqual(raw.getvalue(), "héllo\n".encode())
+            stdout.reconfigure(line_buffering=True)
+            write([ark.ArkValue("a", "String")])
+            self.assertEqual(raw.getvalue(), "héllo\n".encode())
+            write([ark.ArkValue("b\n", "String")])
+            self.assertEqual(raw.getvalue(), "héllo\nab\n".encode())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+ark_intrinsics = sys.modules.get("meta.ark_intrinsics") or sys.modules["ark_intrinsics"]
+
+
+def parse(text):
+    return ark.INTRINSICS["sys.json.parse"]([ark.ArkValue(text, "String")])
+
+
+class TestJsonIntrinsics(unittest.TestCase):
+    def test_parse_nested(self):
+        v = parse('{"a": [1, "x", null, true], "b": {"c": 2.9}}')
+        fields = v.val.fields
+        self.assertEqual([(x.type, x.val) for x in fields["a"].val],
+                         [("Integer", 1), ("String", "x"), ("Unit", None), ("Boolean", True)])
+        self.assertEqual(fields["b"].val.fields["c"].val, 2)
+
+    def test_parse_shares_small_values(self):
+        v = parse("[1, 1, 300, 300, true, null]").val
+        self.assertIs(v[0], v[1])
+        self.assertIsNot(v[2], v[3])
+        self.assertIs(v[4], ark.TRUE_VALUE)
+        self.assertIs(v[5], ark.UNIT_VALUE)
+
+    def test_parse_keeps_wide_integers(self):
+        big = 123456789012345678901234567890
+        self.assertEqual(parse(str(big)).val, big)
+        self.assertEqual(parse(f'["id", {-big}]').val[1].val, -big)
+
+    def test_parse_keeps_19_digit_integers(self):
+        v = parse("[-9999999999999999999, -9223372036854775809]").val
+        self.assertEqual([x.val for x in v], [-9999999999999999999, -9223372036854775809])
+        self.assertTrue(all(x.type == "Integer" and type(x.val) is int for x in v))
+
+    def test_convert_deeply_nested(self):
+        deep = 7
+        for _ in range(5000):
+            deep = [deep]
+        v = ark_intrinsics.from_python_val(deep)
+        for _ in range(5000):
+            self.assertEqual(v.type, "List")
+            v = v.val[0]
+        self.assertEqual(v.val, 7)
+
+    def test_self_containing_value(self):
+        loop = []
+        loop.append(loop)
+        with self.assertRaises(Exception) as ctx:
+            ark_intrinsics.from_python_val(loop)
+        self.assertIn("nested too deeply", str(ctx.exception))
+
+    def test_parse_error(self):
+        with self.assertRaises(Exception) as ctx:
+            parse("[1,")
+        self.assertIn("JSON Parse Error", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+def buffer(data):
+    return ark.ArkValue(bytearray(data), "Buffer")
+
+
+class TestMemIntrinsics(unittest.TestCase):
+    def test_write_bulk(self):
+        write_bulk = ark.INTRINSICS["sys.mem.write_bulk"]
+        buf = buffer(5)
+        out = write_bulk([buf, ark.ArkValue(1, "Integer"), buffer(b"\x07\x08\x09")])
+        self.assertEqual(out.type, "Buffer")
+        self.assertIs(out.val, buf.val)
+        self.assertEqual(bytes(out.val), b"\x00\x07\x08\x09\x00")
+
+    def test_write_bulk_rejects_overflow(self):
+        write_bulk = ark.INTRINSICS["sys.mem.write_bulk"]
+        buf = buffer(4)
+        for offset in (2, -1):
+            with self.assertRaises(Exception):
+                write_bulk([buf, ark.ArkValue(offset, "Integer"), buffer(b"abc")])
+        self.assertEqual(len(buf.val), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b"", location=None):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address)
+        if self.path == "/redirect":
+            self._reply(302, location="/echo")
+        elif self.path == "/loop":
+            self._reply(302, location="/loop")
+        elif self.path == "/missing":
+            self._reply(404, b"nope")
+        else:
+            self._reply(200, f"GET {self.path}".encode())
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path == "/redirect":
+            self._reply(303, location="/echo")
+        else:
+            self._reply(200, b"POST " + body)
+
+
+class TestNetHttpRequest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.peers = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        # Loopback URLs need the 'net' capability; see test_net_broadcast_fix.
+        sec_mod = sys.modules.get("meta.ark_security") or sys.modules.get("ark_security")
+        self._sec_mod = sec_mod
+        self._original_caps_dict = dict(sec_mod.CAPABILITIES)
+        sec_mod.CAPABILITIES["net"] = None
+        self.server.peers.clear()
+
+    def tearDown(self):
+        self._sec_mod.CAPABILITIES.clear()
+        self._sec_mod.CAPABILITIES.update(self._original_caps_dict)
+
+    def request(self, method, path, *body):
+        args = [ark.ArkValue(method, "String"), ark.ArkValue(self.base + path, "String")]
+        args += [ark.ArkValue(b, "String") for b in body]
+        return [v.val for v in ark.INTRINSICS["sys.net.http.request"](args).val]
+
+    def test_reuses_connection(self):
+        self.assertEqual(self.request("GET", "/a"), [200, "GET /a"])
+        self.assertEqual(self.request("GET", "/b"), [200, "GET /b"])
+        self.assertEqual(self.server.peers[0], self.server.peers[1])
+
+    def test_status_and_redirects(self):
+        self.assertEqual(self.request("GET", "/missing"), [404, "nope"])
+        self.assertEqual(self.request("GET", "/redirect"), [200, "GET /echo"])
+        self.assertEqual(self.request("POST", "/echo", "x=1"), [200, "POST x=1"])
+        self.assertEqual(self.request("POST", "/redirect", "x=1"), [200, "GET /echo"])
+
+    def test_too_many_redirects(self):
+        with self.assertRaises(Exception) as ctx:
+            self.request("GET", "/loop")
+        self.assertIn("too many redirects", str(ctx.exception))
+
+    def test_honours_proxy_environment(self):
+        proxy = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        proxy.peers = []
+        threading.Thread(target=proxy.serve_forever, daemon=True).start()
+        env = {k: v for k, v in os.environ.items() if "proxy" not in k.lower()}
+        env["HTTP_PROXY"] = f"http://127.0.0.1:{proxy.server_address[1]}"
+        try:
+            with patch.dict(os.environ, env, clear=True):
+                self.assertEqual(self.request("GET", "/a"), [200, f"GET {self.base}/a"])
+                with patch.dict(os.environ, {"NO_PROXY": "127.0.0.1"}):
+                    self.assertEqual(self.request("GET", "/b"), [200, "GET /b"])
+        finally:
+            proxy.shutdown()
+            proxy.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import os
+import socket
+import threading
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+# ark loads "meta.ark_intrinsics" when run from the repo root; use whichever
+# module variant actually holds the socket table.
+ark_intrinsics = sys.modules.get("meta.ark_intrinsics") or sys.modules["ark_intrinsics"]
+
+
+class TestNetSocketIO(unittest.TestCase):
+    def setUp(self):
+        self.local, self.remote = socket.socketpair()
+        self.handle = max(ark_intrinsics.SOCKETS, default=0) + 1000
+        ark_intrinsics.SOCKETS[self.handle] = self.local
+
+    def tearDown(self):
+        ark_intrinsics.SOCKETS.pop(self.handle, None)
+        self.local.close()
+        self.remote.close()
+
+    def recv(self, size, *flags):
+        args = [ark.ArkValue(self.handle, "Integer"), ark.ArkValue(size, "Integer")]
+        args += [ark.ArkValue(f, "Boolean") for f in flags]
+        return ark.INTRINSICS["sys.net.socket.recv"](args)
+
+    def test_recv_string_and_binary(self):
+        self.remote.sendall("héllo".encode("utf-8"))
+        self.assertEqual(self.recv(1024).val, "héllo")
+        self.remote.sendall(b"\xff\x00ab")
+        out = self.recv(1024, True)
+        self.assertEqual((out.type, bytes(out.val)), ("Buffer", b"\xff\x00ab"))
+
+    def test_recv_larger_than_buffer(self):
+        self.remote.sendall(b"xyz")
+        self.assertEqual(self.recv(ark_intrinsics.SOCKET_RECV_BUFFER_SIZE * 2).val, "xyz")
+        self.remote.close()
+        self.assertEqual(self.recv(16).val, "")
+
+    def test_recv_zero_leaves_stream_alone(self):
+        self.remote.sendall(b"hello")
+        self.assertEqual(self.recv(0).val, "")
+        out = self.recv(0, True)
+        self.assertEqual((out.type, bytes(out.val)), ("Buffer", b""))
+        self.assertEqual(self.recv(1024).val, "hello")
+
+    def test_send_list_in_one_call(self):
+        self.local.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        parts = [f"{i:04d}," for i in range(3000)]
+        expected = "".join(parts).encode("utf-8") + b"tail"
+        items = [ark.ArkValue(p, "String") for p in parts]
+        items.append(ark.ArkValue(bytearray(b"tail"), "Buffer"))
+        received = bytearray()
+        reader = threading.Thread(target=self._drain, args=(received, len(expected)))
+        reader.start()
+        out = ark.INTRINSICS["sys.net.socket.send"](
+            [ark.ArkValue(self.handle, "Integer"), ark.ArkValue(items, "List")])
+        reader.join(5)
+        self.assertIs(out.val, True)
+        self.assertEqual(bytes(received), expected)
+
+    def test_accept_batch_drains_backlog(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        ark_intrinsics.SOCKETS[self.handle + 1] = listener
+        clients = [socket.create_connection(listener.getsockname()) for _ in range(3)]
+        accept_batch = ark.INTRINSICS["sys.net.socket.accept_batch"]
+        server = ark.ArkValue(self.handle + 1, "Integer")
+        try:
+            self.assertEqual(accept_batch([server, ark.ArkValue(0, "Integer")]).val, [])
+            first = accept_batch([server, ark.ArkValue(1, "Integer")]).val
+            rest = accept_batch([server, ark.ArkValue(10, "Integer")]).val
+            self.assertEqual((len(first), len(rest)), (1, 2))
+            self.assertEqual(rest[0].val[1].val, "127.0.0.1")
+            self.assertTrue(listener.getblocking())
+            conns = [ark_intrinsics.SOCKETS.pop(c.val[0].val) for c in first + rest]
+            self.assertTrue(all(c.getblocking() for c in conns))
+            listener.settimeout(0.05)
+            self.assertEqual(accept_batch([server]).val, [])
+            self.assertEqual(listener.gettimeout(), 0.05)
+            for c in conns:
+                c.close()
+        finally:
+            ark_intrinsics.SOCKETS.pop(self.handle + 1, None)
+            listener.close()
+            for c in clients:
+                c.close()
+
+    @unittest.skipUnless(hasattr(os, "dup2"), "needs os.dup2")
+    def test_accept_batch_with_high_fd(self):
+        try:
+            import resource
+            if resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= 1100:
+                self.skipTest("fd limit too low")
+        except ImportError:
+            self.skipTest("needs resource")
+        server = socket.create_server(("127.0.0.1", 0))
+        listener = socket.socket(fileno=os.dup2(server.fileno(), 1100))
+        server.close()
+        ark_intrinsics.SOCKETS[self.handle + 1] = listener
+        clients = [socket.create_connection(listener.getsockname()) for _ in range(3)]
+        try:
+            out = ark.INTRINSICS["sys.net.socket.accept_batch"](
+                [ark.ArkValue(self.handle + 1, "Integer")]).val
+            self.assertEqual(len(out), 3)
+            for c in out:
+                ark_intrinsics.SOCKETS.pop(c.val[0].val).close()
+        finally:
+            ark_intrinsics.SOCKETS.pop(self.handle + 1, None)
+            listener.close()
+            for c in clients:
+                c.close()
+
+    def _drain(self, received, total):
+        while len(received) < total:
+            chunk = self.remote.recv(1000)
+            if not chunk:
+                break
+            received += chunk
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import hashlib
+
+import ark
+from ark_types import RopeString, ROPE_LEAF_SIZE
+
+
+class TestRopeString(unittest.TestCase):
+    def test_small_appends_merge_into_leaves(self):
+        r = RopeString("")
+        for _ in range(ROPE_LEAF_SIZE * 4):
+            r = r + "x"
+        self.assertEqual(len(r), ROPE_LEAF_SIZE * 4)
+        depth = 0
+        node = r
+        while node.val is None:
+            node = node.left
+            depth += 1
+        self.assertLess(depth, 8)
+        self.assertEqual(str(r), "x" * (ROPE_LEAF_SIZE * 4))
+
+    def test_flatten_collapses_to_leaf(self):
+        r = RopeString("a" * 100) + ("b" * 100)
+        self.assertIsNone(r.val)
+        flat = str(r)
+        self.assertEqual(r.val, flat)
+        self.assertIsNone(r.left)
+        self.assertEqual(str(r + "c"), flat + "c")
+
+    def test_indexing_matches_flat_string(self):
+        r = RopeString("")
+        ref = ""
+        for i in range(300):
+            piece = str(i) * (1 + i % 90)
+            if i % 7 == 0:
+                r = piece + r
+                ref = piece + ref
+            else:
+                r = r + piece
+                ref = ref + piece
+        for i in (0, 1, len(ref) // 2, len(ref) - 1, -1):
+            self.assertEqual(r[i], ref[i])
+        self.assertEqual(r[3:9], ref[3:9])
+        self.assertEqual(str(r), ref)
+
+    def test_chunks_read_leaves_without_flattening(self):
+        # The interpreter's RopeString: this module's import is a separate copy.
+        Rope = ark.RopeString
+        pieces = [("ab\u20ac" * 40)[i:] for i in range(100)]
+        r = Rope(pieces[0])
+        for piece in pieces[1:]:
+            r = Rope(left=r, right=Rope(piece))
+        ref = "".join(pieces)
+        # Hash before anything flattens the rope, so the leaves are what's read.
+        digest = ark.INTRINSICS["sys.crypto.hash"]([ark.ArkValue(r, "String")]).val
+        self.assertIsNone(r.val)
+        self.assertEqual("".join(r.chunks()), ref)
+        self.assertIsNone(r.val)
+        self.assertEqual(digest, hashlib.sha256(ref.encode("utf-8")).hexdigest())
+
+        big = "\u00e9" * 100000
+        digest = ark.INTRINSICS["sys.crypto.hash"]([ark.ArkValue(big, "String")]).val
+        self.assertEqual(digest, hashlib.sha256(big.encode("utf-8")).hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import os
+import unittest
+
+# Add meta directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+meta_dir = os.path.join(os.path.dirname(current_dir), 'meta')
+sys.path.append(meta_dir)
+
+import ark
+
+
+def tensor(data, shape):
+    return ark.INTRINSICS["math.Tensor"]([
+        ark.ArkValue([ark.ArkValue(v, "Integer") for v in data], "List"),
+        ark.ArkValue([ark.ArkValue(s, "Integer") for s in shape], "List"),
+    ])
+
+
+def unpack(t):
+    fields = t.val.fields
+    return [v.val for v in fields["data"].val], [v.val for v in fields["shape"].val]
+
+
+class TestTensorMath(unittest.TestCase):
+    def test_tensor_shares_integer_elements(self):
+        src = [ark.ArkValue(1000, "Integer"), ark.ArkValue(2, "Integer")]
+        t = ark.INTRINSICS["math.Tensor"]([
+            ark.ArkValue(src, "List"),
+            ark.ArkValue([ark.ArkValue(2, "Integer")], "List"),
+        ])
+        self.assertIs(t.val.fields["data"].val[0], src[0])
+        self.assertEqual(unpack(t), ([1000, 2], [2]))
+
+    def test_matmul(self):
+        a = tensor([1, 2, 3, 4, 5, 6], [2, 3])
+        b = tensor([7, 8, 9, 10, 11, 12], [3, 2])
+        c = ark.INTRINSICS["math.matmul"]([a, b])
+        self.assertEqual(unpack(c), ([58, 64, 139, 154], [2, 2]))
+
+    def test_matmul_keeps_big_integers(self):
+        big = 2 ** 70
+        a = tensor([big, 1], [1, 2])
+        b = tensor([big, 3], [2, 1])
+        c = ark.INTRINSICS["math.matmul"]([a, b])
+        self.assertEqual(unpack(c), ([big * big + 3], [1, 1]))
+
+    def test_matmul_small_and_large_shapes_agree(self):
+        # 8x9 @ 9x8 takes the generic path, 8x8 @ 8x8 an unrolled kernel.
+        a_data = [(i * 7) % 11 - 5 for i in range(72)]
+        b_data = [(i * 5) % 13 - 6 for i in range(72)]
+        expected = [sum(a_data[i * 9 + p] * b_data[p * 8 + j] for p in range(9))
+                    for i in range(8) for j in range(8)]
+        c = ark.INTRINSICS["math.matmul"]([tensor(a_data, [8, 9]), tensor(b_data, [9, 8])])
+        self.assertEqual(unpack(c), (expected, [8, 8]))
+        a8 = [a_data[i * 9 + p] for i in range(8) for p in range(8)]
+        b8 = b_data[:64]
+        expected8 = [sum(a8[i * 8 + p] * b8[p * 8 + j] for p in range(8))
+                     for i in range(8) for j in range(8)]
+        for _ in range(2):
+            c = ark.INTRINSICS["math.matmul"]([tensor(a8, [8, 8]), tensor(b8, [8, 8])])
+            self.assertEqual(unpack(c), (expected8, [8, 8]))
+
+    def test_transpose(self):
+        t = tensor([1, 2, 3, 4, 5, 600], [2, 3])
+        r = ark.INTRINSICS["math.transpose"]([t])
+        self.assertEqual(unpack(r), ([1, 4, 2, 5, 3, 600], [3, 2]))
+        self.assertIs(r.val.fields["data"].val[5], t.val.fields["data"].val[5])
+        with self.assertRaises(Exception):
+            ark.INTRINSICS["math.transpose"]([tensor([1, 2], [2, 2])])
+
+    def test_elementwise_ops(self):
+        a = tensor([1, 2, 300, 4], [2, 2])
+        b = tensor([1, 1, 1, 5], [2, 2])
+        self.assertEqual(unpack(ark.INTRINSICS["math.add"]([a, b])), ([2, 3, 301, 9], [2, 2]))
+        self.assertEqual(unpack(ark.INTRINSICS["math.sub"]([a, b])), ([0, 1, 299, -1], [2, 2]))
+        scaled = ark.INTRINSICS["math.mul_scalar"]([a, ark.ArkValue(-2, "Integer")])
+        self.assertEqual(unpack(scaled), ([-2, -4, -600, -8], [2, 2]))
+        self.assertEqual(ark.INTRINSICS["math.dot"]([a, b]).val, 323)
+        self.assertTrue(all(v.type == "Integer" for v in scaled.val.fields["data"].val))
+        with self.assertRaises(Exception) as ctx:
+            ark.INTRINSICS["math.add"]([a, tensor([1, 2], [1, 2])])
+        self.assertIn("shape mismatch", str(ctx.exception))
+
+    def test_matmul_shape_mismatch(self):
+        a = tensor([1, 2], [1, 2])
+        with self.assertRaises(Exception) as ctx:
+            ark.INTRINSICS["math.matmul"]([a, a])
+        self.assertIn("dimension mismatch", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()